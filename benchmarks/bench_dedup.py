@@ -0,0 +1,103 @@
+"""
+Benchmark backend deduplikasi (`utils.dedup`): memori dan throughput.
+
+Key dibuat di dalam loop seperti di `transform_data`, sehingga tuple yang
+ditahan oleh `set` ikut terukur, sedangkan backend fingerprint membuangnya.
+Memori diukur dengan tracemalloc pada run terpisah; untuk backend `disk`
+tabelnya berada di file index (mmap tidak terlihat oleh tracemalloc) sehingga
+ukuran file dilaporkan tersendiri. Sekitar 10% key adalah duplikat.
+
+    python -m benchmarks.bench_dedup --keys 1000000 10000000
+"""
+import argparse
+import gc
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from utils.dedup import DEDUP_BACKENDS, close_dedup, make_dedup
+
+
+def make_columns(count: int, seed: int = 0):
+    """Kolom key dengan sekitar 10% baris yang mengulang baris sebelumnya."""
+    rng = random.Random(seed)
+    rows = []
+    for index in range(count):
+        if index and rng.random() < 0.1:
+            rows.append(rows[rng.randrange(index)])
+        else:
+            rows.append((
+                f"T-shirt {index}",
+                float(rng.randrange(5, 500) * 16000),
+                round(rng.uniform(1, 5), 1),
+                rng.randint(1, 8),
+                rng.choice(["S", "M", "L", "XL", "XXL"]),
+                rng.choice(["Men", "Women", "Unisex"]),
+            ))
+    return [list(column) for column in zip(*rows)]
+
+
+def dedup(backend: str, columns, path: str):
+    seen = make_dedup(backend, capacity=len(columns[0]), path=path)
+    kept = 0
+    for key in zip(*columns):
+        if key in seen:
+            continue
+        seen.add(key)
+        kept += 1
+    return seen, kept
+
+
+def run_backend(backend: str, columns, directory: str):
+    """(key unik, detik, puncak memori, ukuran file, positif palsu yang tertangkap verifikasi)."""
+    path = os.path.join(directory, f"{backend}.idx")
+
+    gc.collect()
+    started = time.perf_counter()
+    seen, kept = dedup(backend, columns, path)
+    elapsed = time.perf_counter() - started
+    false_positives = getattr(seen, "false_positives", 0)
+    close_dedup(seen)
+    del seen
+    disk = 0
+    if os.path.exists(path):
+        disk = os.path.getsize(path)
+        os.remove(path)
+
+    # Memori diukur pada run terpisah karena tracemalloc memperlambat alokasi.
+    gc.collect()
+    tracemalloc.start()
+    seen, _ = dedup(backend, columns, path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    close_dedup(seen)
+    return kept, elapsed, peak, disk, false_positives
+
+
+def run(sizes, backends) -> None:
+    for size in sizes:
+        columns = make_columns(size)
+        reference = None
+        with tempfile.TemporaryDirectory() as directory:
+            for backend in backends:
+                kept, elapsed, peak, disk, false_positives = run_backend(backend, columns, directory)
+                reference = reference if reference is not None else kept
+                print(
+                    f"keys={size:<9} {backend:<13} {size / elapsed:>10,.0f} key/detik  "
+                    f"memori={peak / 1024 / 1024:8.1f}MB  disk={disk / 1024 / 1024:7.1f}MB  "
+                    f"unik={kept} (selisih {kept - reference:+d}, verifikasi positif palsu {false_positives})"
+                )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keys", type=int, nargs="+", default=[1_000_000])
+    parser.add_argument("--backends", nargs="+", default=list(DEDUP_BACKENDS), choices=list(DEDUP_BACKENDS))
+    args = parser.parse_args()
+    run(args.keys, args.backends)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark scraping terdistribusi (`utils.distributed`): throughput terhadap jumlah worker.
+
+Server lokal menunda setiap halaman `--latency` detik sehingga scraping
+network-bound seperti situs aslinya. Worker `process` memakai antrean SQLite di
+file (seperti worker di node lain, termasuk biaya spawn proses); `thread`
+memakai antrean `:memory:`. Rate limit dimatikan agar yang terukur adalah
+kapasitas antrean dan worker.
+
+    python -m benchmarks.bench_distributed --pages 400 --workers 1 2 4 8 --latency 0.05
+"""
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+from unittest.mock import patch
+
+from benchmarks.mock_server import MockFashionServer
+from utils.distributed import extract_distributed
+
+
+def run_once(pages: int, workers: int, mode: str, directory: str) -> float:
+    path = os.path.join(directory, f"queue-{workers}.db") if mode == "process" else None
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        products = extract_distributed(1, pages, workers=workers, path=path, rate_limit=None, poll_interval=0.1)
+    elapsed = time.perf_counter() - started
+    if not products:
+        raise RuntimeError("Tidak ada produk yang di-scrape")
+    return elapsed
+
+
+def run(pages: int, worker_counts, modes, latency: float) -> None:
+    with MockFashionServer(total_pages=pages, latency=latency) as server, \
+            patch("utils.extract.BASE_URL", server.base_url), \
+            tempfile.TemporaryDirectory() as directory:
+        for mode in modes:
+            baseline = None
+            for workers in worker_counts:
+                elapsed = run_once(pages, workers, mode, directory)
+                baseline = baseline or elapsed
+                print(
+                    f"{mode:<8} workers={workers:<3} {pages / elapsed:8.1f} halaman/detik  "
+                    f"{elapsed:6.2f} detik  speedup={baseline / elapsed:5.2f}x"
+                )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=400)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--modes", nargs="+", default=["thread", "process"], choices=["thread", "process"])
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+    run(args.pages, args.workers, args.modes, args.latency)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""
+Benchmark ETL end-to-end (extract, transform, load) terhadap server lokal.
+
+Setiap skala dijalankan di proses terpisah agar peak RSS terukur per skala.
+Hasil dibandingkan dengan baseline yang tersimpan; metrik yang memburuk lebih
+dari `--tolerance` dilaporkan sebagai regresi dan exit code menjadi 1.
+
+    python -m benchmarks.bench_etl --pages 50 500 5000 --save-baseline benchmarks/baseline.json
+    python -m benchmarks.bench_etl --pages 50 500 5000 --baseline benchmarks/baseline.json
+    python -m benchmarks.bench_etl --pages 50 --latency 0.05 --jitter 0.02 --error-rate 0.01
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+from unittest.mock import patch
+
+from benchmarks.mock_server import MockFashionServer, load_corpus
+
+# True jika nilai lebih besar lebih baik.
+HIGHER_IS_BETTER = {
+    "pages_per_second": True,
+    "rows_per_second": True,
+    "page_latency_p50": False,
+    "page_latency_p99": False,
+    "parse_card_us": False,
+    "transform_rows_per_second": True,
+    "peak_rss_mb": False,
+}
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Persentil dengan interpolasi linear; 0 untuk data kosong."""
+    if not values:
+        return 0.0
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=1000, method="inclusive")[int(fraction * 1000) - 1]
+
+
+def run_scale(args: argparse.Namespace, pages: int) -> Dict[str, float]:
+    """Menjalankan satu skala di proses ini dan mengembalikan hasil pengukuran."""
+    from utils.extract import extract_data
+    from utils.load import load_to_csv, load_to_parquet
+    from utils.metrics import disable_metrics, enable_metrics
+    from utils.transform import transform_data
+
+    corpus = load_corpus(args.corpus) if args.corpus else None
+    server = MockFashionServer(
+        total_pages=pages,
+        products_per_page=args.products_per_page,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        corpus=corpus,
+    )
+    metrics = enable_metrics()
+    with server, tempfile.TemporaryDirectory() as tmpdir, contextlib.redirect_stdout(io.StringIO()):
+        with patch("utils.extract.BASE_URL", server.base_url):
+            started = time.perf_counter()
+            raw_data = extract_data(1, pages, max_workers=args.workers, rate_limit=None, empty_page_limit=0)
+            extract_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        cleaned_data = transform_data(raw_data)
+        transform_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        load_to_csv(cleaned_data, os.path.join(tmpdir, "products.csv"))
+        load_to_parquet(cleaned_data, os.path.join(tmpdir, "parquet"))
+        load_seconds = time.perf_counter() - started
+    disable_metrics()
+
+    report = metrics.report()
+    latencies = sorted(page["fetch_seconds"] for page in report["pages"].values() if "fetch_seconds" in page)
+    card = report["summaries"].get("parse_card_seconds", {"mean": 0.0})
+    total_seconds = extract_seconds + transform_seconds + load_seconds
+    return {
+        "pages": pages,
+        "products": len(raw_data),
+        "rows": len(cleaned_data),
+        "server_errors": server.error_count,
+        "extract_seconds": extract_seconds,
+        "transform_seconds": transform_seconds,
+        "load_seconds": load_seconds,
+        "pages_per_second": pages / extract_seconds,
+        "rows_per_second": len(cleaned_data) / total_seconds,
+        "page_latency_p50": percentile(latencies, 0.50),
+        "page_latency_p99": percentile(latencies, 0.99),
+        "parse_card_us": card["mean"] * 1e6,
+        "transform_rows_per_second": len(raw_data) / transform_seconds if transform_seconds else 0.0,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def run_isolated(argv: List[str], pages: int) -> Dict[str, float]:
+    """Menjalankan satu skala di subprocess agar peak RSS tidak tercampur antar skala."""
+    command = [sys.executable, "-m", "benchmarks.bench_etl", *argv, "--single", str(pages)]
+    output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], tolerance: float) -> List[str]:
+    """Daftar regresi: metrik yang memburuk lebih dari `tolerance` dibanding baseline."""
+    regressions = []
+    for scale, result in results.items():
+        reference = baseline.get(scale)
+        if reference is None:
+            continue
+        for metric, higher_is_better in HIGHER_IS_BETTER.items():
+            old, new = reference.get(metric), result.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            worse = -change if higher_is_better else change
+            if worse > tolerance:
+                regressions.append(f"pages={scale} {metric}: {old:.4g} -> {new:.4g} ({change:+.1%})")
+    return regressions
+
+
+def print_result(result: Dict[str, float]) -> None:
+    print(
+        f"pages={result['pages']:<6} rows={result['rows']:<7} "
+        f"halaman/detik={result['pages_per_second']:<8.1f} baris/detik={result['rows_per_second']:<9.0f} "
+        f"p50={result['page_latency_p50'] * 1000:.1f}ms p99={result['page_latency_p99'] * 1000:.1f}ms "
+        f"parse_card={result['parse_card_us']:.0f}us peak_rss={result['peak_rss_mb']:.0f}MB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, nargs="+", default=[50, 500, 5000])
+    parser.add_argument("--products-per-page", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--corpus", help="direktori hasil record_corpus; default halaman sintetis")
+    parser.add_argument("--baseline", help="file JSON baseline untuk perbandingan")
+    parser.add_argument("--save-baseline", help="simpan hasil sebagai baseline baru")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--single", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single:
+        print(json.dumps(run_scale(args, args.single)))
+        return
+
+    passthrough = [
+        "--products-per-page", str(args.products_per_page), "--workers", str(args.workers),
+        "--latency", str(args.latency), "--jitter", str(args.jitter), "--error-rate", str(args.error_rate),
+    ] + (["--corpus", args.corpus] if args.corpus else [])
+
+    results = {}
+    for pages in args.pages:
+        results[str(pages)] = run_isolated(passthrough, pages)
+        print_result(results[str(pages)])
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+        print(f"Baseline disimpan ke {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            regressions = compare(results, json.load(file), args.tolerance)
+        for regression in regressions:
+            print(f"REGRESI {regression}")
+        if regressions:
+            sys.exit(1)
+        print("Tidak ada regresi dibanding baseline.")
+
+
+if __name__ == "__main__":
+    main()
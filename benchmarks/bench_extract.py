@@ -0,0 +1,43 @@
+"""
+Benchmark waktu ekstraksi terhadap jumlah worker.
+
+Menjalankan `extract_data` terhadap server lokal dengan latensi buatan
+lalu mencetak waktu total untuk setiap tingkat konkurensi.
+
+    python -m benchmarks.bench_extract --pages 50 --latency 0.1
+"""
+import argparse
+import time
+from unittest.mock import patch
+
+from benchmarks.mock_server import MockFashionServer
+from utils.extract import extract_data
+
+
+def run(pages: int, latency: float, workers_list, rate_limit=None) -> None:
+    with MockFashionServer(total_pages=pages, latency=latency) as server:
+        with patch("utils.extract.BASE_URL", server.base_url):
+            baseline = None
+            for workers in workers_list:
+                started = time.perf_counter()
+                products = extract_data(1, pages, max_workers=workers, rate_limit=rate_limit)
+                elapsed = time.perf_counter() - started
+                baseline = baseline or elapsed
+                print(
+                    f"workers={workers:<3} produk={len(products):<6} "
+                    f"waktu={elapsed:.2f}s speedup={baseline / elapsed:.1f}x"
+                )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.1)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--rate-limit", type=float, default=None)
+    args = parser.parse_args()
+    run(args.pages, args.latency, args.workers, args.rate_limit)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark backend parser pada halaman yang tersimpan.
+
+Membandingkan waktu `parse_page` untuk setiap backend yang tersedia pada
+halaman fixture dan halaman sintetis dari mock server, lalu membandingkan
+`parse_product` per kartu dengan `parse_page_batch` (satu lintasan per kartu,
+satu timestamp per halaman).
+
+    python -m benchmarks.bench_parser --repeat 20
+"""
+import argparse
+import contextlib
+import glob
+import io
+import os
+import time
+
+from benchmarks.mock_server import render_page
+from utils.extract import PARSER_BACKENDS, parse_page, parse_page_batch, parse_product, available_parser_backends
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "..", "tests", "fixtures")
+
+
+def load_pages(synthetic_pages: int):
+    pages = []
+    for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, "*.html"))):
+        with open(path, encoding="utf-8") as file:
+            pages.append(file.read())
+    pages.extend(render_page(page, synthetic_pages) for page in range(1, synthetic_pages + 1))
+    return pages
+
+
+def run(repeat: int, synthetic_pages: int) -> None:
+    pages = load_pages(synthetic_pages)
+    baseline = None
+    for backend in available_parser_backends():
+        started = time.perf_counter()
+        for _ in range(repeat):
+            for html in pages:
+                parse_page(html, backend)
+        elapsed = (time.perf_counter() - started) / (repeat * len(pages))
+        baseline = baseline or elapsed
+        print(f"{backend:<14} {elapsed * 1000:8.2f} ms/halaman  speedup={baseline / elapsed:.2f}x")
+
+
+def run_batch(repeat: int, synthetic_pages: int, backend: str = "html.parser") -> None:
+    pages = load_pages(synthetic_pages)
+    modes = {
+        "per-kartu": lambda html: [parse_product(card) for card in PARSER_BACKENDS[backend](html)],
+        "batch": lambda html: parse_page_batch(html, backend),
+        "batch-typed": lambda html: parse_page_batch(html, backend, typed=True),
+    }
+    baseline = None
+    for name, parse in modes.items():
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(repeat):
+                for html in pages:
+                    parse(html)
+        elapsed = (time.perf_counter() - started) / (repeat * len(pages))
+        baseline = baseline or elapsed
+        print(f"{name:<14} {elapsed * 1000:8.2f} ms/halaman  speedup={baseline / elapsed:.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--synthetic-pages", type=int, default=10)
+    args = parser.parse_args()
+    run(args.repeat, args.synthetic_pages)
+    run_batch(args.repeat, args.synthetic_pages)
+
+
+if __name__ == "__main__":
+    main()
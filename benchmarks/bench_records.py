@@ -0,0 +1,60 @@
+"""
+Benchmark memori representasi produk: dict per produk dibandingkan `RawProduct`/`Product`.
+
+`mentah` mengukur wadah hasil parsing (string nilai dibuat sebelum pengukuran
+sehingga yang terukur hanya overhead wadahnya), sedangkan `bersih` mengukur
+puncak memori `transform_data` dibandingkan `transform_records`.
+
+    python -m benchmarks.bench_records --rows 1000000
+"""
+import argparse
+import contextlib
+import gc
+import io
+import tracemalloc
+
+from benchmarks.bench_transform import make_rows
+from utils.records import FIELDS, RawProduct
+from utils.transform import transform_data, transform_records
+
+
+def peak_mb(func, *args):
+    """Menjalankan `func` dan mengembalikan (hasil, puncak alokasi dalam MB)."""
+    gc.collect()
+    tracemalloc.start()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, peak / 1024 / 1024
+
+
+def run(sizes) -> None:
+    for size in sizes:
+        values = [tuple(row[field] for field in FIELDS) for row in make_rows(size)]
+
+        raw_dicts, dict_mb = peak_mb(lambda: [dict(zip(FIELDS, row)) for row in values])
+        raw_records, record_mb = peak_mb(lambda: [RawProduct._make(row) for row in values])
+        print(
+            f"baris={size:<9} mentah: dict={dict_mb:8.1f}MB record={record_mb:8.1f}MB "
+            f"({dict_mb / record_mb:4.1f}x lebih kecil)"
+        )
+
+        _, clean_dict_mb = peak_mb(transform_data, raw_dicts)
+        del raw_dicts
+        _, clean_record_mb = peak_mb(transform_records, raw_records)
+        print(
+            f"baris={size:<9} bersih: dict={clean_dict_mb:8.1f}MB record={clean_record_mb:8.1f}MB "
+            f"({clean_dict_mb / clean_record_mb:4.1f}x lebih kecil)"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000_000])
+    args = parser.parse_args()
+    run(args.rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark waktu startup `main.py` dengan `python -X importtime`.
+
+Setiap skenario dijalankan di proses baru dan diambil waktu tercepat dari
+beberapa pengulangan:
+- `import`: hanya `import main` (yang selalu dibayar, termasuk untuk `--help`).
+- `csv`: `import main` lalu dependensi yang dipakai sink CSV saat load.
+- `eager`: `import main` ditambah semua dependensi sink seperti sebelum
+  import dibuat lazy (pandas, pyarrow, Google API client, SQLAlchemy).
+
+Total adalah jumlah waktu kumulatif modul top-level yang dicatat importtime.
+
+    python -m benchmarks.bench_startup --repeat 5 --top 10
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = {
+    "import": "import main",
+    "csv": "import main; from utils.load import pd; pd.DataFrame",
+    "eager": (
+        "import main; import pandas, pyarrow, pyarrow.dataset, pyarrow.parquet, pyarrow.fs; "
+        "import googleapiclient.discovery, google.oauth2.service_account; import sqlalchemy"
+    ),
+}
+
+
+def parse_importtime(stderr: str) -> dict:
+    """{modul: waktu kumulatif (mikrodetik)} untuk modul top-level (indentasi satu spasi)."""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if len(name) - len(name.lstrip()) == 1:
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def measure(code: str) -> dict:
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1])
+    return parse_importtime(completed.stderr)
+
+
+def run(scenarios, repeat: int, top: int) -> None:
+    for scenario in scenarios:
+        try:
+            runs = [measure(SCENARIOS[scenario]) for _ in range(repeat)]
+        except RuntimeError as error:
+            print(f"{scenario:<7} gagal: {error}")
+            continue
+        best = min(runs, key=lambda modules: sum(modules.values()))
+        print(f"{scenario:<7} total={sum(best.values()) / 1000:8.1f}ms  modul={len(best)}")
+        for name, cumulative in sorted(best.items(), key=lambda item: item[1], reverse=True)[:top]:
+            print(f"    {cumulative / 1000:8.1f}ms  {name}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenarios", nargs="+", default=list(SCENARIOS), choices=list(SCENARIOS))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=8)
+    args = parser.parse_args()
+    run(args.scenarios, args.repeat, args.top)
+
+
+if __name__ == "__main__":
+    main()
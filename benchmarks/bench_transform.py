@@ -0,0 +1,65 @@
+"""
+Benchmark transform_data (per baris) dibandingkan engine kolumnar.
+
+`end-to-end` memakai transform_data_vectorized (input dan output list of dict),
+sedangkan `inti` memakai transform_columns pada data yang sudah berbentuk kolom.
+
+    python -m benchmarks.bench_transform --rows 100000 1000000
+"""
+import argparse
+import contextlib
+import io
+import random
+import time
+
+from utils.transform import transform_data
+from utils.transform_columnar import OUTPUT_FIELDS, transform_columns, transform_data_vectorized
+
+
+def make_rows(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    rows = []
+    for index in range(count):
+        rows.append({
+            "Title": f"T-shirt {index % 5000}" if index % 25 else "Unknown Product",
+            "Price": f"${rng.uniform(5, 500):.2f}" if index % 40 else "Price Unavailable",
+            "Rating": f"⭐ {rng.uniform(1, 5):.1f} / 5" if index % 30 else "Invalid Rating",
+            "Colors": f"{rng.randint(1, 8)} Colors",
+            "Size": rng.choice(["S", "M", "L", "XL", "XXL"]),
+            "Gender": rng.choice(["Men", "Women", "Unisex"]),
+            "Timestamp": "2025-04-28T21:40:31.497645",
+        })
+    return rows
+
+
+def timed(func, rows):
+    with contextlib.redirect_stdout(io.StringIO()):
+        started = time.perf_counter()
+        result = func(rows)
+        return time.perf_counter() - started, result
+
+
+def run(sizes) -> None:
+    for size in sizes:
+        rows = make_rows(size)
+        loop_time, expected = timed(transform_data, rows)
+        vector_time, actual = timed(transform_data_vectorized, rows)
+        columns = {field: [row[field] for row in rows] for field in OUTPUT_FIELDS}
+        core_time, _ = timed(transform_columns, columns)
+        same = "sama" if actual == expected else "BERBEDA"
+        print(
+            f"baris={size:<9} loop={loop_time:7.2f}s "
+            f"end-to-end={vector_time:7.2f}s ({loop_time / vector_time:5.2f}x) "
+            f"inti={core_time:7.2f}s ({loop_time / core_time:5.2f}x) hasil={same}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000])
+    args = parser.parse_args()
+    run(args.rows)
+
+
+if __name__ == "__main__":
+    main()
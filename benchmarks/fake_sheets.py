@@ -0,0 +1,75 @@
+import re
+from typing import Dict, List, Tuple
+
+
+class FakeRequest:
+    def __init__(self, func):
+        self.func = func
+
+    def execute(self):
+        return self.func()
+
+
+class FakeSheetsService:
+    """
+    Pengganti lokal client Google Sheets API v4 untuk test dan benchmark.
+
+    Mendukung `spreadsheets().values().update/append/batchUpdate` dan menyimpan
+    isi sheet di memori sebagai grid (baris, kolom) -> nilai.
+    """
+
+    def __init__(self):
+        self.grid: Dict[Tuple[int, int], object] = {}
+        self.requests: List[Tuple[str, dict]] = []
+
+    def spreadsheets(self):
+        return self
+
+    def values(self):
+        return self
+
+    def update(self, spreadsheetId, range, valueInputOption, body):
+        def run():
+            self.requests.append(("update", body))
+            return {"updatedCells": self._write(range, body["values"])}
+        return FakeRequest(run)
+
+    def append(self, spreadsheetId, range, valueInputOption, insertDataOption, body):
+        def run():
+            self.requests.append(("append", body))
+            next_row = max((row for row, _ in self.grid), default=0) + 1
+            return {"updates": {"updatedCells": self._write(f"A{next_row}", body["values"])}}
+        return FakeRequest(run)
+
+    def batchUpdate(self, spreadsheetId, body):
+        def run():
+            self.requests.append(("batchUpdate", body))
+            cells = sum(self._write(entry["range"], entry["values"]) for entry in body["data"])
+            return {"totalUpdatedCells": cells}
+        return FakeRequest(run)
+
+    def _write(self, range_a1: str, values: List[list]) -> int:
+        match = re.fullmatch(r"([A-Z]+)(\d+)", range_a1.split("!")[-1].split(":")[0])
+        column = 0
+        for letter in match.group(1):
+            column = column * 26 + ord(letter) - ord("A") + 1
+        row = int(match.group(2))
+
+        for row_offset, row_values in enumerate(values):
+            for column_offset, value in enumerate(row_values):
+                self.grid[(row + row_offset, column + column_offset)] = value
+        return sum(len(row_values) for row_values in values)
+
+    def rows(self) -> List[list]:
+        """Isi sheet sebagai list baris, tanpa baris kosong di bagian akhir."""
+        if not self.grid:
+            return []
+        last_row = max(row for row, _ in self.grid)
+        last_column = max(column for _, column in self.grid)
+        rows = [
+            [self.grid.get((row, column), "") for column in range(1, last_column + 1)]
+            for row in range(1, last_row + 1)
+        ]
+        while rows and all(value == "" for value in rows[-1]):
+            rows.pop()
+        return rows
@@ -0,0 +1,210 @@
+import os
+import re
+import hashlib
+import random
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+PRODUCT_TYPES = ["T-shirt", "Hoodie", "Pants", "Outerwear", "Jacket", "Shirt"]
+SIZES = ["S", "M", "L", "XL", "XXL"]
+GENDERS = ["Men", "Women", "Unisex"]
+
+
+def render_card(index: int) -> str:
+    """Membuat satu elemen `.collection-card` dengan struktur seperti situs Fashion Studio."""
+    if index % 17 == 0:
+        return (
+            '<div class="collection-card"><div class="product-details">'
+            '<h3 class="product-title">Unknown Product</h3>'
+            '<div class="price-container"><span class="price">$100.00</span></div>'
+            '<p style="font-size: 14px; color: #777;">Rating: Invalid Rating / 5</p>'
+            '<p style="font-size: 14px; color: #777;">5 Colors</p>'
+            '<p style="font-size: 14px; color: #777;">Size: M</p>'
+            '<p style="font-size: 14px; color: #777;">Gender: Men</p>'
+            '</div></div>'
+        )
+
+    title = f"{PRODUCT_TYPES[index % len(PRODUCT_TYPES)]} {index}"
+    price = 10 + (index * 37) % 490 + (index % 100) / 100
+    rating = 1 + (index * 13) % 40 / 10
+    colors = 1 + index % 5
+    return (
+        '<div class="collection-card"><div class="product-details">'
+        f'<h3 class="product-title">{title}</h3>'
+        f'<div class="price-container"><span class="price">${price:.2f}</span></div>'
+        f'<p style="font-size: 14px; color: #777;">Rating: ⭐ {rating:.1f} / 5</p>'
+        f'<p style="font-size: 14px; color: #777;">{colors} Colors</p>'
+        f'<p style="font-size: 14px; color: #777;">Size: {SIZES[index % len(SIZES)]}</p>'
+        f'<p style="font-size: 14px; color: #777;">Gender: {GENDERS[index % len(GENDERS)]}</p>'
+        '</div></div>'
+    )
+
+
+def render_page(page: int, total_pages: int, products_per_page: int = 20) -> str:
+    """Membuat HTML satu halaman katalog lengkap dengan navigasi pagination."""
+    start = (page - 1) * products_per_page + 1
+    cards = "".join(render_card(index) for index in range(start, start + products_per_page))
+    next_link = (
+        f'<li class="page-item next"><a class="page-link" href="/page{page + 1}">Next</a></li>'
+        if page < total_pages else ""
+    )
+    return (
+        "<html><head><title>Fashion Studio</title></head><body>"
+        f'<div class="collection-grid" id="collectionList">{cards}</div>'
+        '<ul class="pagination">'
+        f'<li class="page-item current"><span class="page-link">Page {page} of {total_pages}</span></li>'
+        f"{next_link}</ul></body></html>"
+    )
+
+
+def record_corpus(base_url: str, pages: int, directory: str) -> List[str]:
+    """
+    Merekam halaman asli (misalnya fashion-studio.dicoding.dev) ke `directory`
+    sebagai `page-00001.html`, dan seterusnya, untuk diputar ulang oleh server lokal.
+    """
+    from utils.extract import HEADERS
+    from utils.http_client import fetch
+
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for page in range(1, pages + 1):
+        url = base_url.rstrip("/") + "/" + ("" if page == 1 else f"page{page}")
+        response = fetch(url, headers=HEADERS, timeout=10)
+        response.raise_for_status()
+        path = os.path.join(directory, f"page-{page:05d}.html")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(response.text)
+        paths.append(path)
+    return paths
+
+
+def load_corpus(directory: str) -> List[str]:
+    """Membaca halaman hasil `record_corpus` sesuai urutan nomor halaman."""
+    names = sorted(name for name in os.listdir(directory) if re.fullmatch(r"page-\d+\.html", name))
+    corpus = []
+    for name in names:
+        with open(os.path.join(directory, name), encoding="utf-8") as file:
+            corpus.append(file.read())
+    return corpus
+
+
+class MockFashionServer:
+    """
+    Server HTTP lokal pengganti fashion-studio.dicoding.dev untuk test dan benchmark.
+
+    Halaman `/` adalah halaman 1 dan `/page{n}` adalah halaman n. Nomor halaman
+    di luar `total_pages` dijawab dengan 404. Isi halaman dibuat oleh
+    `render_page`, atau diambil bergiliran dari `corpus` (halaman rekaman).
+    Setiap request ditunda `latency` ditambah jitter acak hingga `jitter` detik,
+    dan dijawab 503 dengan peluang `error_rate`.
+    """
+
+    def __init__(
+        self,
+        total_pages: int = 50,
+        products_per_page: int = 20,
+        latency: float = 0.0,
+        pages: Optional[Dict[int, str]] = None,
+        etag: bool = True,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        corpus: Optional[List[str]] = None,
+        seed: int = 0,
+    ):
+        self.total_pages = total_pages
+        self.products_per_page = products_per_page
+        self.latency = latency
+        self.pages = pages or {}
+        self.etag = etag
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.corpus = corpus or []
+        self.request_count = 0
+        self.not_modified_count = 0
+        self.error_count = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._httpd = None
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def page_html(self, page: int) -> Optional[str]:
+        if page in self.pages:
+            return self.pages[page]
+        if not 1 <= page <= self.total_pages:
+            return None
+        if self.corpus:
+            return self.corpus[(page - 1) % len(self.corpus)]
+        return render_page(page, self.total_pages, self.products_per_page)
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with server._lock:
+                    server.request_count += 1
+                    delay = server.latency + server._random.uniform(0, server.jitter)
+                    failed = server._random.random() < server.error_rate
+                    if failed:
+                        server.error_count += 1
+                if delay:
+                    time.sleep(delay)
+                if failed:
+                    self.send_error(503)
+                    return
+
+                match = re.fullmatch(r"/(?:page(\d+))?/?", self.path)
+                page = int(match.group(1) or 1) if match else 0
+                html = server.page_html(page)
+                if html is None:
+                    self.send_error(404)
+                    return
+
+                body = html.encode("utf-8")
+                etag = f'"{hashlib.md5(body).hexdigest()}"'
+                if server.etag and self.headers.get("If-None-Match") == etag:
+                    with server._lock:
+                        server.not_modified_count += 1
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+
+                self.send_response(200)
+                if server.etag:
+                    self.send_header("ETag", etag)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> "MockFashionServer":
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self) -> "MockFashionServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
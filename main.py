@@ -1,34 +1,283 @@
-from utils.extract import extract_data
-from utils.transform import transform_data
-from utils.load import load_to_csv, load_to_google_sheets, load_to_postgresql
+import os
+import sys
+import time
+import signal
+import argparse
+import threading
+from utils.cache import HTTP_CACHE_PATH, ResponseCache
+from utils.cdc import CDC_FULL_SNAPSHOT, CDC_INDEX_PATH, ProductIndex
+from utils.dedup import close_dedup, make_dedup
+from utils.distributed import WORK_QUEUE_PATH, WORK_QUEUE_WORKERS, WorkQueue, extract_distributed, run_worker
+from utils.extract import EXTRACT_BURST, EXTRACT_RATE_LIMIT, EXTRACT_WORKERS, ExtractReport, extract_data
+from utils.journal import EXTRACT_JOURNAL_DIR, RunJournal
+from utils.pagination import discover_last_page
+from utils.transform import transform_records
+from utils.metrics import METRICS_PROMETHEUS_PATH, METRICS_REPORT_PATH, active_metrics, disable_metrics, enable_metrics
+from utils.http_client import close_session
+from utils.load import dispose_engines
+from utils.pipeline import PARSE_PROCESSES, StagedExtractor, run_stream
+from utils.scheduler import SCHEDULE_CRON, SCHEDULE_INTERVAL, Scheduler, parse_schedule
+from utils.sinks import SINKS, exit_status, incremental_sinks, open_stream_writers, run_sinks
 
-def main():
+ETL_STREAM = os.getenv("ETL_STREAM", "0") == "1"
+EXTRACT_RESUME = os.getenv("EXTRACT_RESUME", "0") == "1"
+EXTRACT_END_PAGE = int(os.getenv("EXTRACT_END_PAGE", "0")) or None
+ETL_SINKS = [name.strip() for name in os.getenv("ETL_SINKS", "").split(",") if name.strip()] or None
+
+def extract_options(workers=EXTRACT_WORKERS, rate_limit=EXTRACT_RATE_LIMIT, burst=EXTRACT_BURST):
+    """
+    Opsi scraping: jumlah thread fetch (None memakai default setiap jalur
+    extract), rate limit per host dalam request per detik (None tanpa batas),
+    dan ukuran burst.
+    """
+    return {"workers": workers, "rate_limit": rate_limit, "burst": burst}
+
+def main_stream(cache=None, end_page=50, sinks=ETL_SINKS, start_page=1, extract=None):
+    extract = extract or extract_options()
+    writers, results = open_stream_writers(sinks)
+
+    seen = None
     try:
-        raw_data = extract_data(start_page=1, end_page=50)
+        seen = make_dedup()
+        if PARSE_PROCESSES:
+            extractor = StagedExtractor(
+                fetch_workers=extract["workers"] or 4,
+                parse_workers=PARSE_PROCESSES,
+                rate_limit=extract["rate_limit"],
+                burst=extract["burst"],
+            )
+            run_stream(writers, pages=extractor.iter_pages(start_page=start_page, end_page=end_page), seen=seen, results=results)
+        else:
+            run_stream(
+                writers, start_page=start_page, end_page=end_page, cache=cache, seen=seen, results=results,
+                max_workers=extract["workers"] or 1, rate_limit=extract["rate_limit"], burst=extract["burst"],
+            )
     except Exception as error:
-        print(f"[ERROR] Proses extract gagal: {error}")
-        return
+        print(f"[ERROR] Proses ETL stream gagal: {error}")
+        return 1
+    finally:
+        close_dedup(seen)
+    return exit_status(results)
 
+def record_stage(stage, started):
+    metrics = active_metrics()
+    if metrics is not None:
+        metrics.observe("stage_seconds", time.perf_counter() - started, stage=stage)
+
+def open_cache(path=HTTP_CACHE_PATH):
     try:
-        cleaned_data = transform_data(raw_data)
+        return ResponseCache(path) if path else None
     except Exception as error:
-        print(f"[ERROR] Proses transform gagal: {error}")
-        return
+        print(f"[WARN] Cache HTTP tidak dapat dibuka, scraping tanpa cache: {error}")
+        return None
+
+def run_etl(stream=ETL_STREAM, cache=None, sinks=ETL_SINKS, start_page=1, end_page=EXTRACT_END_PAGE, workers=WORK_QUEUE_WORKERS, extract=None):
+    """
+    Satu run ETL. Jika `cache` tidak diberikan, cache dari HTTP_CACHE_PATH dibuka
+    untuk run ini saja dan ditutup lagi setelahnya; cache milik pemanggil
+    (misalnya `serve`) dibiarkan terbuka.
+    """
+    if cache is not None:
+        return _run_etl(stream, cache, sinks, start_page, end_page, workers, extract)
+
+    cache = open_cache()
+    try:
+        return _run_etl(stream, cache, sinks, start_page, end_page, workers, extract)
+    finally:
+        if cache is not None:
+            cache.close()
 
+def _run_etl(stream, cache, sinks, start_page, end_page, workers, extract):
+    extract = extract or extract_options()
     try:
-        load_to_csv(cleaned_data)
+        end_page = end_page or discover_last_page()
     except Exception as error:
-        print(f"[ERROR] Proses load ke CSV gagal: {error}")
+        print(f"[ERROR] Gagal menentukan jumlah halaman: {error}")
+        return 1
+    if end_page < start_page:
+        print(f"[ERROR] Jumlah halaman yang ditemukan ({end_page}) lebih kecil dari halaman awal {start_page}, run dibatalkan")
+        return 1
+
+    if stream:
+        started = time.perf_counter()
+        status = main_stream(cache, end_page, sinks, start_page, extract)
+        record_stage("stream", started)
+        return status
 
+    report = ExtractReport()
     try:
-        load_to_google_sheets(cleaned_data)
+        started = time.perf_counter()
+        if workers or WORK_QUEUE_PATH:
+            raw_data = extract_distributed(
+                start_page=start_page, end_page=end_page, workers=workers, resume=EXTRACT_RESUME,
+                rate_limit=extract["rate_limit"], burst=extract["burst"], report=report,
+            )
+        else:
+            journal = RunJournal(EXTRACT_JOURNAL_DIR) if EXTRACT_JOURNAL_DIR else None
+            raw_data = extract_data(
+                start_page=start_page, end_page=end_page, cache=cache, journal=journal, resume=EXTRACT_RESUME,
+                max_workers=extract["workers"] or 1, rate_limit=extract["rate_limit"], burst=extract["burst"],
+                as_records=True, report=report,
+            )
+        record_stage("extract", started)
     except Exception as error:
-        print(f"[ERROR] Proses load ke Google Sheets gagal: {error}")
+        print(f"[ERROR] Proses extract gagal: {error}")
+        return 1
 
+    seen = None
     try:
-        load_to_postgresql(cleaned_data)
+        started = time.perf_counter()
+        seen = make_dedup()
+        cleaned_data = transform_records(raw_data, seen=seen)
+        record_stage("transform", started)
     except Exception as error:
-        print(f"[ERROR] Proses load ke PostgreSQL gagal: {error}")
+        print(f"[ERROR] Proses transform gagal: {error}")
+        return 1
+    finally:
+        close_dedup(seen)
+
+    index, changes = None, {}
+    if CDC_INDEX_PATH and incremental_sinks(sinks):
+        try:
+            index = ProductIndex(CDC_INDEX_PATH)
+            if not report.complete:
+                print(f"[WARN] Extract tidak lengkap ({report.describe()}): CDC hanya menyimpan produk baru/berubah, produk yang tidak muncul tidak dihapus dari index.")
+            changes = index.diff_sinks(cleaned_data, incremental_sinks(sinks), deletions=report.complete)
+        except Exception as error:
+            print(f"[WARN] Index CDC tidak dapat dipakai, memuat data penuh: {error}")
+            index, changes = None, {}
+
+    started = time.perf_counter()
+    deltas = None if CDC_FULL_SNAPSHOT else {name: change.delta for name, change in changes.items()}
+    results = run_sinks(cleaned_data, sinks, deltas=deltas)
+    record_stage("load", started)
+
+    if index is not None:
+        for name, change in changes.items():
+            if results[name].ok:
+                index.commit(change)
+            else:
+                print(f"[WARN] Index CDC sink {name} tidak diperbarui karena sink gagal; delta akan dikirim ulang pada run berikutnya.")
+        index.close()
+    return exit_status(results)
+
+def main(stream=ETL_STREAM, cache=None, sinks=ETL_SINKS, start_page=1, end_page=EXTRACT_END_PAGE, workers=WORK_QUEUE_WORKERS, extract=None):
+    if not (METRICS_REPORT_PATH or METRICS_PROMETHEUS_PATH):
+        return run_etl(stream, cache, sinks, start_page, end_page, workers, extract)
+
+    metrics = enable_metrics()
+    try:
+        return run_etl(stream, cache, sinks, start_page, end_page, workers, extract)
+    finally:
+        disable_metrics()
+        metrics.write(METRICS_REPORT_PATH, METRICS_PROMETHEUS_PATH)
+
+def serve(schedule=None, stream=ETL_STREAM, max_runs=None, sinks=ETL_SINKS, start_page=1, end_page=EXTRACT_END_PAGE, workers=WORK_QUEUE_WORKERS, extract=None):
+    """
+    Mode daemon: menjalankan ETL sesuai jadwal di satu proses. Sesi HTTP, engine
+    database, dan client Sheets dipakai ulang antar run; cache respons (di
+    memori jika HTTP_CACHE_PATH kosong) membuat halaman yang tidak berubah
+    cukup direvalidasi tanpa parsing ulang.
+    """
+    try:
+        schedule = schedule or parse_schedule()
+    except ValueError as error:
+        print(f"[ERROR] {error}")
+        return 1
+
+    cache = open_cache(HTTP_CACHE_PATH or ":memory:")
+    scheduler = Scheduler(lambda: main(stream, cache, sinks, start_page, end_page, workers, extract), schedule, max_runs=max_runs)
+    scheduler.install_signal_handlers()
+    try:
+        return scheduler.run()
+    finally:
+        if cache is not None:
+            cache.close()
+        close_session()
+        dispose_engines()
+
+def work(path=WORK_QUEUE_PATH, extract=None):
+    """
+    Mode worker untuk node lain: mengerjakan halaman dari antrean bersama di
+    `path` sampai dihentikan (SIGINT/SIGTERM). Transform dan load dijalankan
+    oleh coordinator.
+    """
+    try:
+        queue = WorkQueue(path)
+    except Exception as error:
+        print(f"[ERROR] Antrean kerja tidak dapat dibuka: {error}")
+        return 1
+
+    stop = threading.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: stop.set())
+    try:
+        extract = extract or extract_options()
+        run_worker(queue, rate_limit=extract["rate_limit"], burst=extract["burst"], wait_for_work=True, stop=stop)
+    finally:
+        queue.close()
+        close_session()
+    return 0
+
+def parse_args(argv=None):
+    """Argumen command line; nilai default diambil dari environment variable."""
+    parser = argparse.ArgumentParser(description="ETL produk Fashion Studio.")
+    parser.add_argument(
+        "--sinks",
+        default=",".join(ETL_SINKS) if ETL_SINKS else None,
+        help=f"sink dipisah koma ({', '.join(SINKS)}); default ETL_SINKS atau semua sink",
+    )
+    parser.add_argument("--start-page", type=int, default=1)
+    parser.add_argument("--end-page", type=int, default=EXTRACT_END_PAGE, help="default EXTRACT_END_PAGE atau dideteksi otomatis")
+    parser.add_argument("--stream", action=argparse.BooleanOptionalAction, default=ETL_STREAM)
+    parser.add_argument("--interval", type=float, default=SCHEDULE_INTERVAL, help="mode daemon: jeda antar run (detik)")
+    parser.add_argument("--cron", default=SCHEDULE_CRON, help="mode daemon: ekspresi cron")
+    parser.add_argument("--extract-workers", type=int, default=EXTRACT_WORKERS, help="jumlah thread fetch halaman (default EXTRACT_WORKERS)")
+    parser.add_argument("--rate-limit", type=float, default=EXTRACT_RATE_LIMIT, help="request per detik per host; 0 berarti tanpa batas")
+    parser.add_argument("--burst", type=int, default=EXTRACT_BURST, help="jumlah request beruntun yang diizinkan rate limiter")
+    parser.add_argument("--workers", type=int, default=WORK_QUEUE_WORKERS, help="jumlah worker scraping lokal untuk antrean kerja")
+    parser.add_argument("--worker", action="store_true", help="hanya menjadi worker untuk antrean di WORK_QUEUE_PATH")
+    args = parser.parse_args(argv)
+
+    if args.sinks is not None:
+        args.sinks = [name.strip() for name in args.sinks.split(",") if name.strip()]
+        unknown = [name for name in args.sinks if name not in SINKS]
+        if unknown:
+            parser.error(f"sink tidak dikenal: {', '.join(unknown)} (tersedia: {', '.join(SINKS)})")
+    if args.start_page < 1:
+        parser.error("--start-page minimal 1")
+    if args.end_page is not None and args.end_page < args.start_page:
+        parser.error("--end-page tidak boleh lebih kecil dari --start-page")
+    if args.workers < 0:
+        parser.error("--workers tidak boleh negatif")
+    if args.extract_workers is not None and args.extract_workers < 1:
+        parser.error("--extract-workers minimal 1")
+    if args.burst < 1:
+        parser.error("--burst minimal 1")
+    args.rate_limit = args.rate_limit or None
+    return args
+
+def cli(argv=None):
+    args = parse_args(argv)
+    extract = extract_options(args.extract_workers, args.rate_limit, args.burst)
+    if args.worker:
+        return work(extract=extract)
+
+    options = {
+        "sinks": args.sinks,
+        "start_page": args.start_page,
+        "end_page": args.end_page,
+        "workers": args.workers,
+        "extract": extract,
+    }
+    if args.interval or args.cron:
+        try:
+            schedule = parse_schedule(args.interval, args.cron)
+        except ValueError as error:
+            print(f"[ERROR] {error}")
+            return 1
+        return serve(schedule, args.stream, **options)
+    return main(args.stream, **options)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(cli())
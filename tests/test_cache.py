@@ -0,0 +1,77 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from utils.cache import ResponseCache, hash_body
+
+products = [{"Title": "Shirt A", "Price": "$10", "Timestamp": "2024-04-05T12:00:00"}]
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "cache.sqlite")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_put_and_get(self):
+        """Test entri yang disimpan bisa diambil kembali beserta validatornya."""
+        cache = ResponseCache(self.path)
+        cache.put("https://a/", hash_body(b"html"), products, etag='"abc"', last_modified="Sat, 05 Apr 2025 12:00:00 GMT")
+
+        entry = cache.get("https://a/")
+        self.assertEqual(entry.products, products)
+        self.assertEqual(entry.body_hash, hash_body(b"html"))
+        self.assertEqual(entry.conditional_headers(), {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Sat, 05 Apr 2025 12:00:00 GMT",
+        })
+        cache.close()
+
+    def test_get_missing(self):
+        """Test get() mengembalikan None untuk URL yang belum di-cache."""
+        cache = ResponseCache(self.path)
+        self.assertIsNone(cache.get("https://missing/"))
+        cache.close()
+
+    def test_entries_persist_across_instances(self):
+        """Test cache tetap tersedia setelah dibuka ulang (antar run)."""
+        cache = ResponseCache(self.path)
+        cache.put("https://a/", "hash", products)
+        cache.close()
+
+        reopened = ResponseCache(self.path)
+        self.assertIsNotNone(reopened.get("https://a/"))
+        reopened.close()
+
+    def test_ttl_expiry(self):
+        """Test entri yang melewati TTL dianggap tidak ada."""
+        cache = ResponseCache(self.path, ttl=60)
+        with patch("utils.cache.time.time", return_value=1000.0):
+            cache.put("https://a/", "hash", products)
+        with patch("utils.cache.time.time", return_value=1100.0):
+            self.assertIsNone(cache.get("https://a/"))
+        cache.close()
+
+    def test_lru_eviction(self):
+        """Test entri yang paling lama tidak diakses dibuang saat ukuran melebihi batas."""
+        cache = ResponseCache(self.path, max_bytes=200)
+        with patch("utils.cache.time.time", return_value=1000.0):
+            cache.put("https://a/", "hash", products)
+        with patch("utils.cache.time.time", return_value=1001.0):
+            cache.put("https://b/", "hash", products)
+        with patch("utils.cache.time.time", return_value=1002.0):
+            cache.get("https://a/")
+        with patch("utils.cache.time.time", return_value=1003.0):
+            cache.put("https://c/", "hash", products)
+            self.assertIsNotNone(cache.get("https://a/"))
+            self.assertIsNone(cache.get("https://b/"))
+            self.assertIsNotNone(cache.get("https://c/"))
+        self.assertLessEqual(cache.total_size(), 200)
+        cache.close()
+
+    def test_missing_path(self):
+        """Test ResponseCache menolak path kosong."""
+        with self.assertRaises(ValueError):
+            ResponseCache(None)
@@ -0,0 +1,104 @@
+import os
+import tempfile
+import unittest
+from utils.cdc import ProductIndex
+from utils.records import Product
+
+first_run = [
+    Product("Shirt A", 160000.0, 4.5, 3, "M", "Men", "2024-04-05T12:00:00"),
+    Product("Pants B", 408000.0, 3.9, 5, "XL", "Women", "2024-04-05T12:00:00"),
+    Product("Jacket C", 800000.0, 4.8, 2, "L", "Unisex", "2024-04-05T12:00:00"),
+]
+
+
+class TestProductIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "cdc.db")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_first_run_is_all_new(self):
+        """Test run pertama mengklasifikasikan semua produk sebagai baru."""
+        index = ProductIndex(self.path)
+        changes = index.diff(first_run)
+        self.assertEqual(changes.counts(), {"new": 3, "changed": 0, "unchanged": 0, "removed": 0})
+        self.assertEqual(changes.delta, first_run)
+        index.close()
+
+    def test_classifies_changes_between_runs(self):
+        """Test produk baru, berubah, tidak berubah, dan hilang antar run; Timestamp diabaikan."""
+        index = ProductIndex(self.path)
+        index.commit(index.diff(first_run))
+        index.close()
+
+        second_run = [
+            first_run[0]._replace(Timestamp="2024-04-06T12:00:00"),
+            first_run[1]._replace(Price=390000.0, Timestamp="2024-04-06T12:00:00"),
+            Product("Hoodie D", 500000.0, 4.1, 4, "S", "Men", "2024-04-06T12:00:00"),
+        ]
+        index = ProductIndex(self.path)
+        changes = index.diff(second_run)
+
+        self.assertEqual(changes.counts(), {"new": 1, "changed": 1, "unchanged": 1, "removed": 1})
+        self.assertEqual(changes.new, [second_run[2]])
+        self.assertEqual(changes.changed, [second_run[1]])
+        self.assertEqual(changes.removed[0]["Title"], "Jacket C")
+        self.assertEqual(changes.delta, [second_run[2], second_run[1]])
+
+        index.commit(changes)
+        self.assertEqual(index.size(), 3)
+        self.assertEqual(index.diff(second_run).counts()["unchanged"], 3)
+        index.close()
+
+    def test_diff_without_commit_keeps_index(self):
+        """Test index tidak berubah sebelum commit sehingga delta terkirim ulang setelah load gagal."""
+        index = ProductIndex(self.path)
+        index.diff(first_run)
+        self.assertEqual(index.size(), 0)
+        self.assertEqual(index.diff(first_run).counts()["new"], 3)
+        index.close()
+
+    def test_duplicate_identities_and_dicts(self):
+        """Test produk dengan identitas sama dibedakan oleh urutan, dan dict diperlakukan sama seperti record."""
+        rows = [first_run[0], first_run[0]._replace(Price=170000.0)]
+        index = ProductIndex(self.path)
+        index.commit(index.diff(rows))
+
+        changes = index.diff([row._asdict() for row in rows])
+        self.assertEqual(changes.counts(), {"new": 0, "changed": 0, "unchanged": 2, "removed": 0})
+        index.close()
+
+    def test_state_is_kept_per_sink(self):
+        """Test commit untuk satu sink tidak mengosongkan delta sink lain yang tidak ikut run."""
+        index = ProductIndex(self.path)
+        index.commit(index.diff(first_run, "parquet"))
+
+        changes = index.diff_sinks(first_run, ["parquet", "postgresql"])
+
+        self.assertEqual(changes["parquet"].counts()["unchanged"], 3)
+        self.assertEqual(changes["postgresql"].delta, first_run)
+        self.assertEqual(index.size("parquet"), 3)
+        self.assertEqual(index.size("postgresql"), 0)
+        index.close()
+
+    def test_incomplete_run_keeps_missing_products(self):
+        """Test run tidak lengkap (deletions=False) tidak menghapus produk yang tidak muncul dari index."""
+        index = ProductIndex(self.path)
+        index.commit(index.diff(first_run))
+
+        partial = index.diff(first_run[:1], deletions=False)
+        index.commit(partial)
+
+        self.assertEqual(partial.counts(), {"new": 0, "changed": 0, "unchanged": 1, "removed": 0})
+        self.assertEqual(index.size(), 3)
+        self.assertEqual(index.diff(first_run).delta, [])
+        index.close()
+
+    def test_invalid_configuration(self):
+        """Test path kosong dan field key yang tidak dikenal ditolak."""
+        with self.assertRaises(ValueError):
+            ProductIndex(None)
+        with self.assertRaises(ValueError):
+            ProductIndex(self.path, key=["Timestamp"])
@@ -0,0 +1,87 @@
+import os
+import sys
+import tempfile
+import subprocess
+import unittest
+from utils.dedup import BloomDedup, FingerprintSet, MmapFingerprintSet, close_dedup, fingerprint, make_dedup
+from utils.transform import transform_data
+
+raw_data = [
+    {"Title": f"Shirt {index % 150}", "Price": f"${10 + index % 7}.00", "Rating": "⭐ 4.5 / 5",
+     "Colors": "3 Colors", "Size": "M", "Gender": "Men", "Timestamp": "2024-04-05T12:00:00"}
+    for index in range(1000)
+]
+
+
+class TestDedupBackends(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "dedup.idx")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_backends_match_exact_set(self):
+        """Test setiap backend (kecuali Bloom tanpa verifikasi) menghasilkan data yang sama dengan set."""
+        expected = transform_data(raw_data)
+        for backend in ["exact", "fp64", "fp128", "disk", "bloom-verify"]:
+            with self.subTest(backend=backend):
+                if os.path.exists(self.path):
+                    os.remove(self.path)
+                seen = make_dedup(backend, capacity=16, path=self.path)
+                try:
+                    self.assertEqual(transform_data(raw_data, seen=seen), expected)
+                finally:
+                    close_dedup(seen)
+
+    def test_fingerprint_is_stable(self):
+        """Test fingerprint sama di proses lain dengan PYTHONHASHSEED berbeda."""
+        key = ("Shirt A", 160000.0, 4.5, 3, "M", "Men")
+        code = f"from utils.dedup import fingerprint; print(fingerprint({key!r}, 128))"
+        for seed in ["1", "2"]:
+            output = subprocess.run(
+                [sys.executable, "-c", code], check=True, capture_output=True, text=True,
+                env={**os.environ, "PYTHONHASHSEED": seed},
+            ).stdout
+            self.assertEqual(int(output), fingerprint(key, 128))
+
+    def test_fingerprint_set_grows(self):
+        """Test tabel fingerprint membesar tanpa kehilangan key."""
+        seen = FingerprintSet(64, capacity=4)
+        for index in range(1000):
+            seen.add(("key", index))
+        self.assertEqual(len(seen), 1000)
+        self.assertTrue(all(("key", index) in seen for index in range(1000)))
+        self.assertNotIn(("key", 1000), seen)
+
+    def test_disk_index_dedups_across_runs(self):
+        """Test index di disk membuat produk dari run sebelumnya dianggap duplikat."""
+        first_run = transform_data(raw_data[:500])
+        with MmapFingerprintSet(self.path, capacity=16) as seen:
+            self.assertEqual(transform_data(raw_data[:500], seen=seen), first_run)
+
+        with MmapFingerprintSet(self.path, capacity=16) as seen:
+            self.assertEqual(len(seen), len(first_run))
+            second_run = transform_data(raw_data, seen=seen)
+        self.assertEqual(len(second_run), len(transform_data(raw_data)) - len(first_run))
+
+        with self.assertRaises(ValueError):
+            MmapFingerprintSet(self.path, bits=128)
+
+    def test_bloom_false_positive_rate(self):
+        """Test Bloom tanpa verifikasi berada di sekitar error_rate dan verifikasi menghilangkan positif palsu."""
+        bloom = BloomDedup(capacity=10000, error_rate=0.01)
+        checked = BloomDedup(capacity=10000, error_rate=0.01, verify=set())
+        for index in range(10000):
+            bloom.add(("in", index))
+            checked.add(("in", index))
+
+        false_positives = sum(("out", index) in bloom for index in range(10000))
+        self.assertLess(false_positives, 300)
+        self.assertFalse(any(("out", index) in checked for index in range(10000)))
+        self.assertTrue(all(("in", index) in checked for index in range(10000)))
+
+    def test_unknown_backend(self):
+        """Test backend yang tidak dikenal ditolak."""
+        with self.assertRaises(ValueError):
+            make_dedup("redis")
@@ -0,0 +1,159 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from benchmarks.mock_server import MockFashionServer
+from utils.distributed import WorkQueue, extract_distributed, run_worker
+from utils.extract import extract_data
+from utils.journal import STATUS_EMPTY, STATUS_FAILED, STATUS_OK
+
+products = [{"Title": "Shirt A", "Price": "$10", "Timestamp": "2024-04-05T12:00:00"}]
+
+
+class TestWorkQueue(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "queue.db")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_enqueue_is_idempotent(self):
+        """Test halaman yang sudah ada di antrean tidak ditambahkan dua kali."""
+        queue = WorkQueue(self.path)
+        self.assertEqual(queue.enqueue(range(1, 4)), 3)
+        self.assertEqual(queue.enqueue(range(2, 6)), 2)
+        self.assertEqual(queue.counts(), {"pending": 5})
+        queue.close()
+
+    def test_claims_do_not_overlap(self):
+        """Test dua worker (koneksi terpisah) tidak pernah mengklaim halaman yang sama."""
+        first, second = WorkQueue(self.path), WorkQueue(self.path)
+        first.enqueue(range(1, 6))
+
+        claimed_first = first.claim("worker-1", limit=3)
+        claimed_second = second.claim("worker-2", limit=3)
+
+        self.assertEqual([page for page, _ in claimed_first], [1, 2, 3])
+        self.assertEqual([page for page, _ in claimed_second], [4, 5])
+        self.assertEqual(second.claim("worker-2"), [])
+        first.close()
+        second.close()
+
+    def test_results_are_staged_in_page_order(self):
+        """Test hasil dari beberapa worker digabung sesuai urutan halaman, halaman kosong dibedakan."""
+        queue = WorkQueue(self.path)
+        queue.enqueue([1, 2, 3])
+        queue.claim("worker-1", limit=2)
+        queue.claim("worker-2", limit=1)
+
+        self.assertTrue(queue.complete(3, "worker-2", [{**products[0], "Title": "Pants C"}]))
+        self.assertTrue(queue.complete(1, "worker-1", products))
+        self.assertTrue(queue.complete(2, "worker-1", []))
+
+        self.assertTrue(queue.finished())
+        self.assertEqual(queue.counts(), {STATUS_OK: 2, STATUS_EMPTY: 1})
+        self.assertEqual([product["Title"] for product in queue.products()], ["Shirt A", "Pants C"])
+        queue.close()
+
+    def test_expired_lease_is_reclaimed(self):
+        """Test halaman dari worker yang mati diklaim ulang dan hasil worker lama ditolak."""
+        queue = WorkQueue(self.path)
+        queue.enqueue([1])
+        claimed = queue.claim("worker-1", lease=-1)
+
+        self.assertEqual(queue.claim("worker-2"), claimed)
+        self.assertFalse(queue.complete(1, "worker-1", products))
+        self.assertTrue(queue.complete(1, "worker-2", products))
+        self.assertEqual(len(queue.products()), 1)
+        queue.close()
+
+    def test_failed_page_retries_until_max_attempts(self):
+        """Test halaman gagal kembali ke antrean lalu ditandai gagal setelah max_attempts."""
+        queue = WorkQueue(self.path, max_attempts=2)
+        queue.enqueue([1])
+
+        queue.claim("worker-1")
+        queue.fail(1, "worker-1", "Timeout saat mengakses halaman 1")
+        self.assertEqual(queue.counts(), {"pending": 1})
+
+        queue.claim("worker-1")
+        queue.fail(1, "worker-1", "Timeout saat mengakses halaman 1")
+        self.assertEqual(queue.failed(), [1])
+        self.assertTrue(queue.finished())
+
+        self.assertEqual(queue.retry_failed(), 1)
+        self.assertEqual(queue.counts(), {"pending": 1})
+        queue.close()
+
+    def test_missing_path_raises(self):
+        """Test WorkQueue tanpa path menghasilkan ValueError."""
+        with self.assertRaises(ValueError):
+            WorkQueue("")
+
+
+class TestDistributedExtract(unittest.TestCase):
+    def setUp(self):
+        self.server = MockFashionServer(total_pages=8, products_per_page=3, latency=0.01).start()
+        self.base_url_patch = patch("utils.extract.BASE_URL", self.server.base_url)
+        self.base_url_patch.start()
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.base_url_patch.stop()
+        self.server.stop()
+        self.tmpdir.cleanup()
+
+    def test_thread_workers_match_sequential_extract(self):
+        """Test worker thread pada antrean :memory: menghasilkan data yang sama dengan extract_data."""
+        distributed = extract_distributed(1, 10, workers=3, path=None, rate_limit=None, poll_interval=0.01)
+        sequential = extract_data(1, 10, rate_limit=None)
+
+        self.assertEqual(
+            [product["Title"] for product in distributed],
+            [product["Title"] for product in sequential],
+        )
+
+    def test_process_workers_share_file_queue(self):
+        """Test worker proses terpisah mengerjakan antrean di file dan hasilnya lengkap."""
+        path = os.path.join(self.tmpdir.name, "queue.db")
+
+        distributed = extract_distributed(1, 8, workers=2, path=path, rate_limit=None, poll_interval=0.01)
+
+        self.assertEqual(len(distributed), 24)
+        queue = WorkQueue(path)
+        self.assertEqual(queue.counts(), {STATUS_OK: 8})
+        queue.close()
+
+    def test_resume_with_smaller_range_returns_only_that_range(self):
+        """Test resume dengan end_page lebih kecil hanya mengembalikan produk halaman dalam rentang tersebut."""
+        path = os.path.join(self.tmpdir.name, "queue.db")
+        extract_distributed(1, 8, workers=1, path=path, rate_limit=None, poll_interval=0.01)
+
+        resumed = extract_distributed(2, 3, workers=1, path=path, resume=True, rate_limit=None, poll_interval=0.01)
+
+        self.assertEqual(
+            [product["Title"] for product in resumed],
+            [product["Title"] for product in extract_data(2, 3, rate_limit=None)],
+        )
+        queue = WorkQueue(path)
+        self.assertEqual(len(queue.products()), 24)
+        self.assertEqual(queue.products(2, 3), resumed)
+        queue.close()
+
+    def test_worker_with_different_base_url_fails_pages(self):
+        """Test worker dengan BASE_URL berbeda dari coordinator tidak men-scrape situs yang salah."""
+        queue = WorkQueue(":memory:", max_attempts=1)
+        queue.enqueue([1, 2])
+
+        with patch("utils.extract.BASE_URL", "http://mirror.invalid/"):
+            run_worker(queue, "worker-1", rate_limit=None, poll_interval=0.01)
+
+        self.assertEqual(queue.failed(), [1, 2])
+        self.assertEqual(self.server.request_count, 0)
+        self.assertEqual(queue.counts(), {STATUS_FAILED: 2})
+        queue.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
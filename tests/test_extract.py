@@ -1,7 +1,20 @@
+import os
+import time
+import tempfile
 import unittest
 from unittest.mock import patch, MagicMock
 from bs4 import BeautifulSoup
-from utils.extract import get_page_url, parse_product, scrape_page, extract_data
+from benchmarks.mock_server import MockFashionServer
+from utils.cache import ResponseCache
+from utils.extract import (
+    ExtractReport, get_page_url, parse_product, scrape_page, scrape_page_checked, extract_data, parse_page,
+    parse_page_batch, available_parser_backends
+)
+from utils.journal import RunJournal
+from utils.records import RawProduct, TypedProduct, to_dicts
+from utils.transform import transform_data, transform_records
+
+FIXTURE_PAGE = os.path.join(os.path.dirname(__file__), "fixtures", "fashion_studio_page.html")
 
 class TestExtractFunctions(unittest.TestCase):
     def test_get_page_url(self):
@@ -34,7 +47,7 @@ class TestExtractFunctions(unittest.TestCase):
         self.assertEqual(product["Gender"], "Unisex")
         self.assertIn("Timestamp", product)
 
-    @patch('utils.extract.requests.get')
+    @patch('utils.extract.fetch')
     def test_scrape_page_success(self, mock_get):
         """Test fungsi scrape_page dengan respons HTML yang mengandung produk."""
         html = """
@@ -60,7 +73,7 @@ class TestExtractFunctions(unittest.TestCase):
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0]["Title"], "Test Product")
 
-    @patch('utils.extract.requests.get')
+    @patch('utils.extract.fetch')
     def test_scrape_page_no_products(self, mock_get):
         """Test fungsi scrape_page saat tidak ada produk ditemukan."""
         html = "<html><body><p>Tidak ada produk di sini</p></body></html>"
@@ -70,7 +83,7 @@ class TestExtractFunctions(unittest.TestCase):
         result = scrape_page(1)
         self.assertEqual(result, [])
 
-    @patch('utils.extract.requests.get')
+    @patch('utils.extract.fetch')
     def test_extract_data(self, mock_get):
         """
         Test fungsi extract_data dengan menghasilkan 1 produk per halaman.
@@ -95,4 +108,257 @@ class TestExtractFunctions(unittest.TestCase):
         mock_get.return_value = fake_response
         with patch('utils.extract.time.sleep', return_value=None):
             result = extract_data(1, 3)
-        self.assertEqual(len(result), 3)
\ No newline at end of file
+        self.assertEqual(len(result), 3)
+
+
+class TestConcurrentExtract(unittest.TestCase):
+    def setUp(self):
+        self.server = MockFashionServer(total_pages=8, products_per_page=3, latency=0.1).start()
+        self.base_url_patch = patch('utils.extract.BASE_URL', self.server.base_url)
+        self.base_url_patch.start()
+
+    def tearDown(self):
+        self.base_url_patch.stop()
+        self.server.stop()
+
+    def test_extract_data_concurrent_keeps_page_order(self):
+        """Test extract_data konkuren mengembalikan produk sesuai urutan halaman."""
+        sequential = extract_data(1, 8, max_workers=1, rate_limit=None)
+        concurrent = extract_data(1, 8, max_workers=4, rate_limit=None)
+
+        self.assertEqual(len(concurrent), 24)
+        self.assertEqual(
+            [product["Title"] for product in concurrent],
+            [product["Title"] for product in sequential],
+        )
+
+    def test_extract_data_concurrency_reduces_wall_clock(self):
+        """Test waktu ekstraksi turun seiring bertambahnya worker."""
+        started = time.perf_counter()
+        extract_data(1, 8, max_workers=1, rate_limit=None)
+        sequential_time = time.perf_counter() - started
+
+        started = time.perf_counter()
+        extract_data(1, 8, max_workers=8, rate_limit=None)
+        concurrent_time = time.perf_counter() - started
+
+        self.assertLess(concurrent_time, sequential_time / 2)
+
+    def test_extract_data_respects_rate_limit(self):
+        """Test rate limit per host tetap berlaku walaupun worker banyak."""
+        started = time.perf_counter()
+        extract_data(1, 4, max_workers=4, rate_limit=10, burst=1)
+        elapsed = time.perf_counter() - started
+
+        self.assertGreaterEqual(elapsed, 0.3)
+        self.assertEqual(self.server.request_count, 4)
+
+
+class TestCachedExtract(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache = ResponseCache(os.path.join(self.tmpdir.name, "cache.sqlite"))
+        self.server = MockFashionServer(total_pages=3, products_per_page=2).start()
+        self.base_url_patch = patch('utils.extract.BASE_URL', self.server.base_url)
+        self.base_url_patch.start()
+
+    def tearDown(self):
+        self.base_url_patch.stop()
+        self.server.stop()
+        self.cache.close()
+        self.tmpdir.cleanup()
+
+    def test_unchanged_pages_use_conditional_requests(self):
+        """Test run kedua memakai If-None-Match dan tidak mem-parsing ulang halaman."""
+        first = extract_data(1, 3, rate_limit=None, cache=self.cache)
+
+        with patch('utils.extract.BeautifulSoup') as mock_soup:
+            second = extract_data(1, 3, rate_limit=None, cache=self.cache)
+            mock_soup.assert_not_called()
+
+        self.assertEqual(self.server.not_modified_count, 3)
+        self.assertEqual(
+            [product["Title"] for product in second],
+            [product["Title"] for product in first],
+        )
+
+    def test_changed_page_is_parsed_again(self):
+        """Test halaman yang berubah di-parse ulang dan cache diperbarui."""
+        extract_data(1, 1, rate_limit=None, cache=self.cache)
+        self.server.pages[1] = "<html><body><p>Kosong</p></body></html>"
+
+        result = extract_data(1, 1, rate_limit=None, cache=self.cache)
+
+        self.assertEqual(result, [])
+        self.assertEqual(self.server.not_modified_count, 0)
+        self.assertEqual(self.cache.get(self.server.base_url).products, [])
+
+    def test_records_path_matches_dict_path(self):
+        """Test extract_data(as_records=True) menghasilkan RawProduct yang sama dengan jalur dict, juga dari cache."""
+        as_dicts = extract_data(1, 3, rate_limit=None)
+        fresh = extract_data(1, 3, rate_limit=None, cache=self.cache, as_records=True)
+        cached = extract_data(1, 3, rate_limit=None, cache=self.cache, as_records=True)
+
+        self.assertTrue(all(type(product) is RawProduct for product in fresh + cached))
+        self.assertEqual(self.server.not_modified_count, 3)
+        self.assertIsInstance(self.cache.get(self.server.base_url).products[0], dict)
+        for records in (fresh, cached):
+            self.assertEqual(
+                [{**product, "Timestamp": None} for product in to_dicts(records)],
+                [{**product, "Timestamp": None} for product in as_dicts],
+            )
+
+
+class TestResumableExtract(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.journal = RunJournal(os.path.join(self.tmpdir.name, "journal"))
+        self.server = MockFashionServer(total_pages=2, products_per_page=2).start()
+        self.base_url_patch = patch('utils.extract.BASE_URL', self.server.base_url)
+        self.base_url_patch.start()
+        self.sleep_patch = patch('utils.extract.time.sleep')
+        self.sleep_patch.start()
+
+    def tearDown(self):
+        self.sleep_patch.stop()
+        self.base_url_patch.stop()
+        self.server.stop()
+        self.tmpdir.cleanup()
+
+    def test_failed_page_is_not_empty_page(self):
+        """Test scrape_page_checked melempar error untuk halaman gagal, bukan list kosong."""
+        self.server.pages[1] = "<html><body><p>Kosong</p></body></html>"
+
+        self.assertEqual(scrape_page_checked(1), [])
+        with self.assertRaises(Exception):
+            scrape_page_checked(3)
+        self.assertEqual(scrape_page(3), [])
+
+    def test_resume_fetches_only_missing_or_failed_pages(self):
+        """Test resume hanya mengambil halaman yang gagal lalu menggabungkan hasil dari journal."""
+        first = extract_data(1, 3, rate_limit=None, journal=self.journal, retry_rounds=0)
+        self.assertEqual(len(first), 4)
+        self.assertEqual(self.journal.failed(), [3])
+
+        self.server.total_pages = 3
+        self.server.request_count = 0
+        resumed = extract_data(1, 3, rate_limit=None, journal=self.journal, resume=True)
+
+        self.assertEqual(self.server.request_count, 1)
+        self.assertEqual(len(resumed), 6)
+        self.assertEqual(self.journal.failed(), [])
+        self.assertEqual(resumed[:4], first)
+
+    def test_resume_with_records_reads_journal(self):
+        """Test resume dengan as_records=True mengembalikan RawProduct, termasuk halaman dari journal."""
+        first = extract_data(1, 2, rate_limit=None, journal=self.journal, as_records=True)
+        resumed = extract_data(1, 2, rate_limit=None, journal=self.journal, resume=True, as_records=True)
+
+        self.assertEqual(self.server.request_count, 2)
+        self.assertEqual(resumed, first)
+        self.assertTrue(all(type(product) is RawProduct for product in resumed))
+
+    def test_stops_after_consecutive_empty_pages(self):
+        """Test ekstraksi berhenti setelah beberapa halaman kosong/404 berturut-turut."""
+        report = ExtractReport()
+        result = extract_data(1, 20, rate_limit=None, empty_page_limit=2, report=report)
+
+        self.assertEqual(len(result), 4)
+        self.assertEqual(self.server.request_count, 4)
+        self.assertEqual((report.stopped_at, report.products), (4, 4))
+        self.assertFalse(report.complete)
+
+    def test_report_lists_pages_still_failing(self):
+        """Test report mencatat halaman yang tetap gagal setelah retry; run tanpa kegagalan dianggap lengkap."""
+        def failing(page, **kwargs):
+            if page == 2:
+                raise ConnectionError("putus")
+            return scrape_page_checked(page, **kwargs)
+
+        report = ExtractReport()
+        with patch('utils.extract.scrape_page_checked', side_effect=failing):
+            extract_data(1, 2, rate_limit=None, retry_rounds=1, report=report)
+        self.assertEqual((report.failed, report.products), ([2], 2))
+        self.assertFalse(report.complete)
+
+        extract_data(1, 2, rate_limit=None, report=report)
+        self.assertEqual(report.failed, [])
+        self.assertTrue(report.complete)
+
+    def test_retry_queue_recovers_transient_failures(self):
+        """Test halaman yang gagal sementara dicoba ulang setelah putaran utama."""
+        failures = {2: 1}
+
+        def flaky(page, **kwargs):
+            if failures.get(page):
+                failures[page] -= 1
+                raise ConnectionError("putus")
+            return scrape_page_checked(page, **kwargs)
+
+        with patch('utils.extract.scrape_page_checked', side_effect=flaky) as mock_scrape:
+            result = extract_data(1, 2, rate_limit=None, journal=self.journal, retry_rounds=1)
+
+        self.assertEqual([call.args[0] for call in mock_scrape.call_args_list], [1, 2, 2])
+        self.assertEqual(len(result), 4)
+        self.assertEqual(self.journal.get(2).attempts, 2)
+
+
+class TestParserBackends(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        with open(FIXTURE_PAGE, encoding="utf-8") as file:
+            cls.html = file.read()
+        cards = BeautifulSoup(cls.html, 'html.parser').select('.collection-card')
+        cls.reference = cls.strip_timestamps([parse_product(card) for card in cards])
+
+    @staticmethod
+    def strip_timestamps(products):
+        return [{key: value for key, value in product.items() if key != "Timestamp"} for product in products]
+
+    def test_reference_parser_golden_values(self):
+        """Test backend referensi menghasilkan nilai yang diharapkan dari halaman fixture."""
+        self.assertEqual(len(self.reference), 21)
+        self.assertEqual(self.reference[0], {
+            "Title": "Hoodie 1",
+            "Price": "$47.01",
+            "Rating": "⭐ 2.3 / 5",
+            "Colors": "2 Colors",
+            "Size": "M",
+            "Gender": "Women",
+        })
+        self.assertEqual(self.reference[18]["Price"], "N/A")
+        self.assertEqual(self.reference[18]["Rating"], "Price Unavailable")
+        self.assertEqual(self.reference[19]["Colors"], "N/A")
+        self.assertEqual(set(self.reference[20].values()), {"N/A"})
+
+    def test_backends_match_reference(self):
+        """Test setiap backend yang tersedia menghasilkan field yang sama persis dengan html.parser."""
+        for backend in available_parser_backends():
+            with self.subTest(backend=backend):
+                self.assertEqual(self.strip_timestamps(parse_page(self.html, backend)), self.reference)
+
+    def test_batch_shares_timestamp(self):
+        """Test parse_page_batch memakai satu timestamp per halaman atau timestamp run yang diberikan."""
+        records = parse_page_batch(self.html)
+        self.assertEqual(len({record.Timestamp for record in records}), 1)
+
+        records = parse_page_batch(self.html, timestamp="2024-04-05T12:00:00")
+        self.assertEqual({record.Timestamp for record in records}, {"2024-04-05T12:00:00"})
+        self.assertEqual(self.strip_timestamps(to_dicts(records)), self.reference)
+
+    def test_typed_batch_matches_transform(self):
+        """Test hasil typed=True menghasilkan data bersih yang sama dengan transform_data atas parse_product."""
+        timestamp = "2024-04-05T12:00:00"
+        typed = parse_page_batch(self.html, timestamp=timestamp, typed=True)
+        self.assertTrue(all(isinstance(record, TypedProduct) for record in typed))
+        self.assertEqual(typed[0].Price, 47.01 * 16000)
+        self.assertEqual(typed[18].Rejected, "N/A")
+
+        expected = transform_data([{**product, "Timestamp": timestamp} for product in self.reference])
+        self.assertEqual(to_dicts(transform_records(typed)), expected)
+        self.assertEqual(transform_data(typed), expected)
+
+    def test_unknown_backend(self):
+        """Test parse_page menolak backend yang tidak dikenal."""
+        with self.assertRaises(ValueError):
+            parse_page(self.html, 'regex')
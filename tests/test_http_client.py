@@ -0,0 +1,93 @@
+import unittest
+from unittest.mock import patch, MagicMock
+import requests
+from utils.http_client import (
+    fetch, backoff_delay, create_session, get_fetch_stats, reset_fetch_stats
+)
+
+
+def make_response(status_code, headers=None):
+    response = MagicMock(status_code=status_code)
+    response.headers = headers or {}
+    return response
+
+
+class TestHttpClient(unittest.TestCase):
+    def setUp(self):
+        reset_fetch_stats()
+
+    def test_create_session_pool_size(self):
+        """Test create_session memasang adapter dengan ukuran pool sesuai parameter."""
+        session = create_session(pool_size=7)
+        adapter = session.get_adapter("https://fashion-studio.dicoding.dev/")
+        self.assertEqual(adapter._pool_maxsize, 7)
+        self.assertEqual(session.headers["Connection"], "keep-alive")
+
+    def test_backoff_delay_bounds(self):
+        """Test jeda backoff berada di antara 0 dan batas maksimum."""
+        for attempt in range(10):
+            delay = backoff_delay(attempt, factor=0.5, maximum=4)
+            self.assertGreaterEqual(delay, 0)
+            self.assertLessEqual(delay, min(4, 0.5 * 2 ** attempt))
+
+    @patch("utils.http_client.time.sleep")
+    def test_fetch_retries_on_5xx_and_timeout(self, mock_sleep):
+        """Test fetch mengulang request untuk timeout dan 5xx lalu mencatat statistik."""
+        session = MagicMock()
+        session.get.side_effect = [
+            requests.Timeout("lambat"),
+            make_response(503),
+            make_response(200),
+        ]
+
+        response = fetch("https://example.test/page2", session=session, max_retries=3)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(session.get.call_count, 3)
+        self.assertEqual(mock_sleep.call_count, 2)
+        stats = get_fetch_stats()["https://example.test/page2"]
+        self.assertEqual(stats.attempts, 3)
+        self.assertEqual(stats.retries, 2)
+        self.assertEqual(stats.status_code, 200)
+        self.assertEqual(len(stats.latencies), 3)
+
+    @patch("utils.http_client.time.sleep")
+    def test_fetch_honors_retry_after_on_429(self, mock_sleep):
+        """Test fetch menunggu minimal selama header Retry-After pada status 429."""
+        session = MagicMock()
+        session.get.side_effect = [make_response(429, {"Retry-After": "5"}), make_response(200)]
+
+        fetch("https://example.test/", session=session, backoff_factor=0.1)
+
+        self.assertGreaterEqual(mock_sleep.call_args[0][0], 5)
+
+    @patch("utils.http_client.time.sleep")
+    def test_fetch_returns_last_response_when_retries_exhausted(self, mock_sleep):
+        """Test fetch mengembalikan respons terakhir setelah retry habis."""
+        session = MagicMock()
+        session.get.return_value = make_response(500)
+
+        response = fetch("https://example.test/", session=session, max_retries=2)
+
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(session.get.call_count, 3)
+
+    @patch("utils.http_client.time.sleep")
+    def test_fetch_raises_timeout_when_retries_exhausted(self, mock_sleep):
+        """Test fetch meneruskan Timeout setelah seluruh percobaan gagal."""
+        session = MagicMock()
+        session.get.side_effect = requests.Timeout("lambat")
+
+        with self.assertRaises(requests.Timeout):
+            fetch("https://example.test/", session=session, max_retries=1)
+        self.assertEqual(get_fetch_stats()["https://example.test/"].attempts, 2)
+
+    def test_fetch_does_not_retry_client_errors(self):
+        """Test fetch tidak mengulang respons 404."""
+        session = MagicMock()
+        session.get.return_value = make_response(404)
+
+        response = fetch("https://example.test/page99", session=session)
+
+        self.assertEqual(response.status_code, 404)
+        session.get.assert_called_once()
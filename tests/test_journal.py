@@ -0,0 +1,65 @@
+import os
+import json
+import tempfile
+import unittest
+from utils.journal import RunJournal, STATUS_OK, STATUS_EMPTY, STATUS_FAILED
+
+products = [{"Title": "Shirt A", "Price": "$10", "Timestamp": "2024-04-05T12:00:00"}]
+
+
+class TestRunJournal(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "journal")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_record_distinguishes_failed_and_empty_pages(self):
+        """Test journal membedakan halaman berhasil, kosong, dan gagal."""
+        journal = RunJournal(self.path)
+        journal.record(1, products)
+        journal.record(2, [])
+        journal.record(3, [], error="Timeout saat mengakses halaman 3")
+
+        self.assertEqual(journal.get(1).status, STATUS_OK)
+        self.assertEqual(journal.get(2).status, STATUS_EMPTY)
+        self.assertEqual(journal.get(3).status, STATUS_FAILED)
+        self.assertEqual(journal.failed(), [3])
+
+    def test_records_survive_reopen(self):
+        """Test journal dibaca ulang dari disk dan hanya halaman yang hilang/gagal yang tertunda."""
+        journal = RunJournal(self.path)
+        journal.record(1, products)
+        journal.record(2, [], error="HTTP error (500) pada halaman 2")
+
+        reopened = RunJournal(self.path)
+
+        self.assertEqual(reopened.pending(range(1, 5)), [2, 3, 4])
+        self.assertEqual(reopened.products(range(1, 5)), products)
+
+    def test_attempts_are_counted(self):
+        """Test jumlah percobaan bertambah setiap halaman dicatat ulang."""
+        journal = RunJournal(self.path)
+        journal.record(1, [], error="gagal")
+        self.assertEqual(journal.record(1, products).attempts, 2)
+
+    def test_writes_are_atomic(self):
+        """Test tidak ada file sementara yang tertinggal dan entri rusak diabaikan."""
+        journal = RunJournal(self.path)
+        journal.record(1, products)
+        with open(os.path.join(self.path, "page-00002.json"), "w", encoding="utf-8") as file:
+            file.write('{"page": 2, "sta')
+
+        self.assertEqual(sorted(os.listdir(self.path)), ["page-00001.json", "page-00002.json"])
+        with open(os.path.join(self.path, "page-00001.json"), encoding="utf-8") as file:
+            self.assertEqual(json.load(file)["products"], products)
+        self.assertEqual(RunJournal(self.path).pending([1, 2]), [2])
+
+    def test_reset_clears_records(self):
+        """Test reset menghapus semua catatan halaman."""
+        journal = RunJournal(self.path)
+        journal.record(1, products)
+        journal.reset()
+
+        self.assertEqual(RunJournal(self.path).pending([1]), [1])
@@ -1,6 +1,15 @@
+import os
+import tempfile
 import unittest
 from unittest.mock import patch, MagicMock
-from utils.load import load_to_csv, load_to_google_sheets, load_to_postgresql
+import pandas as pd
+from sqlalchemy import create_engine as real_create_engine, text
+from benchmarks.fake_sheets import FakeSheetsService
+from utils.load import (
+    load_to_csv, load_to_google_sheets, load_to_postgresql, upsert_to_sql, dispose_engines,
+    sync_to_google_sheets, reset_sheets_service, load_to_parquet, read_columnar,
+    CsvStreamWriter, ParquetStreamWriter, PostgreSQLStreamWriter,
+)
 
 sample_data = [
     {
@@ -16,6 +25,10 @@ sample_data = [
 
 
 class TestLoad(unittest.TestCase):
+    def setUp(self):
+        dispose_engines()
+        reset_sheets_service()
+
     @patch("utils.load.pd.DataFrame.to_csv")
     def test_load_to_csv_success(self, mock_to_csv):
         """Test load_to_csv berhasil menyimpan file CSV tanpa error."""
@@ -61,4 +74,218 @@ class TestLoad(unittest.TestCase):
     def test_load_to_postgresql_error(self, mock_engine):
         """Test load_to_postgresql menangani error koneksi database."""
         load_to_postgresql(sample_data)
-        mock_engine.assert_called_once()
\ No newline at end of file
+        mock_engine.assert_called_once()
+
+
+class TestStreamWriters(unittest.TestCase):
+    def test_csv_stream_writer_appends_batches(self):
+        """Test CsvStreamWriter menulis header sekali lalu menambahkan batch berikutnya."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "products.csv")
+            writer = CsvStreamWriter(filename)
+            writer.write(sample_data)
+            writer.write([dict(sample_data[0], Title="Shirt B")])
+            writer.close()
+
+            df = pd.read_csv(filename)
+            self.assertEqual(df["Title"].tolist(), ["Shirt A", "Shirt B"])
+            self.assertEqual(writer.rows, 2)
+
+    @patch("utils.load.create_engine")
+    @patch("utils.load.pd.DataFrame.to_sql")
+    def test_postgresql_stream_writer_replaces_then_appends(self, mock_to_sql, mock_engine):
+        """Test PostgreSQLStreamWriter mengganti tabel pada batch pertama lalu append."""
+        dispose_engines()
+        writer = PostgreSQLStreamWriter("postgresql://test", mode="replace")
+        writer.write(sample_data)
+        writer.write(sample_data)
+
+        modes = [call.kwargs["if_exists"] for call in mock_to_sql.call_args_list]
+        self.assertEqual(modes, ["replace", "append"])
+        mock_engine.assert_called_once()
+
+
+class TestParquet(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = self.tmpdir.name
+        self.rows = [
+            sample_data[0],
+            dict(sample_data[0], Title="Shirt B", Timestamp="2024-04-06T08:30:00.123456"),
+        ]
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def partition_files(self):
+        return sorted(
+            os.path.relpath(os.path.join(directory, name), self.root)
+            for directory, _, names in os.walk(self.root) for name in names
+        )
+
+    def test_load_to_parquet_partitions_by_scrape_date(self):
+        """Test load_to_parquet menulis satu partisi per tanggal dengan tipe kolom yang benar."""
+        self.assertTrue(load_to_parquet(self.rows, root=self.root))
+
+        files = self.partition_files()
+        self.assertEqual([path.split(os.sep)[0] for path in files], ["scrape_date=2024-04-05", "scrape_date=2024-04-06"])
+        table = read_columnar(self.root)
+        self.assertEqual(str(table.schema.field("Price").type), "double")
+        self.assertEqual(str(table.schema.field("Colors").type), "int64")
+        self.assertEqual(str(table.schema.field("Timestamp").type), "timestamp[us]")
+        self.assertEqual(sorted(table.column("Title").to_pylist()), ["Shirt A", "Shirt B"])
+
+    def test_append_keeps_earlier_partitions(self):
+        """Test run berikutnya menambah file baru tanpa menulis ulang file lama."""
+        load_to_parquet(self.rows[:1], root=self.root)
+        first_file = os.path.join(self.root, self.partition_files()[0])
+        modified = os.path.getmtime(first_file)
+
+        load_to_parquet([dict(self.rows[0], Title="Shirt C")], root=self.root)
+
+        self.assertEqual(len(self.partition_files()), 2)
+        self.assertEqual(os.path.getmtime(first_file), modified)
+        self.assertEqual(read_columnar(self.root, dates=["2024-04-05"]).num_rows, 2)
+
+    def test_arrow_stream_writer_reads_selected_columns(self):
+        """Test ParquetStreamWriter format arrow dapat dibaca per kolom dengan memory map."""
+        writer = ParquetStreamWriter(self.root, format="arrow")
+        writer.write(self.rows[:1])
+        writer.write(self.rows[1:])
+        writer.close()
+
+        self.assertTrue(all(path.endswith(".arrow") for path in self.partition_files()))
+        table = read_columnar(self.root, columns=["Title", "Price"], format="arrow")
+        self.assertEqual(table.column_names, ["Title", "Price"])
+        self.assertEqual(table.column("Price").to_pylist(), [160000.0, 160000.0])
+
+    def test_load_to_parquet_without_root_is_skipped(self):
+        """Test load_to_parquet melewati output jika PARQUET_DIR tidak diatur."""
+        self.assertTrue(load_to_parquet(self.rows, root=None))
+
+
+class TestUpsert(unittest.TestCase):
+    def setUp(self):
+        dispose_engines()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.url = f"sqlite:///{os.path.join(self.tmpdir.name, 'fashion.db')}"
+
+    def tearDown(self):
+        dispose_engines()
+        self.tmpdir.cleanup()
+
+    def count_rows(self):
+        engine = real_create_engine(self.url)
+        with engine.connect() as conn:
+            count = conn.execute(text('SELECT COUNT(*) FROM fashion_data')).scalar()
+        engine.dispose()
+        return count
+
+    def test_upsert_only_writes_new_rows(self):
+        """Test upsert hanya menulis baris baru berdasarkan key unik transform_data."""
+        self.assertEqual(upsert_to_sql(sample_data, url=self.url), 1)
+        rerun = [dict(sample_data[0], Timestamp="2024-04-06T12:00:00"), dict(sample_data[0], Title="Shirt B")]
+
+        self.assertEqual(upsert_to_sql(rerun, url=self.url, batch_size=1), 1)
+        self.assertEqual(self.count_rows(), 2)
+
+    def test_upsert_update_timestamp(self):
+        """Test update_timestamp memperbarui Timestamp baris yang sudah ada."""
+        upsert_to_sql(sample_data, url=self.url)
+        upsert_to_sql([dict(sample_data[0], Timestamp="2024-04-06T12:00:00")], url=self.url, update_timestamp=True)
+
+        engine = real_create_engine(self.url)
+        with engine.connect() as conn:
+            timestamp = conn.execute(text('SELECT "Timestamp" FROM fashion_data')).scalar()
+        engine.dispose()
+        self.assertEqual(timestamp, "2024-04-06T12:00:00")
+
+    def test_load_to_postgresql_reuses_engine(self):
+        """Test engine dibuat sekali dan dipakai ulang antar pemanggilan."""
+        with patch("utils.load.create_engine", wraps=real_create_engine) as mock_engine:
+            load_to_postgresql(sample_data, url=self.url)
+            load_to_postgresql(sample_data, url=self.url)
+        mock_engine.assert_called_once()
+        self.assertEqual(self.count_rows(), 1)
+
+    def test_invalid_batch_size(self):
+        """Test upsert_to_sql menolak batch_size kurang dari 1."""
+        with self.assertRaises(ValueError):
+            upsert_to_sql(sample_data, url=self.url, batch_size=0)
+
+
+@unittest.skipUnless(os.getenv("TEST_POSTGRESQL_URL"), "TEST_POSTGRESQL_URL belum diatur")
+class TestPostgreSQLUpsert(unittest.TestCase):
+    def setUp(self):
+        dispose_engines()
+        self.url = os.getenv("TEST_POSTGRESQL_URL")
+        engine = real_create_engine(self.url)
+        with engine.begin() as conn:
+            conn.execute(text("DROP TABLE IF EXISTS fashion_data"))
+        engine.dispose()
+
+    def test_copy_upsert(self):
+        """Test jalur COPY + INSERT ... ON CONFLICT pada PostgreSQL sungguhan."""
+        rows = [dict(sample_data[0], Title=f"Shirt {index}") for index in range(10)]
+        self.assertEqual(upsert_to_sql(rows, url=self.url, batch_size=3), 10)
+        self.assertEqual(upsert_to_sql(rows + [dict(sample_data[0], Title="Shirt X")], url=self.url), 1)
+
+
+@patch("utils.load.GSHEET_RANGE", "Sheet1!A1")
+@patch("utils.load.GSHEET_SPREADSHEET_ID", "spreadsheet-test")
+class TestGoogleSheetsSync(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.snapshot = os.path.join(self.tmpdir.name, "sheets_snapshot.json")
+        self.service = FakeSheetsService()
+        self.rows = [dict(sample_data[0], Title=f"Shirt {index}") for index in range(10)]
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def sync(self, rows, **kwargs):
+        kwargs.setdefault("write_rate", 1000)
+        return sync_to_google_sheets(rows, self.snapshot, service=self.service, **kwargs)
+
+    def expected_rows(self, rows):
+        df = pd.DataFrame(rows)
+        return [df.columns.tolist()] + df.values.tolist()
+
+    def test_first_sync_pushes_everything_in_chunks(self):
+        """Test sinkronisasi pertama mengirim semua baris dalam beberapa batchUpdate."""
+        sent = self.sync(self.rows, chunk_rows=4)
+
+        self.assertEqual(sent, 11)
+        self.assertEqual(len(self.service.requests), 3)
+        self.assertEqual(self.service.rows(), self.expected_rows(self.rows))
+
+    def test_second_sync_sends_only_changes(self):
+        """Test sinkronisasi berikutnya hanya mengirim baris yang berubah dan mengosongkan baris yang hilang."""
+        self.sync(self.rows)
+        self.service.requests.clear()
+        changed = list(self.rows[:8])
+        changed[3] = dict(changed[3], Price=1.0)
+
+        sent = self.sync(changed)
+
+        ranges = [entry["range"] for entry in self.service.requests[0][1]["data"]]
+        self.assertEqual(ranges, ["Sheet1!A5:G5", "Sheet1!A10:G11"])
+        self.assertEqual(sent, 3)
+        self.assertEqual(self.service.rows(), self.expected_rows(changed))
+
+    def test_unchanged_data_sends_nothing(self):
+        """Test data yang tidak berubah tidak memicu request apa pun."""
+        self.sync(self.rows)
+        self.service.requests.clear()
+
+        self.assertEqual(self.sync(self.rows), 0)
+        self.assertEqual(self.service.requests, [])
+
+    @patch("utils.load.get_sheets_service")
+    def test_load_to_google_sheets_uses_sync_with_snapshot(self, mock_service):
+        """Test load_to_google_sheets memakai mode diff jika snapshot_path diatur."""
+        mock_service.return_value = self.service
+
+        self.assertTrue(load_to_google_sheets(self.rows, snapshot_path=self.snapshot))
+        self.assertEqual(self.service.requests[0][0], "batchUpdate")
+        self.assertTrue(os.path.exists(self.snapshot))
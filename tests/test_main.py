@@ -0,0 +1,210 @@
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest.mock import MagicMock, patch
+import main
+from benchmarks.mock_server import MockFashionServer
+from main import cli, parse_args
+from utils.extract import scrape_page_checked
+from utils.sinks import SINKS, register_sink
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestParseArgs(unittest.TestCase):
+    def assert_rejected(self, argv):
+        with redirect_stderr(io.StringIO()) as stderr, self.assertRaises(SystemExit) as raised:
+            parse_args(argv)
+        self.assertEqual(raised.exception.code, 2)
+        return stderr.getvalue()
+
+    def test_unknown_sink_is_rejected(self):
+        """Test sink yang tidak terdaftar ditolak dengan pesan yang menyebut sink tersebut."""
+        message = self.assert_rejected(["--sinks", "csv,bigquery"])
+        self.assertIn("bigquery", message)
+
+    def test_end_page_before_start_page_is_rejected(self):
+        """Test --end-page yang lebih kecil dari --start-page ditolak."""
+        self.assert_rejected(["--start-page", "5", "--end-page", "3"])
+
+    def test_invalid_extract_options_are_rejected(self):
+        """Test --extract-workers dan --burst di bawah 1 ditolak."""
+        self.assert_rejected(["--extract-workers", "0"])
+        self.assert_rejected(["--burst", "0"])
+
+    def test_defaults_come_from_environment(self):
+        """Test nilai default mengikuti konstanta dari environment variable."""
+        with patch("main.ETL_SINKS", ["csv"]), patch("main.EXTRACT_END_PAGE", 7), \
+                patch("main.EXTRACT_RATE_LIMIT", 2.0), patch("main.ETL_STREAM", True):
+            args = parse_args([])
+
+        self.assertEqual(args.sinks, ["csv"])
+        self.assertEqual(args.end_page, 7)
+        self.assertEqual(args.rate_limit, 2.0)
+        self.assertTrue(args.stream)
+
+    def test_zero_rate_limit_means_unlimited(self):
+        """Test --rate-limit 0 berarti tanpa batas (None)."""
+        args = parse_args(["--rate-limit", "0", "--sinks", " csv , parquet "])
+
+        self.assertIsNone(args.rate_limit)
+        self.assertEqual(args.sinks, ["csv", "parquet"])
+
+
+class TestCli(unittest.TestCase):
+    def test_worker_flag_runs_worker_only(self):
+        """Test --worker menjalankan worker antrean dengan opsi extract, bukan ETL."""
+        with patch("main.work", return_value=0) as mock_work, patch("main.main") as mock_main:
+            status = cli(["--worker", "--rate-limit", "3", "--burst", "2"])
+
+        self.assertEqual(status, 0)
+        mock_main.assert_not_called()
+        mock_work.assert_called_once_with(extract={"workers": main.EXTRACT_WORKERS, "rate_limit": 3.0, "burst": 2})
+
+    def test_options_are_passed_to_main(self):
+        """Test argumen diteruskan ke main saat tidak ada jadwal."""
+        with patch("main.main", return_value=0) as mock_main, patch("main.serve") as mock_serve:
+            cli(["--sinks", "csv", "--start-page", "2", "--end-page", "4", "--no-stream", "--workers", "0"])
+
+        mock_serve.assert_not_called()
+        stream = mock_main.call_args.args[0]
+        options = mock_main.call_args.kwargs
+        self.assertFalse(stream)
+        self.assertEqual(options["sinks"], ["csv"])
+        self.assertEqual((options["start_page"], options["end_page"], options["workers"]), (2, 4, 0))
+
+    def test_schedule_runs_daemon(self):
+        """Test --interval menjalankan mode daemon."""
+        with patch("main.serve", return_value=0) as mock_serve, patch("main.main") as mock_main:
+            cli(["--interval", "60"])
+
+        mock_main.assert_not_called()
+        mock_serve.assert_called_once()
+
+
+class TestRunEtl(unittest.TestCase):
+    def test_no_pages_discovered_is_an_error(self):
+        """Test run gagal (status 1) jika jumlah halaman yang ditemukan kurang dari 1."""
+        with patch("main.discover_last_page", return_value=0), patch("main.extract_data") as mock_extract, \
+                redirect_stdout(io.StringIO()):
+            status = main.run_etl(stream=False, sinks=["csv"], end_page=None)
+
+        self.assertEqual(status, 1)
+        mock_extract.assert_not_called()
+
+    def test_cache_opened_by_run_is_closed(self):
+        """Test cache yang dibuka run_etl sendiri ditutup, sedangkan cache dari pemanggil dibiarkan terbuka."""
+        with patch("main.open_cache") as mock_open, patch("main.discover_last_page", return_value=0), \
+                redirect_stdout(io.StringIO()):
+            main.run_etl(stream=False, sinks=["csv"], end_page=None)
+            shared = MagicMock()
+            main.run_etl(stream=False, cache=shared, sinks=["csv"], end_page=None)
+
+        mock_open.return_value.close.assert_called_once()
+        mock_open.assert_called_once()
+        shared.close.assert_not_called()
+
+
+class TestIncrementalRun(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.server = MockFashionServer(total_pages=3, products_per_page=3).start()
+        self.received = []
+        self.patches = [
+            patch("utils.extract.BASE_URL", self.server.base_url),
+            patch("utils.extract.time.sleep"),
+            patch("main.CDC_INDEX_PATH", os.path.join(self.tmpdir.name, "cdc.db")),
+            patch("main.HTTP_CACHE_PATH", None),
+            patch.dict(SINKS, clear=True),
+        ]
+        for active in self.patches:
+            active.start()
+        register_sink("memory", lambda data: self.received.append(len(data)), incremental=True)
+
+    def tearDown(self):
+        for active in reversed(self.patches):
+            active.stop()
+        self.server.stop()
+        self.tmpdir.cleanup()
+
+    def run_etl(self):
+        extract = {"workers": None, "rate_limit": None, "burst": 1}
+        with redirect_stdout(io.StringIO()):
+            return main.run_etl(stream=False, sinks=["memory"], end_page=3, workers=0, extract=extract)
+
+    def test_failed_page_is_not_resent_on_next_run(self):
+        """Test produk dari halaman yang gagal tidak dianggap hilang sehingga tidak dikirim ulang sebagai baru."""
+        self.assertEqual(self.run_etl(), 0)
+
+        def failing(page, **kwargs):
+            if page == 2:
+                raise ConnectionError("putus")
+            return scrape_page_checked(page, **kwargs)
+
+        with patch("utils.extract.scrape_page_checked", side_effect=failing):
+            self.run_etl()
+        self.assertEqual(self.run_etl(), 0)
+
+        self.assertEqual(self.received, [9, 0, 0])
+
+
+class TestStreamSinks(unittest.TestCase):
+    def setUp(self):
+        self.server = MockFashionServer(total_pages=2, products_per_page=3).start()
+        self.patches = [
+            patch("utils.extract.BASE_URL", self.server.base_url),
+            patch("main.PARSE_PROCESSES", 0),
+            patch.dict(SINKS, clear=True),
+        ]
+        for active in self.patches:
+            active.start()
+
+    def tearDown(self):
+        for active in reversed(self.patches):
+            active.stop()
+        self.server.stop()
+
+    def test_registered_sink_receives_rows_in_stream_mode(self):
+        """Test sink yang didaftarkan dengan stream_writer ikut menerima baris pada mode stream."""
+        rows, closed = [], []
+
+        class MemoryWriter:
+            def write(self, batch):
+                rows.extend(batch)
+
+            def close(self):
+                closed.append(True)
+
+        register_sink("memory", lambda data: True, stream_writer=MemoryWriter)
+        register_sink("batch_only", lambda data: True)
+        extract = {"workers": None, "rate_limit": None, "burst": 1}
+
+        with redirect_stdout(io.StringIO()):
+            status = main.main_stream(end_page=2, sinks=None, extract=extract)
+            explicit = main.main_stream(end_page=2, sinks=["memory", "batch_only"], extract=extract)
+
+        self.assertEqual(status, 0)
+        self.assertEqual(explicit, 2)
+        self.assertEqual(len(rows), 12)
+        self.assertEqual(closed, [True, True])
+
+
+class TestImport(unittest.TestCase):
+    def test_import_does_not_load_sink_dependencies(self):
+        """Test `import main` tidak memuat pandas, SQLAlchemy, pyarrow, atau client Google."""
+        code = (
+            "import sys, main; "
+            "print(','.join(name for name in ('pandas', 'pyarrow', 'sqlalchemy', 'googleapiclient') if name in sys.modules))"
+        )
+        completed = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True)
+
+        self.assertEqual(completed.returncode, 0, completed.stderr)
+        self.assertEqual(completed.stdout.strip(), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
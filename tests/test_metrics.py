@@ -0,0 +1,110 @@
+import os
+import json
+import tempfile
+import unittest
+from unittest.mock import patch
+from benchmarks.mock_server import MockFashionServer
+from utils.extract import extract_data
+from utils.metrics import RunMetrics, active_metrics, disable_metrics, enable_metrics
+from utils.sinks import SINKS, register_sink, run_sinks
+from utils.transform import transform_data
+
+
+def raw_item(**overrides):
+    item = {"Title": "Shirt A", "Price": "$10.00", "Rating": "⭐ 4.5 / 5", "Colors": "3 Colors",
+            "Size": "M", "Gender": "Men", "Timestamp": "2024-04-05T12:00:00"}
+    item.update(overrides)
+    return item
+
+
+class TestRunMetrics(unittest.TestCase):
+    def test_report_and_prometheus_format(self):
+        """Test counter dan ringkasan muncul di laporan JSON dan format Prometheus."""
+        metrics = RunMetrics()
+        metrics.increment("transform_rows_in", 3)
+        metrics.observe("load_seconds", 0.5, sink="csv")
+        metrics.observe("load_seconds", 1.5, sink="csv")
+        metrics.record_page(2, fetch_seconds=0.1, bytes=2048)
+
+        report = metrics.report()
+        self.assertEqual(report["counters"], {"transform_rows_in": 3})
+        self.assertEqual(report["summaries"]['load_seconds{sink="csv"}']["mean"], 1.0)
+        self.assertEqual(report["pages"]["2"], {"fetch_seconds": 0.1, "bytes": 2048})
+
+        text = metrics.to_prometheus()
+        self.assertIn("# TYPE etl_transform_rows_in counter\netl_transform_rows_in 3\n", text)
+        self.assertIn('etl_load_seconds_count{sink="csv"} 2\n', text)
+        self.assertIn('etl_load_seconds_sum{sink="csv"} 2.0\n', text)
+
+    def test_write_files(self):
+        """Test laporan JSON dan file Prometheus ditulis ke path yang diberikan."""
+        metrics = RunMetrics()
+        metrics.increment("transform_rows_out", 1)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            report_path = os.path.join(tmpdir, "report.json")
+            prometheus_path = os.path.join(tmpdir, "metrics.prom")
+            metrics.write(report_path, prometheus_path)
+
+            with open(report_path, encoding="utf-8") as file:
+                self.assertEqual(json.load(file)["counters"], {"transform_rows_out": 1})
+            with open(prometheus_path, encoding="utf-8") as file:
+                self.assertIn("etl_transform_rows_out 1", file.read())
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        self.metrics = enable_metrics()
+
+    def tearDown(self):
+        disable_metrics()
+
+    def test_disabled_by_default(self):
+        """Test tidak ada metrik yang dicatat setelah pengumpulan dimatikan."""
+        disable_metrics()
+        self.assertIsNone(active_metrics())
+        transform_data([raw_item()])
+        self.assertEqual(self.metrics.counters, {})
+
+    def test_transform_drop_reasons(self):
+        """Test baris yang dibuang dihitung per alasan dan kategori INVALID_VALUES."""
+        transform_data([
+            raw_item(),
+            raw_item(),
+            raw_item(Title="Unknown Product"),
+            raw_item(Rating="Invalid Rating"),
+            raw_item(Price="Price Unavailable"),
+            raw_item(Price="Rp 10"),
+        ])
+
+        counters = self.metrics.report()["counters"]
+        self.assertEqual(counters["transform_rows_in"], 6)
+        self.assertEqual(counters["transform_rows_out"], 1)
+        self.assertEqual(counters['transform_dropped_rows{reason="duplicate"}'], 1)
+        self.assertEqual(counters['transform_dropped_rows{category="Unknown Product",reason="invalid_value"}'], 1)
+        self.assertEqual(counters['transform_dropped_rows{category="Invalid Rating",reason="invalid_value"}'], 1)
+        self.assertEqual(counters['transform_dropped_rows{category="Price Unavailable",reason="invalid_value"}'], 1)
+        self.assertEqual(counters['transform_dropped_rows{reason="unparsable_price"}'], 1)
+
+    def test_fetch_and_parse_per_page(self):
+        """Test latensi fetch, ukuran respons, dan waktu parsing dicatat per halaman."""
+        with MockFashionServer(total_pages=2, products_per_page=3) as server, \
+                patch("utils.extract.BASE_URL", server.base_url):
+            extract_data(1, 2, rate_limit=None)
+
+        report = self.metrics.report()
+        self.assertEqual(sorted(report["pages"]), ["1", "2"])
+        for page in report["pages"].values():
+            self.assertGreater(page["bytes"], 0)
+            self.assertEqual(page["cards"], 3)
+            self.assertIn("fetch_seconds", page)
+            self.assertIn("parse_seconds", page)
+        self.assertEqual(report["summaries"]["parse_card_seconds"]["count"], 6)
+        self.assertEqual(report["counters"]["parsed_cards"], 6)
+
+    def test_sink_durations(self):
+        """Test durasi setiap sink dicatat beserta statusnya."""
+        with patch.dict(SINKS, clear=True):
+            register_sink("memory", lambda data: True)
+            run_sinks([{"Title": "Shirt A"}])
+
+        self.assertEqual(self.metrics.report()["summaries"]['load_seconds{ok="true",sink="memory"}']["count"], 1)
@@ -0,0 +1,109 @@
+import os
+import tempfile
+import unittest
+import requests
+from unittest.mock import patch
+from benchmarks.mock_server import MockFashionServer, render_card
+from utils.pagination import parse_last_page, probe_last_page, discover_last_page
+
+FIXTURE_PAGE = os.path.join(os.path.dirname(__file__), "fixtures", "fashion_studio_page.html")
+
+
+class TestParseLastPage(unittest.TestCase):
+    def test_page_of_text(self):
+        """Test halaman terakhir dibaca dari teks "Page X of N"."""
+        with open(FIXTURE_PAGE, encoding="utf-8") as file:
+            self.assertEqual(parse_last_page(file.read()), 50)
+
+    def test_page_links(self):
+        """Test nomor link /page{n} terbesar dipakai jika teks tidak ada."""
+        html = (
+            '<ul class="pagination"><li><a href="/page2">2</a></li>'
+            '<li><a href="/page7">7</a></li><li><a href="/page3">Next</a></li></ul>'
+        )
+        self.assertEqual(parse_last_page(html), 7)
+
+    def test_no_pagination(self):
+        """Test None dikembalikan jika halaman tidak memiliki pagination."""
+        self.assertIsNone(parse_last_page("<html><body><p>Kosong</p></body></html>"))
+
+
+class TestProbeLastPage(unittest.TestCase):
+    def probe(self, last_page, hint=1):
+        calls = []
+
+        def exists(page):
+            calls.append(page)
+            return page <= last_page
+
+        return probe_last_page(exists, hint=hint, limit=10000), calls
+
+    def test_exponential_then_binary_search(self):
+        """Test probing menemukan halaman terakhir dengan jumlah request logaritmik."""
+        for last_page in [0, 1, 2, 37, 50, 1000]:
+            result, calls = self.probe(last_page)
+            self.assertEqual(result, last_page)
+            self.assertLessEqual(len(calls), 2 * max(last_page, 1).bit_length() + 2)
+
+    def test_hint_from_previous_run(self):
+        """Test hint yang masih tepat hanya membutuhkan dua request."""
+        self.assertEqual(self.probe(50, hint=50), (50, [50, 51]))
+        self.assertEqual(self.probe(30, hint=50)[0], 30)
+        self.assertEqual(self.probe(64, hint=50)[0], 64)
+
+
+class TestDiscoverLastPage(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.tmpdir.name, "page_count.json")
+        self.server = MockFashionServer(total_pages=12, products_per_page=1).start()
+        self.base_url_patch = patch("utils.extract.BASE_URL", self.server.base_url)
+        self.base_url_patch.start()
+
+    def tearDown(self):
+        self.base_url_patch.stop()
+        self.server.stop()
+        self.tmpdir.cleanup()
+
+    def test_uses_pagination_and_caches_result(self):
+        """Test jumlah halaman dibaca dari pagination lalu dipakai ulang dari cache."""
+        self.assertEqual(discover_last_page(self.cache_path), 12)
+        self.assertEqual(self.server.request_count, 1)
+
+        self.assertEqual(discover_last_page(self.cache_path), 12)
+        self.assertEqual(self.server.request_count, 1)
+
+    def test_probes_when_pagination_missing(self):
+        """Test probing dipakai jika halaman 1 tidak memiliki pagination."""
+        self.server.pages[1] = f"<html><body>{render_card(1)}</body></html>"
+
+        self.assertEqual(discover_last_page(self.cache_path), 12)
+
+    def test_expired_cache_is_refreshed(self):
+        """Test cache yang kedaluwarsa ditemukan ulang setelah katalog bertambah."""
+        discover_last_page(self.cache_path)
+        self.server.total_pages = 20
+
+        self.assertEqual(discover_last_page(self.cache_path, ttl=0), 20)
+
+    def test_unreachable_site_raises_and_is_not_cached(self):
+        """Test error 5xx saat probing dilempar dan jumlah halaman tidak disimpan ke cache."""
+        self.server.error_rate = 1.0
+
+        with patch("utils.http_client.time.sleep"), self.assertRaises(requests.HTTPError):
+            discover_last_page(self.cache_path)
+        self.assertFalse(os.path.exists(self.cache_path))
+
+    def test_refused_connection_raises(self):
+        """Test koneksi yang ditolak tidak dianggap halaman kosong."""
+        with patch("utils.extract.BASE_URL", "http://127.0.0.1:9/"), patch("utils.http_client.time.sleep"), \
+                self.assertRaises(requests.ConnectionError):
+            discover_last_page(self.cache_path)
+        self.assertFalse(os.path.exists(self.cache_path))
+
+    def test_empty_catalog_is_not_cached(self):
+        """Test katalog tanpa halaman menghasilkan 0 tetapi 0 tidak pernah disimpan ke cache."""
+        self.server.total_pages = 0
+
+        self.assertEqual(discover_last_page(self.cache_path), 0)
+        self.assertFalse(os.path.exists(self.cache_path))
@@ -0,0 +1,139 @@
+import time
+import threading
+import unittest
+from unittest.mock import patch, MagicMock
+from benchmarks.mock_server import MockFashionServer
+from utils.extract import iter_pages
+from utils.pipeline import StagedExtractor, rebatch, run_stream
+from utils.sinks import exit_status
+
+
+def make_page(*titles):
+    return [
+        {"Title": title, "Price": "$10", "Rating": "4.5", "Colors": "3 Colors",
+         "Size": "M", "Gender": "Unisex", "Timestamp": "2024-04-05T12:00:00"}
+        for title in titles
+    ]
+
+
+class TestPipeline(unittest.TestCase):
+    def test_rebatch(self):
+        """Test rebatch() membagi aliran batch menjadi ukuran tetap."""
+        batches = list(rebatch(iter([[1, 2, 3], [], [4], [5, 6, 7, 8]]), batch_size=3))
+        self.assertEqual(batches, [[1, 2, 3], [4, 5, 6], [7, 8]])
+
+    def test_rebatch_invalid_size(self):
+        """Test rebatch() menolak batch_size kurang dari 1."""
+        with self.assertRaises(ValueError):
+            list(rebatch(iter([[1]]), batch_size=0))
+
+    def test_rebatch_flushes_after_interval(self):
+        """Test baris yang tertahan dikirim setelah flush_seconds walaupun batch belum penuh."""
+        def slow_pages():
+            for page in ([1], [2], [3]):
+                time.sleep(0.06)
+                yield page
+
+        batches = list(rebatch(slow_pages(), batch_size=100, flush_seconds=0.1))
+        self.assertEqual(batches, [[1, 2], [3]])
+        self.assertEqual(list(rebatch(slow_pages(), batch_size=100, flush_seconds=None)), [[1, 2, 3]])
+
+    @patch("utils.pipeline.iter_pages")
+    def test_run_stream_flushes_batches(self, mock_iter_pages):
+        """Test run_stream() mengirim batch ke setiap writer lalu menutupnya."""
+        mock_iter_pages.return_value = iter([make_page("A", "B"), make_page("C")])
+        writer = MagicMock()
+
+        total = run_stream({"CSV": writer}, batch_size=2, start_page=1, end_page=2)
+
+        self.assertEqual(total, 3)
+        self.assertEqual([len(call.args[0]) for call in writer.write.call_args_list], [2, 1])
+        writer.close.assert_called_once()
+        mock_iter_pages.assert_called_once_with(start_page=1, end_page=2)
+
+    @patch("utils.pipeline.iter_pages")
+    def test_run_stream_disables_failing_writer(self, mock_iter_pages):
+        """Test writer yang gagal dinonaktifkan tanpa menghentikan writer lain."""
+        mock_iter_pages.return_value = iter([make_page("A"), make_page("B")])
+        failing = MagicMock()
+        failing.write.side_effect = Exception("DB error")
+        healthy = MagicMock()
+
+        results = {}
+        run_stream({"PostgreSQL": failing, "CSV": healthy}, batch_size=1, results=results)
+
+        failing.write.assert_called_once()
+        failing.close.assert_not_called()
+        self.assertEqual(healthy.write.call_count, 2)
+        healthy.close.assert_called_once()
+        self.assertFalse(results["PostgreSQL"].ok)
+        self.assertTrue(results["CSV"].ok)
+        self.assertEqual(exit_status(results), 2)
+
+
+class TestStagedExtractor(unittest.TestCase):
+    def setUp(self):
+        self.server = MockFashionServer(total_pages=6, products_per_page=4, latency=0.02).start()
+        self.base_url_patch = patch("utils.extract.BASE_URL", self.server.base_url)
+        self.base_url_patch.start()
+
+    def tearDown(self):
+        self.base_url_patch.stop()
+        self.server.stop()
+
+    def test_iter_pages_matches_sequential_extract(self):
+        """Test hasil StagedExtractor sama dan berurutan seperti iter_pages biasa."""
+        extractor = StagedExtractor(fetch_workers=3, parse_workers=2, queue_size=2, rate_limit=None)
+
+        staged = list(extractor.iter_pages(1, 6))
+        sequential = list(iter_pages(1, 6, rate_limit=None))
+
+        self.assertEqual(
+            [[product["Title"] for product in page] for page in staged],
+            [[product["Title"] for product in page] for page in sequential],
+        )
+        self.assertEqual(extractor.stats["fetch"].items, 6)
+        self.assertEqual(extractor.stats["parse"].items, 6)
+        self.assertGreater(extractor.stats["fetch"].bytes, 0)
+
+    def test_slow_parser_applies_backpressure(self):
+        """Test antrean HTML kecil menahan thread fetch saat parsing lebih lambat (bottleneck CPU)."""
+        with MockFashionServer(total_pages=4, products_per_page=500) as server, \
+                patch("utils.extract.BASE_URL", server.base_url):
+            extractor = StagedExtractor(fetch_workers=2, parse_workers=1, queue_size=1, rate_limit=None)
+            pages = list(extractor.iter_pages(1, 4))
+
+        self.assertEqual([len(page) for page in pages], [500] * 4)
+        self.assertGreater(extractor.stats["fetch"].waiting, 0)
+        self.assertEqual(extractor.bottleneck(), "cpu")
+
+    def test_dead_fetch_thread_raises_instead_of_hanging(self):
+        """Test thread fetch yang mati karena error tak terduga menghentikan iter_pages dengan exception-nya."""
+        class DyingExtractor(StagedExtractor):
+            def _fetch_worker(self, pages, html_queue, stop):
+                pages.get_nowait()
+                raise RuntimeError("thread fetch mati")
+
+        extractor = DyingExtractor(fetch_workers=1, parse_workers=1, rate_limit=None)
+        outcome = []
+
+        def consume():
+            try:
+                list(extractor.iter_pages(1, 2))
+            except RuntimeError as error:
+                outcome.append(str(error))
+
+        consumer = threading.Thread(target=consume, daemon=True)
+        consumer.start()
+        consumer.join(5)
+
+        self.assertFalse(consumer.is_alive())
+        self.assertEqual(outcome, ["thread fetch mati"])
+
+    def test_failed_page_yields_empty_list(self):
+        """Test halaman yang gagal di-fetch menghasilkan list kosong tanpa menghentikan pipeline."""
+        extractor = StagedExtractor(fetch_workers=2, parse_workers=1, rate_limit=None)
+
+        pages = list(extractor.iter_pages(5, 8))
+
+        self.assertEqual([len(page) for page in pages], [4, 4, 0, 0])
@@ -0,0 +1,50 @@
+import unittest
+from unittest.mock import patch
+from utils.rate_limit import TokenBucket, HostRateLimiter
+
+
+class TestTokenBucket(unittest.TestCase):
+    @patch('utils.rate_limit.time.sleep')
+    @patch('utils.rate_limit.time.monotonic', return_value=100.0)
+    def test_acquire_waits_when_tokens_exhausted(self, mock_monotonic, mock_sleep):
+        """Test acquire() menunggu sesuai rate setelah burst habis."""
+        bucket = TokenBucket(rate=2, capacity=2)
+
+        self.assertEqual(bucket.acquire(), 0.0)
+        self.assertEqual(bucket.acquire(), 0.0)
+        self.assertAlmostEqual(bucket.acquire(), 0.5)
+        self.assertAlmostEqual(bucket.acquire(), 1.0)
+        self.assertEqual(mock_sleep.call_count, 2)
+
+    @patch('utils.rate_limit.time.sleep')
+    @patch('utils.rate_limit.time.monotonic')
+    def test_acquire_refills_over_time(self, mock_monotonic, mock_sleep):
+        """Test token terisi kembali setelah waktu berlalu."""
+        mock_monotonic.side_effect = [0.0, 0.0, 0.0, 5.0]
+        bucket = TokenBucket(rate=1, capacity=1)
+
+        self.assertEqual(bucket.acquire(), 0.0)
+        self.assertAlmostEqual(bucket.acquire(), 1.0)
+        self.assertEqual(bucket.acquire(), 0.0)
+
+    def test_invalid_rate(self):
+        """Test TokenBucket menolak rate yang tidak valid."""
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestHostRateLimiter(unittest.TestCase):
+    @patch('utils.rate_limit.time.sleep')
+    @patch('utils.rate_limit.time.monotonic', return_value=0.0)
+    def test_buckets_are_per_host(self, mock_monotonic, mock_sleep):
+        """Test setiap host memiliki token bucket sendiri."""
+        limiter = HostRateLimiter(rate=1)
+
+        self.assertEqual(limiter.acquire("https://a.example/page1"), 0.0)
+        self.assertEqual(limiter.acquire("https://b.example/page1"), 0.0)
+        self.assertAlmostEqual(limiter.acquire("https://a.example/page2"), 1.0)
+
+    def test_no_limit_when_rate_is_none(self):
+        """Test limiter tanpa rate tidak pernah menunggu."""
+        limiter = HostRateLimiter(rate=None)
+        self.assertEqual(limiter.acquire("https://a.example/"), 0.0)
@@ -0,0 +1,91 @@
+import os
+import tempfile
+import unittest
+import pandas as pd
+from bs4 import BeautifulSoup
+from utils.extract import parse_product, parse_product_record
+from utils.load import load_to_csv, load_to_parquet, read_columnar, upsert_to_sql, dispose_engines
+from utils.records import FIELDS, Product, RawProduct, raw_from_dict, to_dicts
+from utils.sinks import freeze
+from utils.transform import transform_data, transform_records
+
+FIXTURE_PAGE = os.path.join(os.path.dirname(__file__), "fixtures", "fashion_studio_page.html")
+
+raw_data = [
+    {"Title": "Shirt A", "Price": "$10.00", "Rating": "⭐ 4.5 / 5", "Colors": "3 Colors",
+     "Size": "M", "Gender": "Men", "Timestamp": "2024-04-05T12:00:00"},
+    {"Title": "Shirt A", "Price": "$10.00", "Rating": "⭐ 4.5 / 5", "Colors": "3 Colors",
+     "Size": "M", "Gender": "Men", "Timestamp": "2024-04-05T12:00:01"},
+    {"Title": "Unknown Product", "Price": "$10.00", "Rating": "⭐ 4.5 / 5", "Colors": "3 Colors",
+     "Size": "M", "Gender": "Men", "Timestamp": "2024-04-05T12:00:00"},
+    {"Title": "Pants B", "Price": "$25.50", "Rating": "⭐ 3.9 / 5", "Colors": "5 Colors",
+     "Size": "XL", "Gender": "Women", "Timestamp": "2024-04-05T12:00:00"},
+]
+
+
+def strip_timestamps(products):
+    return [{key: value for key, value in product.items() if key != "Timestamp"} for product in products]
+
+
+class TestRecords(unittest.TestCase):
+    def test_dict_adapters_round_trip(self):
+        """Test adapter dict mempertahankan field dan urutannya."""
+        records = [raw_from_dict(item) for item in raw_data]
+        self.assertEqual(to_dicts(records), raw_data)
+        self.assertEqual(list(to_dicts(records)[0]), list(FIELDS))
+        self.assertEqual(raw_from_dict({"Title": "Shirt"}), RawProduct("Shirt", "", "", "", "", "", ""))
+
+    def test_parse_product_matches_record(self):
+        """Test parse_product (dict) sama dengan parse_product_record untuk setiap kartu."""
+        with open(FIXTURE_PAGE, encoding="utf-8") as file:
+            html = file.read()
+        cards = BeautifulSoup(html, "html.parser").select(".collection-card")
+
+        for card in cards:
+            self.assertEqual(
+                strip_timestamps([parse_product(card)]),
+                strip_timestamps([parse_product_record(card)._asdict()]),
+            )
+
+    def test_transform_records_matches_transform_data(self):
+        """Test transform_records menghasilkan data yang sama dengan transform_data dari dict maupun record."""
+        expected = transform_data(raw_data)
+
+        from_dicts = transform_records(raw_data)
+        from_records = transform_records([raw_from_dict(item) for item in raw_data])
+
+        self.assertTrue(all(isinstance(record, Product) for record in from_dicts))
+        self.assertEqual(to_dicts(from_dicts), expected)
+        self.assertEqual(from_records, from_dicts)
+
+    def test_freeze_keeps_records(self):
+        """Test snapshot sink memakai record apa adanya karena sudah immutable."""
+        records = transform_records(raw_data)
+        snapshot = freeze(records)
+        self.assertIs(snapshot[0], records[0])
+
+
+class TestLoadRecords(unittest.TestCase):
+    def setUp(self):
+        dispose_engines()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.records = transform_records(raw_data)
+
+    def tearDown(self):
+        dispose_engines()
+        self.tmpdir.cleanup()
+
+    def test_csv_and_parquet_accept_records(self):
+        """Test loader CSV dan Parquet menerima record tanpa konversi ke dict."""
+        filename = os.path.join(self.tmpdir.name, "products.csv")
+        self.assertTrue(load_to_csv(self.records, filename))
+        self.assertEqual(pd.read_csv(filename)["Title"].tolist(), ["Shirt A", "Pants B"])
+
+        root = os.path.join(self.tmpdir.name, "parquet")
+        self.assertTrue(load_to_parquet(self.records, root=root))
+        self.assertEqual(read_columnar(root, columns=["Price"]).column("Price").to_pylist(), [160000.0, 408000.0])
+
+    def test_upsert_accepts_records(self):
+        """Test upsert ke database menerima record."""
+        url = f"sqlite:///{os.path.join(self.tmpdir.name, 'fashion.db')}"
+        self.assertEqual(upsert_to_sql(self.records, url=url), 2)
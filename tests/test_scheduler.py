@@ -0,0 +1,116 @@
+import os
+import time
+import fcntl
+import tempfile
+import threading
+import unittest
+from datetime import datetime
+from utils.scheduler import CronSchedule, IntervalSchedule, Scheduler, parse_schedule
+
+
+def at(*args) -> float:
+    return datetime(*args).timestamp()
+
+
+class TestSchedules(unittest.TestCase):
+    def test_cron_next_after(self):
+        """Test waktu run berikutnya untuk beberapa ekspresi cron."""
+        every_quarter = CronSchedule("*/15 * * * *")
+        self.assertEqual(every_quarter.next_after(at(2024, 4, 5, 12, 7, 30)), at(2024, 4, 5, 12, 15))
+        self.assertEqual(every_quarter.next_after(at(2024, 4, 5, 12, 15)), at(2024, 4, 5, 12, 30))
+
+        office_hours = CronSchedule("0 9-17 * * 1-5")
+        # Jumat 5 April 2024 pukul 18:00 -> Senin 8 April pukul 09:00.
+        self.assertEqual(office_hours.next_after(at(2024, 4, 5, 18, 0)), at(2024, 4, 8, 9, 0))
+
+        self.assertEqual(CronSchedule("@daily").next_after(at(2024, 12, 31, 23, 59)), at(2025, 1, 1, 0, 0))
+        self.assertEqual(CronSchedule("30 6 29 2 *").next_after(at(2024, 3, 1)), at(2028, 2, 29, 6, 30))
+
+    def test_cron_day_of_month_or_day_of_week(self):
+        """Test day-of-month dan day-of-week yang sama-sama dibatasi cukup salah satu yang cocok."""
+        schedule = CronSchedule("0 0 13 * 5")
+        # Jumat berikutnya setelah 1 April 2024 adalah 5 April, lebih awal dari tanggal 13.
+        self.assertEqual(schedule.next_after(at(2024, 4, 1)), at(2024, 4, 5))
+        self.assertEqual(CronSchedule("0 0 * * 7").next_after(at(2024, 4, 1)), at(2024, 4, 7))
+
+    def test_invalid_schedules(self):
+        """Test ekspresi cron tidak valid, cron yang tidak pernah cocok, dan jadwal kosong ditolak."""
+        with self.assertRaises(ValueError):
+            CronSchedule("every minute")
+        with self.assertRaises(ValueError):
+            CronSchedule("0 0 30 2 *").next_after(at(2024, 1, 1))
+        with self.assertRaises(ValueError):
+            parse_schedule(0, None)
+        with self.assertRaises(ValueError):
+            IntervalSchedule(0)
+        self.assertIsInstance(parse_schedule(60, None), IntervalSchedule)
+
+
+class TestScheduler(unittest.TestCase):
+    def test_interval_runs_and_stops(self):
+        """Test daemon menjalankan job sesuai interval sampai max_runs."""
+        calls = []
+        scheduler = Scheduler(lambda: calls.append(time.perf_counter()) or 0, IntervalSchedule(0.05), lock_path=None, max_runs=3)
+
+        self.assertEqual(scheduler.run(), 0)
+        self.assertEqual(len(calls), 3)
+        self.assertGreaterEqual(calls[2] - calls[0], 0.09)
+
+    def test_slow_run_skips_missed_slots(self):
+        """Test run yang lebih lama dari interval tidak menumpuk run berikutnya."""
+        calls = []
+
+        def slow_job():
+            calls.append(time.perf_counter())
+            time.sleep(0.15)
+            return 0
+
+        scheduler = Scheduler(slow_job, IntervalSchedule(0.05), lock_path=None, max_runs=2)
+        scheduler.run()
+
+        self.assertEqual(scheduler.skipped, 1)
+        self.assertGreaterEqual(calls[1] - calls[0], 0.15)
+
+    def test_no_overlap_with_other_process_lock(self):
+        """Test run dilewati jika lock dipegang proses lain, dan job yang error menghasilkan status 1."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            lock_path = os.path.join(tmpdir, "etl.lock")
+            scheduler = Scheduler(lambda: 0, IntervalSchedule(1), lock_path=lock_path)
+
+            with open(lock_path, "a") as other:
+                fcntl.flock(other, fcntl.LOCK_EX)
+                self.assertIsNone(scheduler.run_once())
+                fcntl.flock(other, fcntl.LOCK_UN)
+            self.assertEqual(scheduler.run_once(), 0)
+
+            def broken():
+                raise RuntimeError("boom")
+            self.assertEqual(Scheduler(broken, IntervalSchedule(1), lock_path=lock_path).run_once(), 1)
+
+    def test_no_overlap_within_process(self):
+        """Test run manual tidak berjalan bersamaan dengan run terjadwal."""
+        started, release = threading.Event(), threading.Event()
+
+        def blocking_job():
+            started.set()
+            release.wait(5)
+            return 0
+
+        scheduler = Scheduler(blocking_job, IntervalSchedule(1), lock_path=None)
+        worker = threading.Thread(target=scheduler.run_once)
+        worker.start()
+        started.wait(5)
+        self.assertIsNone(scheduler.run_once())
+        release.set()
+        worker.join()
+        self.assertEqual(scheduler.runs, 1)
+
+    def test_stop_interrupts_wait(self):
+        """Test stop menghentikan daemon yang sedang menunggu jadwal berikutnya."""
+        scheduler = Scheduler(lambda: 0, IntervalSchedule(60), lock_path=None)
+        threading.Timer(0.1, scheduler.stop).start()
+
+        started = time.perf_counter()
+        scheduler.run()
+        self.assertLess(time.perf_counter() - started, 5)
+        self.assertEqual(scheduler.runs, 1)
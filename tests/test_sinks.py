@@ -0,0 +1,141 @@
+import os
+import time
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+from utils.load import load_to_csv
+from utils.sinks import SINKS, Sink, register_sink, run_sinks, exit_status, freeze
+
+sample_data = [{"Title": "Shirt A", "Price": 160000.0, "Rating": 4.5, "Colors": 3,
+                "Size": "M", "Gender": "Unisex", "Timestamp": "2024-04-05T12:00:00"}]
+
+
+class TestSinks(unittest.TestCase):
+    def setUp(self):
+        self.registry = patch.dict(SINKS, clear=True)
+        self.registry.start()
+
+    def tearDown(self):
+        self.registry.stop()
+
+    def test_register_sink_as_decorator(self):
+        """Test register_sink dapat dipakai sebagai decorator."""
+        @register_sink("memory", timeout=5)
+        def load_to_memory(data):
+            return True
+
+        self.assertEqual(SINKS["memory"], Sink("memory", load_to_memory, 5))
+
+    def test_freeze_is_read_only(self):
+        """Test snapshot tidak dapat diubah oleh sink."""
+        snapshot = freeze(sample_data)
+        with self.assertRaises(TypeError):
+            snapshot[0]["Title"] = "Changed"
+        self.assertEqual(dict(snapshot[0]), sample_data[0])
+
+    def test_run_sinks_in_parallel(self):
+        """Test sink berjalan bersamaan sehingga durasi total mendekati sink terlama."""
+        for name in ["a", "b", "c"]:
+            register_sink(name, lambda data: time.sleep(0.2))
+
+        started = time.perf_counter()
+        results = run_sinks(sample_data)
+        elapsed = time.perf_counter() - started
+
+        self.assertLess(elapsed, 0.5)
+        self.assertTrue(all(result.ok for result in results.values()))
+        self.assertEqual(exit_status(results), 0)
+
+    def test_partial_failure(self):
+        """Test kegagalan sebagian dilaporkan per sink dan tercermin di exit status."""
+        register_sink("ok", lambda data: True)
+        register_sink("returns_false", lambda data: False)
+
+        def broken(data):
+            raise RuntimeError("DB error")
+        register_sink("raises", broken)
+
+        results = run_sinks(sample_data)
+
+        self.assertTrue(results["ok"].ok)
+        self.assertFalse(results["returns_false"].ok)
+        self.assertEqual(results["raises"].error, "DB error")
+        self.assertEqual(exit_status(results), 2)
+
+    def test_timeout(self):
+        """Test sink yang melewati batas waktu dilaporkan gagal."""
+        register_sink("slow", lambda data: time.sleep(1), timeout=0.1)
+
+        results = run_sinks(sample_data)
+
+        self.assertFalse(results["slow"].ok)
+        self.assertIn("timeout", results["slow"].error)
+        self.assertEqual(exit_status(results), 1)
+
+    def test_timed_out_sink_does_not_block_exit_or_rerun(self):
+        """Test sink yang timeout berjalan di daemon thread dan tidak dijalankan ulang selama masih berjalan."""
+        calls = []
+        release = threading.Event()
+        register_sink("hung", lambda data: calls.append(1) or release.wait(5), timeout=0.05)
+
+        first = run_sinks(sample_data)
+        second = run_sinks(sample_data)
+
+        self.assertIn("timeout", first["hung"].error)
+        self.assertIn("masih berjalan", second["hung"].error)
+        self.assertEqual(calls, [1])
+        self.assertTrue(all(thread.daemon for thread in threading.enumerate() if thread.name == "sink-hung"))
+
+        release.set()
+        for thread in threading.enumerate():
+            if thread.name == "sink-hung":
+                thread.join()
+        self.assertTrue(run_sinks(sample_data)["hung"].ok)
+        self.assertEqual(calls, [1, 1])
+
+    def test_selected_and_unknown_sinks(self):
+        """Test hanya sink terpilih yang dijalankan dan sink tak dikenal dilaporkan gagal."""
+        calls = []
+        register_sink("a", lambda data: calls.append("a"))
+        register_sink("b", lambda data: calls.append("b"))
+
+        results = run_sinks(sample_data, ["b", "missing"])
+
+        self.assertEqual(calls, ["b"])
+        self.assertFalse(results["missing"].ok)
+
+    def test_incremental_sinks_receive_delta(self):
+        """Test sink incremental hanya menerima delta, sink lain tetap menerima data penuh."""
+        received = {}
+        register_sink("full", lambda data: received.update(full=len(data)))
+        register_sink("delta", lambda data: received.update(delta=len(data)), incremental=True)
+
+        run_sinks(sample_data * 3, delta=sample_data)
+        self.assertEqual(received, {"full": 3, "delta": 1})
+
+        run_sinks(sample_data * 3)
+        self.assertEqual(received, {"full": 3, "delta": 3})
+
+    def test_incremental_sinks_receive_own_delta(self):
+        """Test `deltas` memberi setiap sink incremental delta miliknya sendiri."""
+        received = {}
+        register_sink("full", lambda data: received.update(full=len(data)))
+        register_sink("a", lambda data: received.update(a=len(data)), incremental=True)
+        register_sink("b", lambda data: received.update(b=len(data)), incremental=True)
+
+        run_sinks(sample_data * 3, deltas={"a": [], "b": sample_data * 2})
+
+        self.assertEqual(received, {"full": 3, "a": 0, "b": 2})
+
+    def test_csv_keeps_column_order_for_dict_rows(self):
+        """Test CSV dari snapshot baris dict tetap memakai urutan kolom asli, bukan alfabetis."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "products.csv")
+            register_sink("csv", lambda data: load_to_csv(data, path))
+
+            results = run_sinks(sample_data)
+
+            self.assertTrue(results["csv"].ok)
+            with open(path, encoding="utf-8") as file:
+                self.assertEqual(file.readline().strip(), ",".join(sample_data[0]))
@@ -1,6 +1,6 @@
 import unittest
 from utils.transform import (
-    clean_price, clean_rating, clean_colors, transform_data
+    clean_price, clean_rating, clean_colors, transform_data, transform_stream
 )
 
 class TestTransformData(unittest.TestCase):
@@ -89,4 +89,33 @@ class TestTransformData(unittest.TestCase):
             }
         ]
         result = transform_data(raw_data)
-        self.assertEqual(len(result), 1)
\ No newline at end of file
+        self.assertEqual(len(result), 1)
+
+    def test_transform_stream_matches_transform_data(self):
+        """Test transform_stream() menghasilkan data yang sama dengan transform_data() dan dedup lintas batch."""
+        row = {"Title": "Product A", "Price": "$10", "Rating": "5", "Colors": "2 Colors",
+               "Size": "L", "Gender": "Male", "Timestamp": "2024-04-05T12:00:00"}
+        other = dict(row, Title="Product B")
+        invalid = dict(row, Title="Unknown Product")
+        batches = [[row, invalid], [], [dict(row), other]]
+
+        streamed = [item for batch in transform_stream(iter(batches)) for item in batch]
+
+        self.assertEqual(streamed, transform_data([item for batch in batches for item in batch]))
+        self.assertEqual([item["Title"] for item in streamed], ["Product A", "Product B"])
+
+    def test_transform_stream_is_lazy(self):
+        """Test transform_stream() memproses batch satu per satu tanpa membaca seluruh input."""
+        consumed = []
+
+        def pages():
+            for title in ["A", "B", "C"]:
+                consumed.append(title)
+                yield [{"Title": title, "Price": "$1", "Rating": "4", "Colors": "1",
+                        "Size": "M", "Gender": "Men", "Timestamp": ""}]
+
+        stream = transform_stream(pages())
+        first = next(stream)
+
+        self.assertEqual(first[0]["Title"], "A")
+        self.assertEqual(consumed, ["A"])
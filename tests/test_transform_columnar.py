@@ -0,0 +1,77 @@
+import math
+import random
+import unittest
+import pandas as pd
+from utils.transform import transform_data
+from utils.transform_columnar import transform_data_vectorized, transform_dataframe
+
+
+def normalize(rows):
+    """NaN tidak sama dengan dirinya sendiri, jadi diganti penanda agar bisa dibandingkan."""
+    return [
+        {key: "NaN" if isinstance(value, float) and math.isnan(value) else (value, type(value))
+         for key, value in row.items()}
+        for row in rows
+    ]
+
+
+class TestTransformColumnar(unittest.TestCase):
+    def test_matches_transform_data_on_valid_rows(self):
+        """Test hasil vektorisasi sama dengan transform_data() untuk data valid."""
+        raw_data = [
+            {"Title": "Shirt 1", "Price": "$20", "Rating": "⭐ 4.5 / 5", "Colors": "3 Colors",
+             "Size": "M", "Gender": "Unisex", "Timestamp": "2024-04-05T12:00:00"},
+            {"Title": " Pants 2 ", "Price": "$ 7.25", "Rating": "3", "Colors": "Red, Blue",
+             "Size": "L", "Gender": "Men", "Timestamp": "2024-04-05T12:00:01"},
+        ]
+        self.assertEqual(transform_data_vectorized(raw_data), transform_data(raw_data))
+
+    def test_invalid_values_and_duplicates(self):
+        """Test filter INVALID_VALUES dan deduplikasi sama dengan transform_data()."""
+        base = {"Title": "Product A", "Price": "$10", "Rating": "5", "Colors": "2 Colors",
+                "Size": "L", "Gender": "Male", "Timestamp": "2024-04-05T12:00:00"}
+        raw_data = [
+            base,
+            dict(base, Timestamp="2024-04-05T12:01:00"),
+            dict(base, Title="Unknown Product"),
+            dict(base, Price="Price Unavailable"),
+            dict(base, Rating="Not Rated"),
+            dict(base, Size=None),
+            dict(base, Price="100"),
+        ]
+        result = transform_data_vectorized(raw_data)
+        self.assertEqual(result, transform_data(raw_data))
+        self.assertEqual(len(result), 1)
+
+    def test_matches_transform_data_on_random_edge_cases(self):
+        """Test kesetaraan penuh pada data acak berisi kasus tepi (NaN, unicode, key hilang)."""
+        rng = random.Random(194)
+        choices = {
+            "Title": ["Shirt 1", "Shirt 2", " Pants 3 ", "Unknown Product", "", 7],
+            "Price": ["$10", "$10.00", " $ 5 ", "$1e3", "$1_000", "$abc", "$", "10", "$nan", "$.5", None],
+            "Rating": ["⭐ 4.5 / 5", "4.5", "Invalid Rating", "1.2.3", ".", "٣.٥", "3", ""],
+            "Colors": ["3 Colors", "Red, Blue", "2", "", "²", "99999999999999999999999", "٣ Colors"],
+            "Size": ["M", "L", "N/A", " XL "],
+            "Gender": ["Men", "Women", "Unisex"],
+        }
+        raw_data = []
+        for index in range(3000):
+            row = {field: rng.choice(values) for field, values in choices.items()}
+            row["Timestamp"] = f"2024-04-05T12:00:{index}"
+            if rng.random() < 0.05:
+                del row[rng.choice(list(row))]
+            raw_data.append(row)
+
+        self.assertEqual(normalize(transform_data_vectorized(raw_data)), normalize(transform_data(raw_data)))
+
+    def test_transform_dataframe(self):
+        """Test transform_dataframe() menerima DataFrame mentah dan mengembalikan kolom bertipe."""
+        df = pd.DataFrame([{"Title": "Shirt 1", "Price": "$1", "Rating": "4", "Colors": "2 Colors",
+                            "Size": "M", "Gender": "Men", "Timestamp": "t"}])
+        result = transform_dataframe(df)
+        self.assertEqual(result["Price"].tolist(), [16000.0])
+        self.assertEqual(result["Colors"].tolist(), [2])
+
+    def test_empty_input(self):
+        """Test input kosong menghasilkan list kosong."""
+        self.assertEqual(transform_data_vectorized([]), [])
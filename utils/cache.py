@@ -0,0 +1,143 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from dataclasses import dataclass
+from typing import List, Dict, Optional
+
+HTTP_CACHE_PATH = os.getenv("HTTP_CACHE_PATH")
+HTTP_CACHE_MAX_BYTES = int(os.getenv("HTTP_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+HTTP_CACHE_TTL = float(os.getenv("HTTP_CACHE_TTL", str(7 * 24 * 3600)))
+
+
+@dataclass
+class CacheEntry:
+    """Satu halaman di cache: validator HTTP, hash body, dan produk hasil parsing."""
+    url: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body_hash: str
+    products: List[Dict[str, str]]
+    fetched_at: float
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Header If-None-Match/If-Modified-Since untuk revalidasi halaman."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def hash_body(body: bytes) -> str:
+    """Menghitung hash SHA-256 dari body respons."""
+    return hashlib.sha256(body).hexdigest()
+
+
+class ResponseCache:
+    """
+    Cache respons HTTP berbasis SQLite untuk scraping inkremental.
+
+    Entri yang lebih tua dari `ttl` dianggap kedaluwarsa dan dihapus. Jika total
+    ukuran melebihi `max_bytes`, entri yang paling lama tidak diakses dibuang (LRU).
+    """
+
+    def __init__(self, path: str = HTTP_CACHE_PATH, max_bytes: int = HTTP_CACHE_MAX_BYTES, ttl: float = HTTP_CACHE_TTL):
+        if not path:
+            raise ValueError("Path cache belum diatur (HTTP_CACHE_PATH).")
+
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                body_hash TEXT NOT NULL,
+                products TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at)")
+        self._conn.commit()
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """Mengambil entri cache yang masih berlaku dan memperbarui waktu aksesnya."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, body_hash, products, fetched_at FROM responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+            if row is None:
+                return None
+            if now - row[4] > self.ttl:
+                self._conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+                self._conn.commit()
+                return None
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE url = ?", (now, url))
+            self._conn.commit()
+
+        etag, last_modified, body_hash, products, fetched_at = row
+        return CacheEntry(url, etag, last_modified, body_hash, json.loads(products), fetched_at)
+
+    def put(
+        self,
+        url: str,
+        body_hash: str,
+        products: List[Dict[str, str]],
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """Menyimpan atau memperbarui entri cache lalu menjalankan eviction."""
+        now = time.time()
+        payload = json.dumps(products, ensure_ascii=False)
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO responses
+                    (url, etag, last_modified, body_hash, products, size, fetched_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (url, etag, last_modified, body_hash, payload, len(payload.encode("utf-8")), now, now),
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def touch(self, url: str) -> None:
+        """Menandai entri masih valid setelah server menjawab 304 Not Modified."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("UPDATE responses SET fetched_at = ?, accessed_at = ? WHERE url = ?", (now, now, url))
+            self._conn.commit()
+
+    def _evict(self, now: float) -> None:
+        self._conn.execute("DELETE FROM responses WHERE fetched_at < ?", (now - self.ttl,))
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        for url, size in self._conn.execute("SELECT url, size FROM responses ORDER BY accessed_at").fetchall():
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+            total -= size
+
+    def total_size(self) -> int:
+        """Total ukuran data produk yang tersimpan di cache (byte)."""
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
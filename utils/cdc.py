@@ -0,0 +1,185 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+from utils.metrics import active_metrics
+from utils.records import FIELDS
+
+CDC_INDEX_PATH = os.getenv("CDC_INDEX_PATH")
+CDC_FULL_SNAPSHOT = os.getenv("CDC_FULL_SNAPSHOT", "0") == "1"
+CDC_KEY = [name.strip() for name in os.getenv("CDC_KEY", "Title,Size,Gender").split(",") if name.strip()]
+
+# Field konten yang dibandingkan antar run (key deduplikasi `transform_data`).
+CONTENT_FIELDS = FIELDS[:6]
+
+# Namespace index jika tidak ada nama sink (pemakaian dengan satu tujuan saja).
+DEFAULT_SINK = ""
+
+
+def _values(row) -> tuple:
+    """Seluruh nilai field dari `Product` maupun dict, sesuai urutan `FIELDS`."""
+    if isinstance(row, tuple):
+        return tuple(row)
+    return tuple(row.get(name) for name in FIELDS)
+
+
+def content_hash(values: Sequence) -> str:
+    """Hash stabil dari nilai konten produk (tanpa Timestamp)."""
+    payload = json.dumps(list(values[:len(CONTENT_FIELDS)]), ensure_ascii=False)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+@dataclass
+class ChangeSet:
+    """
+    Hasil klasifikasi satu run terhadap state satu sink di index: produk baru,
+    berubah, dan hilang beserta jumlah produk yang tidak berubah. `delta` adalah
+    data yang perlu di-load ke sink tersebut.
+    """
+    sink: str = DEFAULT_SINK
+    new: list = field(default_factory=list)
+    changed: list = field(default_factory=list)
+    removed: List[Dict[str, any]] = field(default_factory=list)
+    unchanged: int = 0
+    _upserts: List[Tuple[str, str, str]] = field(default_factory=list, repr=False)
+    _deletes: List[str] = field(default_factory=list, repr=False)
+
+    @property
+    def delta(self) -> list:
+        return self.new + self.changed
+
+    def counts(self) -> Dict[str, int]:
+        return {
+            "new": len(self.new),
+            "changed": len(self.changed),
+            "unchanged": self.unchanged,
+            "removed": len(self.removed),
+        }
+
+
+class ProductIndex:
+    """
+    Index produk persisten berbasis SQLite untuk change-data-capture antar run.
+
+    Produk diidentifikasi oleh field `key` (default `CDC_KEY`); jika beberapa
+    produk dalam satu run memiliki identitas yang sama, urutan kemunculannya
+    menjadi bagian dari key. Setiap key menyimpan hash konten dan baris terakhir.
+
+    State disimpan terpisah per sink: sink yang tidak ikut dalam suatu run
+    (misalnya karena `ETL_SINKS`) tetap menerima perubahan tersebut pada run
+    berikutnya yang menyertakannya.
+    """
+
+    def __init__(self, path: str = CDC_INDEX_PATH, key: Sequence[str] = tuple(CDC_KEY)):
+        if not path:
+            raise ValueError("Path index CDC belum diatur (CDC_INDEX_PATH).")
+        unknown = [name for name in key if name not in CONTENT_FIELDS]
+        if not key or unknown:
+            raise ValueError(f"Field key CDC tidak valid: {', '.join(unknown) or '(kosong)'}")
+
+        self.path = path
+        self._positions = [FIELDS.index(name) for name in key]
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS sink_products (
+                sink TEXT NOT NULL,
+                key TEXT NOT NULL,
+                hash TEXT NOT NULL,
+                row TEXT NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (sink, key)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def _keys(self, rows: Iterable) -> Iterator[Tuple[str, tuple, object]]:
+        occurrences: Dict[tuple, int] = {}
+        for row in rows:
+            values = _values(row)
+            identity = tuple(values[position] for position in self._positions)
+            occurrence = occurrences.get(identity, 0)
+            occurrences[identity] = occurrence + 1
+            yield json.dumps([*identity, occurrence], ensure_ascii=False), values, row
+
+    def diff(self, rows: Iterable, sink: str = DEFAULT_SINK, deletions: bool = True) -> ChangeSet:
+        """
+        Mengklasifikasikan data bersih satu run sebagai baru, berubah, tidak
+        berubah, atau hilang dibanding state `sink`. Index belum diubah sampai `commit`.
+
+        Dengan `deletions=False` (run yang datanya tidak lengkap, misalnya ada
+        halaman gagal), produk yang tidak muncul tidak dianggap hilang dan tetap
+        ada di index, sehingga tidak dikirim ulang sebagai produk baru pada run berikutnya.
+        """
+        return self.diff_sinks(rows, [sink], deletions)[sink]
+
+    def diff_sinks(self, rows: Iterable, sinks: Sequence[str], deletions: bool = True) -> Dict[str, ChangeSet]:
+        """Seperti `diff` untuk beberapa sink sekaligus; key dan hash konten dihitung sekali."""
+        entries = [(key, content_hash(values), values, row) for key, values, row in self._keys(rows)]
+        return {sink: self._classify(entries, sink, deletions) for sink in sinks}
+
+    def _classify(self, entries: List[tuple], sink: str, deletions: bool) -> ChangeSet:
+        with self._lock:
+            known = dict(self._conn.execute("SELECT key, hash FROM sink_products WHERE sink = ?", (sink,)).fetchall())
+
+        changes = ChangeSet(sink=sink)
+        for key, digest, values, row in entries:
+            previous = known.pop(key, None)
+            if previous == digest:
+                changes.unchanged += 1
+                continue
+            (changes.new if previous is None else changes.changed).append(row)
+            changes._upserts.append((key, digest, json.dumps(dict(zip(FIELDS, values)), ensure_ascii=False)))
+
+        if known and deletions:
+            removed = list(known)
+            with self._lock:
+                for start in range(0, len(removed), 500):
+                    chunk = removed[start:start + 500]
+                    placeholders = ", ".join("?" * len(chunk))
+                    changes.removed.extend(
+                        json.loads(row) for (row,) in self._conn.execute(
+                            f"SELECT row FROM sink_products WHERE sink = ? AND key IN ({placeholders}) ORDER BY key",
+                            [sink, *chunk],
+                        )
+                    )
+            changes._deletes = removed
+
+        metrics = active_metrics()
+        if metrics is not None:
+            for change, count in changes.counts().items():
+                metrics.increment("cdc_rows", count, change=change, sink=sink)
+        label = f" sink {sink}" if sink else ""
+        print(
+            "[INFO] CDC{label}: {new} baru, {changed} berubah, {unchanged} tidak berubah, {removed} hilang".format(
+                label=label, **changes.counts()
+            )
+        )
+        return changes
+
+    def commit(self, changes: ChangeSet) -> None:
+        """Menyimpan hasil `diff` ke state sink-nya dalam satu transaksi."""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO sink_products (sink, key, hash, row, updated_at) VALUES (?, ?, ?, ?, ?)",
+                [(changes.sink, key, digest, row, now) for key, digest, row in changes._upserts],
+            )
+            self._conn.executemany(
+                "DELETE FROM sink_products WHERE sink = ? AND key = ?",
+                [(changes.sink, key) for key in changes._deletes],
+            )
+
+    def size(self, sink: str = DEFAULT_SINK) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM sink_products WHERE sink = ?", (sink,)).fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
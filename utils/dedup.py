@@ -0,0 +1,305 @@
+import os
+import math
+import mmap
+import fcntl
+import struct
+import hashlib
+from array import array
+from typing import Callable, Optional
+
+DEDUP_BACKEND = os.getenv("DEDUP_BACKEND", "exact")
+DEDUP_INDEX_PATH = os.getenv("DEDUP_INDEX_PATH")
+DEDUP_CAPACITY = int(os.getenv("DEDUP_CAPACITY", "1000000"))
+DEDUP_ERROR_RATE = float(os.getenv("DEDUP_ERROR_RATE", "0.001"))
+
+MAX_LOAD_FACTOR = 0.5
+INDEX_MAGIC = 0x4445445550494458  # "DEDUPIDX"
+HEADER = struct.Struct("<4Q")  # magic, bits, capacity (slot), jumlah entri
+
+
+def fingerprint(key: tuple, bits: int = 64) -> int:
+    """
+    Fingerprint stabil (lintas proses dan run) dari key deduplikasi. Tidak
+    memakai `hash()` bawaan karena nilainya diacak per proses untuk string.
+    """
+    digest = hashlib.blake2b(repr(key).encode("utf-8"), digest_size=bits // 8).digest()
+    return int.from_bytes(digest, "little") or 1
+
+
+def _capacity_for(count: int) -> int:
+    return 1 << max(4, math.ceil(math.log2(max(count, 1) / MAX_LOAD_FACTOR)))
+
+
+class FingerprintSet:
+    """
+    Pengganti `set` untuk key deduplikasi yang hanya menyimpan fingerprint 64
+    atau 128 bit dalam tabel hash open-addressing berbasis `array('Q')`:
+    8/16 byte per slot, bukan tuple enam nilai beserta objeknya.
+
+    Fingerprint 64 bit memakai `hash()` bawaan (cepat, cukup untuk satu proses);
+    128 bit memakai `fingerprint`. Dua key berbeda dengan fingerprint sama
+    dianggap duplikat; peluangnya sekitar n^2 / 2^(bits+1), misalnya 3e-6
+    untuk 10 juta key pada 64 bit.
+    """
+
+    stable = False
+
+    def __init__(self, bits: int = 64, capacity: int = DEDUP_CAPACITY):
+        if bits not in (64, 128):
+            raise ValueError(f"Ukuran fingerprint harus 64 atau 128 bit, bukan {bits}")
+        self._configure(bits)
+        self._allocate(_capacity_for(capacity))
+
+    def _configure(self, bits: int) -> None:
+        self.bits = bits
+        self._words = bits // 64
+        self._count = 0
+        self._pending = (None, 0, 0, False, -1)
+        self._find = self._find64 if bits == 64 else self._find128
+
+    def _allocate(self, capacity: int) -> None:
+        self._capacity = capacity
+        self._offset = 0
+        self._table = array("Q", [0]) * (self._words * capacity)
+
+    def _hash(self, key: tuple) -> int:
+        if self.bits == 64 and not self.stable:
+            return (hash(key) & 0xFFFFFFFFFFFFFFFF) or 1
+        return fingerprint(key, self.bits)
+
+    def _find64(self, value: int) -> tuple:
+        """(slot, True jika sudah ada); slot adalah posisi kosong jika belum ada."""
+        table, offset, mask = self._table, self._offset, self._capacity - 1
+        slot = value & mask
+        while True:
+            stored = table[offset + slot]
+            if stored == value:
+                return slot, True
+            if stored == 0:
+                return slot, False
+            slot = (slot + 1) & mask
+
+    def _find128(self, value: int) -> tuple:
+        table, offset, mask = self._table, self._offset, self._capacity - 1
+        high, low = value >> 64, value & 0xFFFFFFFFFFFFFFFF
+        slot = low & mask
+        while True:
+            base = offset + 2 * slot
+            stored_high, stored_low = table[base], table[base + 1]
+            if stored_high == high and stored_low == low:
+                return slot, True
+            if stored_high == 0 and stored_low == 0:
+                return slot, False
+            slot = (slot + 1) & mask
+
+    def _store(self, slot: int, value: int) -> None:
+        if self._words == 1:
+            self._table[self._offset + slot] = value
+        else:
+            base = self._offset + 2 * slot
+            self._table[base] = value >> 64
+            self._table[base + 1] = value & 0xFFFFFFFFFFFFFFFF
+
+    def _values(self) -> list:
+        table, offset = self._table, self._offset
+        if self._words == 1:
+            return [value for value in table[offset:offset + self._capacity] if value]
+        pairs = table[offset:offset + 2 * self._capacity]
+        return [(high << 64) | low for high, low in zip(pairs[::2], pairs[1::2]) if high or low]
+
+    def _grow(self) -> None:
+        values = self._values()
+        self._allocate(self._capacity * 2)
+        for value in values:
+            self._store(self._find(value)[0], value)
+
+    def _probe(self, key: tuple) -> tuple:
+        # `key in seen` lalu `seen.add(key)` memakai key yang sama: hasil probe
+        # dipakai ulang selama tabel belum berubah.
+        pending = self._pending
+        if pending[0] is key and pending[4] == self._count:
+            return pending[1:4]
+        value = self._hash(key)
+        slot, found = self._find(value)
+        self._pending = (key, value, slot, found, self._count)
+        return value, slot, found
+
+    def __contains__(self, key: tuple) -> bool:
+        return self._probe(key)[2]
+
+    def add(self, key: tuple) -> None:
+        value, slot, found = self._probe(key)
+        if found:
+            return
+        self._store(slot, value)
+        self._count += 1
+        if self._count > self._capacity * MAX_LOAD_FACTOR:
+            self._grow()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def nbytes(self) -> int:
+        """Ukuran tabel fingerprint dalam byte."""
+        return self._capacity * self._words * 8
+
+
+class MmapFingerprintSet(FingerprintSet):
+    """
+    `FingerprintSet` yang disimpan di file dan di-memory-map, sehingga key dari
+    run sebelumnya ikut dianggap duplikat. File dikunci eksklusif selama dibuka
+    (satu penulis sekaligus); panggil `close()` agar jumlah entri tersimpan.
+    Selalu memakai `fingerprint` karena nilainya harus sama lintas proses.
+    """
+
+    stable = True
+
+    def __init__(self, path: str = DEDUP_INDEX_PATH, bits: int = 64, capacity: int = DEDUP_CAPACITY):
+        if not path:
+            raise ValueError("Path index deduplikasi belum diatur (DEDUP_INDEX_PATH).")
+        self.path = path
+        self._file = open(path, "a+b")
+        self._mmap = None
+        try:
+            fcntl.flock(self._file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            self._file.close()
+            raise RuntimeError(f"Index deduplikasi {path} sedang dipakai proses lain")
+
+        self._file.seek(0)
+        header = self._file.read(HEADER.size)
+        if len(header) == HEADER.size:
+            magic, stored_bits, stored_capacity, count = HEADER.unpack(header)
+            if magic != INDEX_MAGIC or stored_bits != bits:
+                self._file.close()
+                raise ValueError(f"File {path} bukan index deduplikasi {bits} bit")
+            self._configure(bits)
+            self._map(stored_capacity)
+            self._count = count
+        else:
+            super().__init__(bits, capacity)
+
+    def _map(self, capacity: int) -> None:
+        size = HEADER.size + 8 * self._words * capacity
+        self._file.truncate(size)
+        self._mmap = mmap.mmap(self._file.fileno(), size)
+        self._capacity = capacity
+        self._offset = HEADER.size // 8
+        self._table = memoryview(self._mmap).cast("Q")
+
+    def _unmap(self) -> None:
+        if self._mmap is not None:
+            self._table.release()
+            self._mmap.close()
+            self._mmap = None
+
+    def _allocate(self, capacity: int) -> None:
+        self._unmap()
+        self._file.truncate(0)
+        self._map(capacity)
+
+    def flush(self) -> None:
+        """Menulis header dan isi tabel ke disk."""
+        self._mmap[:HEADER.size] = HEADER.pack(INDEX_MAGIC, self.bits, self._capacity, self._count)
+        self._mmap.flush()
+
+    def close(self) -> None:
+        if self._mmap is None:
+            return
+        self.flush()
+        self._unmap()
+        fcntl.flock(self._file, fcntl.LOCK_UN)
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class BloomDedup:
+    """
+    Bloom filter untuk deduplikasi dengan memori tetap: sekitar 1,44 *
+    log2(1 / error_rate) bit per key (sekitar 14 bit untuk 0,1%).
+
+    Tanpa `verify`, sebagian kecil produk unik (sekitar `error_rate`) ikut
+    terbuang sebagai duplikat palsu. Dengan `verify` (misalnya `MmapFingerprintSet`
+    atau `set`), setiap hasil "mungkin ada" dipastikan ke struktur tersebut, yang
+    hanya dibaca untuk hasil positif sehingga boleh lambat (di disk).
+    """
+
+    def __init__(self, capacity: int = DEDUP_CAPACITY, error_rate: float = DEDUP_ERROR_RATE, verify=None):
+        if not 0 < error_rate < 1:
+            raise ValueError(f"error_rate harus di antara 0 dan 1, bukan {error_rate}")
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.verify = verify
+        self.false_positives = 0
+        self._bits = bytearray((self.size + 7) // 8)
+        self._pending = (None, ())
+
+    def _positions(self, key: tuple) -> tuple:
+        # Double hashing dari dua hash 64 bit; filter hanya hidup di satu proses
+        # sehingga `hash()` bawaan cukup.
+        pending_key, positions = self._pending
+        if pending_key is not key:
+            first = hash(key) & 0xFFFFFFFFFFFFFFFF
+            second = (hash((first, 0x5BD1E995)) & 0xFFFFFFFFFFFFFFFF) | 1
+            size = self.size
+            positions = tuple((first + index * second) % size for index in range(self.hashes))
+            self._pending = (key, positions)
+        return positions
+
+    def __contains__(self, key: tuple) -> bool:
+        bits = self._bits
+        for position in self._positions(key):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        if self.verify is None:
+            return True
+        if key in self.verify:
+            return True
+        self.false_positives += 1
+        return False
+
+    def add(self, key: tuple) -> None:
+        bits = self._bits
+        for position in self._positions(key):
+            bits[position >> 3] |= 1 << (position & 7)
+        if self.verify is not None:
+            self.verify.add(key)
+
+    def nbytes(self) -> int:
+        """Ukuran bit array dalam byte (tanpa struktur verifikasi)."""
+        return len(self._bits)
+
+
+DEDUP_BACKENDS = {
+    "exact": lambda capacity, path: set(),
+    "fp64": lambda capacity, path: FingerprintSet(64, capacity),
+    "fp128": lambda capacity, path: FingerprintSet(128, capacity),
+    "disk": lambda capacity, path: MmapFingerprintSet(path, 64, capacity),
+    "bloom": lambda capacity, path: BloomDedup(capacity),
+    "bloom-verify": lambda capacity, path: BloomDedup(
+        capacity, verify=MmapFingerprintSet(path, 64, capacity) if path else FingerprintSet(64, capacity)
+    ),
+}
+
+
+def make_dedup(backend: str = DEDUP_BACKEND, capacity: int = DEDUP_CAPACITY, path: Optional[str] = DEDUP_INDEX_PATH):
+    """
+    Membuat struktur `seen` untuk `transform_data`/`transform_records`. Semua
+    backend mendukung `key in seen` dan `seen.add(key)` seperti `set`.
+    """
+    factory: Optional[Callable] = DEDUP_BACKENDS.get(backend)
+    if factory is None:
+        raise ValueError(f"Backend deduplikasi tidak dikenal: {backend}")
+    return factory(capacity, path)
+
+
+def close_dedup(seen) -> None:
+    """Menutup backend yang menyimpan data ke disk; tidak melakukan apa pun untuk yang lain."""
+    for target in (seen, getattr(seen, "verify", None)):
+        if hasattr(target, "close"):
+            target.close()
@@ -0,0 +1,351 @@
+import os
+import sys
+import json
+import time
+import uuid
+import socket
+import sqlite3
+import threading
+import multiprocessing
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import utils.extract as extract
+from utils.cache import ResponseCache
+from utils.extract import ExtractReport, resolve_end_page, scrape_page_limited, get_page_url
+from utils.journal import STATUS_EMPTY, STATUS_FAILED, STATUS_OK
+from utils.rate_limit import HostRateLimiter
+
+WORK_QUEUE_PATH = os.getenv("WORK_QUEUE_PATH")
+WORK_QUEUE_WORKERS = int(os.getenv("WORK_QUEUE_WORKERS", "0"))
+WORK_LEASE_SECONDS = float(os.getenv("WORK_LEASE_SECONDS", "120"))
+WORK_MAX_ATTEMPTS = int(os.getenv("WORK_MAX_ATTEMPTS", "3"))
+WORK_CLAIM_BATCH = int(os.getenv("WORK_CLAIM_BATCH", "4"))
+WORK_POLL_INTERVAL = float(os.getenv("WORK_POLL_INTERVAL", "1"))
+
+STATUS_PENDING = "pending"
+STATUS_LEASED = "leased"
+
+
+def default_worker_id() -> str:
+    """ID worker yang unik per proses: host, PID, dan sufiks acak."""
+    return f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+
+
+class WorkQueue:
+    """
+    Antrean halaman berbasis SQLite untuk scraping terdistribusi, sekaligus
+    staging store hasilnya.
+
+    Setiap halaman adalah satu work item berisi URL dari `get_page_url`. Worker
+    mengklaim halaman dengan lease; jika worker mati, lease kedaluwarsa dan
+    halaman diklaim ulang worker lain. Halaman yang gagal dicoba lagi sampai
+    `max_attempts` klaim, lalu ditandai `failed`. Hasil hanya diterima dari
+    worker yang masih memegang klaim, sehingga setiap halaman tersimpan sekali.
+
+    Path file dapat dipakai bersama oleh beberapa proses (mode WAL); untuk
+    beberapa node, file harus berada di filesystem bersama yang mendukung
+    locking. `":memory:"` adalah pengganti lokal untuk worker berupa thread
+    dalam satu proses.
+    """
+
+    def __init__(self, path: str = WORK_QUEUE_PATH, max_attempts: int = WORK_MAX_ATTEMPTS):
+        if not path:
+            raise ValueError("Path antrean kerja belum diatur (WORK_QUEUE_PATH).")
+        if max_attempts < 1:
+            raise ValueError("Parameter 'max_attempts' harus bernilai minimal 1.")
+
+        self.path = path
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS work (
+                page INTEGER PRIMARY KEY,
+                url TEXT NOT NULL,
+                status TEXT NOT NULL,
+                worker TEXT,
+                lease_until REAL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                error TEXT,
+                updated_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_work_status ON work (status, page);
+            CREATE TABLE IF NOT EXISTS results (
+                page INTEGER PRIMARY KEY,
+                products TEXT NOT NULL,
+                worker TEXT NOT NULL,
+                recorded_at REAL NOT NULL
+            );
+            """
+        )
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        # BEGIN IMMEDIATE mengambil write lock di awal sehingga dua worker tidak
+        # dapat membaca halaman pending yang sama lalu sama-sama mengklaimnya.
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def enqueue(self, pages: Iterable[int]) -> int:
+        """Menambahkan halaman sebagai work item; halaman yang sudah ada tidak diubah."""
+        now = time.time()
+        with self._transaction() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO work (page, url, status, updated_at) VALUES (?, ?, ?, ?)",
+                [(page, get_page_url(page), STATUS_PENDING, now) for page in pages],
+            )
+            return conn.total_changes - before
+
+    def claim(self, worker: str, limit: int = 1, lease: float = WORK_LEASE_SECONDS) -> List[Tuple[int, str]]:
+        """
+        Mengklaim paling banyak `limit` halaman (pending atau lease-nya habis)
+        selama `lease` detik. Halaman dengan lease habis yang sudah mencapai
+        `max_attempts` ditandai gagal, bukan diklaim.
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            rows = conn.execute(
+                "SELECT page, url, attempts, status FROM work "
+                "WHERE status = ? OR (status = ? AND lease_until < ?) ORDER BY page LIMIT ?",
+                (STATUS_PENDING, STATUS_LEASED, now, limit),
+            ).fetchall()
+            claimed, expired = [], []
+            for page, url, attempts, status in rows:
+                if status == STATUS_LEASED and attempts >= self.max_attempts:
+                    expired.append((STATUS_FAILED, "Lease habis tanpa hasil", now, page))
+                else:
+                    claimed.append((page, url))
+            conn.executemany(
+                "UPDATE work SET status = ?, worker = NULL, lease_until = NULL, error = ?, updated_at = ? WHERE page = ?",
+                expired,
+            )
+            conn.executemany(
+                "UPDATE work SET status = ?, worker = ?, lease_until = ?, attempts = attempts + 1, updated_at = ? WHERE page = ?",
+                [(STATUS_LEASED, worker, now + lease, now, page) for page, _ in claimed],
+            )
+        return claimed
+
+    def complete(self, page: int, worker: str, products: List[Dict[str, str]]) -> bool:
+        """
+        Menyimpan produk satu halaman ke staging store. False jika klaim worker
+        sudah tidak berlaku (halaman diambil alih atau sudah selesai).
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            updated = conn.execute(
+                "UPDATE work SET status = ?, lease_until = NULL, error = NULL, updated_at = ? "
+                "WHERE page = ? AND worker = ? AND status = ?",
+                (STATUS_OK if products else STATUS_EMPTY, now, page, worker, STATUS_LEASED),
+            ).rowcount
+            if updated:
+                conn.execute(
+                    "INSERT OR REPLACE INTO results (page, products, worker, recorded_at) VALUES (?, ?, ?, ?)",
+                    (page, json.dumps(products, ensure_ascii=False), worker, now),
+                )
+        return bool(updated)
+
+    def fail(self, page: int, worker: str, error: str) -> bool:
+        """Melepas klaim halaman yang gagal: kembali pending, atau gagal permanen setelah `max_attempts`."""
+        with self._transaction() as conn:
+            return bool(conn.execute(
+                "UPDATE work SET status = CASE WHEN attempts >= ? THEN ? ELSE ? END, "
+                "worker = NULL, lease_until = NULL, error = ?, updated_at = ? "
+                "WHERE page = ? AND worker = ? AND status = ?",
+                (self.max_attempts, STATUS_FAILED, STATUS_PENDING, error, time.time(), page, worker, STATUS_LEASED),
+            ).rowcount)
+
+    def retry_failed(self) -> int:
+        """Mengembalikan halaman yang gagal permanen ke antrean dengan jumlah percobaan direset."""
+        with self._transaction() as conn:
+            return conn.execute(
+                "UPDATE work SET status = ?, attempts = 0, updated_at = ? WHERE status = ?",
+                (STATUS_PENDING, time.time(), STATUS_FAILED),
+            ).rowcount
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._conn.execute("SELECT status, COUNT(*) FROM work GROUP BY status").fetchall())
+
+    def finished(self) -> bool:
+        """True jika tidak ada halaman yang masih pending atau sedang diklaim."""
+        counts = self.counts()
+        return not counts.get(STATUS_PENDING) and not counts.get(STATUS_LEASED)
+
+    def failed(self) -> List[int]:
+        with self._lock:
+            return [page for (page,) in self._conn.execute(
+                "SELECT page FROM work WHERE status = ? ORDER BY page", (STATUS_FAILED,)
+            )]
+
+    def products(self, start_page: Optional[int] = None, end_page: Optional[int] = None) -> List[Dict[str, str]]:
+        """
+        Menggabungkan produk dari staging store sesuai urutan halaman, hanya
+        untuk halaman `start_page`..`end_page` jika diberikan (antrean yang
+        di-resume bisa berisi hasil halaman di luar rentang run ini).
+        """
+        all_products = []
+        with self._lock:
+            for (products,) in self._conn.execute(
+                "SELECT products FROM results WHERE page BETWEEN ? AND ? ORDER BY page",
+                (start_page or 1, end_page if end_page is not None else sys.maxsize),
+            ):
+                all_products.extend(json.loads(products))
+        return all_products
+
+    def reset(self) -> None:
+        """Menghapus semua work item dan hasil untuk memulai run baru."""
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM work")
+            conn.execute("DELETE FROM results")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def run_worker(
+    queue: WorkQueue,
+    worker: Optional[str] = None,
+    claim_batch: int = WORK_CLAIM_BATCH,
+    lease: float = WORK_LEASE_SECONDS,
+    rate_limit: Optional[float] = 0.5,
+    burst: int = 1,
+    cache: Optional[ResponseCache] = None,
+    parser: Optional[str] = None,
+    poll_interval: float = WORK_POLL_INTERVAL,
+    wait_for_work: bool = False,
+    stop: Optional[threading.Event] = None,
+) -> int:
+    """
+    Mengklaim dan men-scrape halaman dari antrean sampai semua halaman selesai,
+    lalu mengembalikan jumlah halaman yang diproses worker ini.
+
+    Selama masih ada halaman yang diklaim worker lain, worker menunggu
+    `poll_interval` detik dan mencoba lagi, sehingga halaman dari worker yang
+    mati diambil alih setelah lease-nya habis. Dengan `wait_for_work`, worker
+    tetap menunggu run berikutnya sampai `stop` di-set. `rate_limit` berlaku
+    per worker.
+    """
+    worker = worker or default_worker_id()
+    stop = stop or threading.Event()
+    limiter = HostRateLimiter(rate_limit, capacity=burst)
+    processed = 0
+    while not stop.is_set():
+        items = queue.claim(worker, claim_batch, lease)
+        if not items:
+            if queue.finished() and not wait_for_work:
+                break
+            stop.wait(poll_interval)
+            continue
+
+        for page, url in items:
+            if get_page_url(page) != url:
+                queue.fail(page, worker, f"URL worker {get_page_url(page)} berbeda dengan work item {url}")
+                continue
+            result = scrape_page_limited(page, limiter, cache=cache, parser=parser)
+            if result.error is None or result.not_found:
+                queue.complete(page, worker, result.products)
+            else:
+                queue.fail(page, worker, result.error)
+            processed += 1
+    print(f"[INFO] Worker {worker} selesai setelah {processed} halaman")
+    return processed
+
+
+def _worker_process(path: str, worker: str, base_url: str, options: Dict[str, any]) -> None:
+    # Proses di-spawn tanpa state induk: BASE_URL diteruskan eksplisit agar URL
+    # yang dibuat worker sama dengan URL di work item.
+    extract.BASE_URL = base_url
+    queue = WorkQueue(path)
+    try:
+        run_worker(queue, worker, **options)
+    finally:
+        queue.close()
+
+
+def start_local_workers(queue: WorkQueue, count: int, **options) -> list:
+    """
+    Menjalankan `count` worker lokal: proses terpisah untuk antrean di file,
+    atau thread untuk antrean `:memory:` (yang tidak dapat dibagi antar proses).
+    """
+    workers = []
+    context = multiprocessing.get_context("spawn")
+    for index in range(count):
+        worker = f"{default_worker_id()}-{index}"
+        if queue.path == ":memory:":
+            handle = threading.Thread(target=run_worker, args=(queue, worker), kwargs=options, daemon=True)
+        else:
+            handle = context.Process(target=_worker_process, args=(queue.path, worker, extract.BASE_URL, options))
+        handle.start()
+        workers.append(handle)
+    return workers
+
+
+def extract_distributed(
+    start_page: int = 1,
+    end_page: Optional[int] = 50,
+    workers: int = WORK_QUEUE_WORKERS,
+    path: Optional[str] = WORK_QUEUE_PATH,
+    resume: bool = False,
+    max_attempts: int = WORK_MAX_ATTEMPTS,
+    poll_interval: float = WORK_POLL_INTERVAL,
+    report: Optional[ExtractReport] = None,
+    **worker_options,
+) -> List[Dict[str, str]]:
+    """
+    Coordinator scraping terdistribusi: memasukkan halaman ke antrean,
+    menjalankan `workers` worker lokal, menunggu sampai semua halaman selesai
+    (termasuk yang dikerjakan worker di node lain lewat `python main.py --worker`),
+    lalu mengembalikan produk dari staging store sesuai urutan halaman.
+
+    Tanpa `resume`, antrean dikosongkan dulu; dengan `resume`, halaman yang
+    sudah selesai dilewati dan halaman yang gagal dicoba lagi. Jika `report`
+    diberikan, halaman yang gagal dan jumlah produk dicatat ke sana.
+    """
+    queue = WorkQueue(path or ":memory:", max_attempts)
+    try:
+        if resume:
+            queue.retry_failed()
+        else:
+            queue.reset()
+        end_page = resolve_end_page(end_page)
+        pages = range(start_page, end_page + 1)
+        added = queue.enqueue(pages)
+        print(f"[INFO] {added} halaman masuk antrean kerja {queue.path}, {workers} worker lokal")
+
+        started = time.perf_counter()
+        handles = start_local_workers(queue, workers, poll_interval=poll_interval, **worker_options)
+        for handle in handles:
+            handle.join()
+        crashed = [handle.name for handle in handles if getattr(handle, "exitcode", 0)]
+        if crashed and not queue.finished():
+            raise RuntimeError(f"Worker lokal berhenti dengan error: {', '.join(crashed)}")
+        while not queue.finished():
+            counts = queue.counts()
+            print(f"[INFO] Menunggu worker: {counts.get(STATUS_PENDING, 0)} pending, {counts.get(STATUS_LEASED, 0)} sedang dikerjakan")
+            time.sleep(max(poll_interval, 1.0))
+
+        counts = queue.counts()
+        print(
+            f"[INFO] Scraping terdistribusi selesai dalam {time.perf_counter() - started:.1f} detik: "
+            f"{counts.get(STATUS_OK, 0)} ok, {counts.get(STATUS_EMPTY, 0)} kosong, {counts.get(STATUS_FAILED, 0)} gagal"
+        )
+        failed = [page for page in queue.failed() if start_page <= page <= end_page]
+        if failed:
+            print(f"[WARN] Halaman gagal setelah {max_attempts} percobaan: {failed}")
+        products = queue.products(start_page, end_page)
+        if report is not None:
+            report.failed, report.products = failed, len(products)
+        return products
+    finally:
+        queue.close()
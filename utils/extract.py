@@ -1,8 +1,30 @@
+import os
+import sys
 import time
 import requests
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Dict
-from bs4 import BeautifulSoup
+from functools import partial
+from typing import List, Dict, Iterable, Iterator, Optional
+from bs4 import BeautifulSoup, SoupStrainer
+from utils.cache import ResponseCache, hash_body
+from utils.http_client import HTTP_POOL_SIZE, backoff_delay, fetch, get_session
+from utils.journal import RunJournal
+from utils.metrics import active_metrics
+from utils.records import RawProduct, raw_from_dict, to_dicts
+from utils.rate_limit import HostRateLimiter
+from utils.transform import type_record
+
+BASE_URL = os.getenv("FASHION_STUDIO_URL", "https://fashion-studio.dicoding.dev/")
+PARSER_BACKEND = os.getenv("PARSER_BACKEND", "html.parser")
+EXTRACT_RETRY_ROUNDS = int(os.getenv("EXTRACT_RETRY_ROUNDS", "2"))
+EMPTY_PAGE_LIMIT = int(os.getenv("EMPTY_PAGE_LIMIT", "3"))
+# Concurrency dan rate limit scraping; EXTRACT_RATE_LIMIT=0 berarti tanpa batas.
+EXTRACT_WORKERS = int(os.getenv("EXTRACT_WORKERS", "0")) or None
+EXTRACT_RATE_LIMIT = float(os.getenv("EXTRACT_RATE_LIMIT", "0.5")) or None
+EXTRACT_BURST = int(os.getenv("EXTRACT_BURST", "1"))
 
 def get_page_url(page: int) -> str:
     """
@@ -14,9 +36,10 @@ def get_page_url(page: int) -> str:
         if page < 1:
             raise ValueError("Parameter 'page' harus bernilai minimal 1.")
 
+        base_url = BASE_URL.rstrip('/') + '/'
         if page == 1:
-            return 'https://fashion-studio.dicoding.dev/'
-        return f'https://fashion-studio.dicoding.dev/page{page}'
+            return base_url
+        return f'{base_url}page{page}'
     except Exception as e:
         print(f"[ERROR] Gagal membuat URL untuk page {page}: {e}")
         raise
@@ -30,8 +53,11 @@ HEADERS = {
     )
 }
 
-def parse_product(product_element) -> Dict[str, str]:
-    """Ekstrak data produk dari elemen HTML dan mengembalikan sebagai dictionary."""
+def parse_product_record(product_element) -> RawProduct:
+    """
+    Ekstrak data produk dari elemen HTML sebagai `RawProduct`. Nilai yang
+    berulang antar produk (ukuran, gender) di-intern agar tidak disimpan berkali-kali.
+    """
     try:
         title = product_element.select_one('.product-title').get_text(strip=True)
         price = product_element.select_one('.price-container')
@@ -43,64 +69,469 @@ def parse_product(product_element) -> Dict[str, str]:
         size = details[2].get_text(strip=True).replace('Size: ', '') if len(details) > 2 else "N/A"
         gender = details[3].get_text(strip=True).replace('Gender: ', '') if len(details) > 3 else "N/A"
 
-        return {
-            "Title": title,
-            "Price": price,
-            "Rating": rating,
-            "Colors": colors,
-            "Size": size,
-            "Gender": gender,
-            "Timestamp": datetime.now().isoformat()
-        }
+        return RawProduct(
+            title, price, rating, sys.intern(colors), sys.intern(size), sys.intern(gender),
+            datetime.now().isoformat(),
+        )
     except Exception as e:
         print(f"[ERROR] Gagal mem-parsing produk: {e}")
-        return {
-            "Title": "N/A",
-            "Price": "N/A",
-            "Rating": "N/A",
-            "Colors": "N/A",
-            "Size": "N/A",
-            "Gender": "N/A",
-            "Timestamp": datetime.now().isoformat()
-        }
-
-def scrape_page(page: int) -> List[Dict[str, str]]:
-    """Melakukan scraping pada satu halaman dan mengembalikan daftar produk."""
+        return RawProduct("N/A", "N/A", "N/A", "N/A", "N/A", "N/A", datetime.now().isoformat())
+
+def parse_product(product_element) -> Dict[str, str]:
+    """Ekstrak data produk dari elemen HTML dan mengembalikan sebagai dictionary."""
+    return parse_product_record(product_element)._asdict()
+
+CARD_STRAINER = SoupStrainer(class_='collection-card')
+
+def _select_cards(html: str, features: str, parse_only: Optional[SoupStrainer] = None) -> list:
+    soup = BeautifulSoup(html, features, parse_only=parse_only)
+    return soup.select('.collection-card')
+
+PARSER_BACKENDS = {
+    'html.parser': lambda html: _select_cards(html, 'html.parser'),
+    'lxml': lambda html: _select_cards(html, 'lxml'),
+    'strainer': lambda html: _select_cards(html, 'html.parser', CARD_STRAINER),
+    'lxml-strainer': lambda html: _select_cards(html, 'lxml', CARD_STRAINER),
+}
+
+def available_parser_backends() -> List[str]:
+    """Daftar backend parser yang dependensinya terpasang."""
+    try:
+        import lxml  # noqa: F401
+        return list(PARSER_BACKENDS)
+    except ImportError:
+        return [name for name in PARSER_BACKENDS if not name.startswith('lxml')]
+
+def _parse_cards(html: str, backend: Optional[str], parse) -> list:
+    backend = backend or PARSER_BACKEND
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(f"Backend parser tidak dikenal: {backend}")
+
+    metrics = active_metrics()
+    if metrics is None:
+        return [parse(element) for element in PARSER_BACKENDS[backend](html)]
+
+    products = []
+    for element in PARSER_BACKENDS[backend](html):
+        started = time.perf_counter()
+        products.append(parse(element))
+        metrics.observe("parse_card_seconds", time.perf_counter() - started)
+    return products
+
+def _card_record(card, timestamp: str) -> RawProduct:
+    """
+    Versi satu-lintasan dari `parse_product_record`: subtree kartu ditelusuri
+    sekali untuk mengumpulkan judul, harga, dan elemen `<p>`, lalu nilainya
+    diambil dengan aturan yang sama. Timestamp diberikan oleh pemanggil.
+    """
+    title = price = None
+    details = []
+    for element in card.descendants:
+        name = element.name
+        if name is None:
+            continue
+        if name == 'p':
+            details.append(element)
+        classes = element.get('class')
+        if classes:
+            if title is None and 'product-title' in classes:
+                title = element
+            if price is None and 'price-container' in classes:
+                price = element
+
+    if title is None:
+        print("[ERROR] Gagal mem-parsing produk: judul produk tidak ditemukan")
+        return RawProduct("N/A", "N/A", "N/A", "N/A", "N/A", "N/A", timestamp)
+
+    count = len(details)
+    return RawProduct(
+        title.get_text(strip=True),
+        price.get_text(strip=True) if price else "N/A",
+        details[0].get_text(strip=True).replace('Rating: ', '') if count > 0 else "N/A",
+        sys.intern(details[1].get_text(strip=True)) if count > 1 else "N/A",
+        sys.intern(details[2].get_text(strip=True).replace('Size: ', '')) if count > 2 else "N/A",
+        sys.intern(details[3].get_text(strip=True).replace('Gender: ', '')) if count > 3 else "N/A",
+        timestamp,
+    )
+
+def parse_page_batch(
+    html: str,
+    backend: Optional[str] = None,
+    timestamp: Optional[str] = None,
+    typed: bool = False,
+) -> list:
+    """
+    Mem-parsing seluruh kartu satu halaman sekaligus menjadi `RawProduct`.
+
+    Timestamp diambil sekali per halaman, atau diberikan pemanggil agar sama
+    untuk satu run. Dengan `typed=True` hasilnya berupa `TypedProduct` yang
+    nilainya sudah dibersihkan, sehingga transform tidak mem-parsing ulang string.
+    Nilai field sama dengan `parse_product` untuk setiap kartu.
+    """
+    timestamp = timestamp or datetime.now().isoformat()
+    records = _parse_cards(html, backend, partial(_card_record, timestamp=timestamp))
+    if not typed:
+        return records
+
+    memo = {}
+    return [type_record(record, memo) for record in records]
+
+def parse_page(html: str, backend: Optional[str] = None) -> List[Dict[str, str]]:
+    """
+    Mem-parsing HTML satu halaman menjadi daftar produk.
+
+    `html.parser` adalah backend referensi; `strainer` hanya membangun subtree
+    `.collection-card`, sedangkan backend `lxml` memerlukan paket lxml.
+    """
+    return to_dicts(parse_page_batch(html, backend))
+
+def _record_fetch(page: int, started: float, response) -> None:
+    """Mencatat latensi dan ukuran respons satu halaman jika metrik aktif."""
+    metrics = active_metrics()
+    if metrics is not None:
+        latency = time.perf_counter() - started
+        size = len(response.content or b"")
+        metrics.observe("fetch_seconds", latency)
+        metrics.observe("fetch_bytes", size)
+        metrics.record_page(page, fetch_seconds=latency, bytes=size, status=response.status_code)
+
+def _record_parse(page: int, started: float, products: List[Dict[str, str]]) -> None:
+    """Mencatat waktu parsing satu halaman jika metrik aktif."""
+    metrics = active_metrics()
+    if metrics is not None:
+        elapsed = time.perf_counter() - started
+        metrics.observe("parse_page_seconds", elapsed)
+        metrics.increment("parsed_cards", len(products))
+        metrics.record_page(page, parse_seconds=elapsed, cards=len(products))
+
+def fetch_page_html(page: int) -> Optional[str]:
+    """Mengambil HTML mentah satu halaman tanpa parsing, atau None jika gagal."""
     url = get_page_url(page)
-    print(f"[INFO] Scraping halaman {page}: {url}")
-    
+    print(f"[INFO] Mengambil halaman {page}: {url}")
+
     try:
-        response = requests.get(url, headers=HEADERS, timeout=10)
+        started = time.perf_counter()
+        response = fetch(url, headers=HEADERS, timeout=10)
+        _record_fetch(page, started, response)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        product_elements = soup.select('.collection-card')
-        
-        if not product_elements:
-            print(f"[WARNING] Tidak ada produk ditemukan di halaman {page}")
-            return []
-
-        return [parse_product(element) for element in product_elements]
-    
+        return response.text
     except requests.Timeout:
         print(f"[ERROR] Timeout saat mengakses halaman {page}")
     except requests.ConnectionError:
         print(f"[ERROR] Koneksi gagal saat mengakses halaman {page}")
     except requests.HTTPError as e:
         print(f"[ERROR] HTTP error ({e.response.status_code}) pada halaman {page}")
-    except Exception as parse_error:
-        print(f"[ERROR] Gagal memproses halaman {page}: {parse_error}")
-    
-    return []
-
-def extract_data(start_page: int = 1, end_page: int = 50) -> List[Dict[str, str]]:
-    """Scrape data dari beberapa halaman dan mengembalikan sebagai list of dictionaries."""
-    all_products = []
-    for page in range(start_page, end_page + 1):
+    except Exception as e:
+        print(f"[ERROR] Gagal mengambil halaman {page}: {e}")
+
+    return None
+
+def _refresh_timestamps(products: list) -> list:
+    """Memperbarui Timestamp produk dari cache (dict atau `RawProduct`) ke waktu scraping saat ini."""
+    timestamp = datetime.now().isoformat()
+    return [
+        product._replace(Timestamp=timestamp) if isinstance(product, tuple) else {**product, "Timestamp": timestamp}
+        for product in products
+    ]
+
+def scrape_page_checked(
+    page: int,
+    cache: Optional[ResponseCache] = None,
+    parser: Optional[str] = None,
+    as_records: bool = False,
+) -> list:
+    """
+    Seperti `scrape_page`, tetapi kegagalan (timeout, koneksi, HTTP error, atau
+    parsing) diteruskan sebagai exception sehingga halaman gagal dapat dibedakan
+    dari halaman yang memang tidak berisi produk. Dengan `as_records=True`
+    hasilnya berupa `RawProduct` langsung dari `parse_page_batch`; cache tetap
+    menyimpan dict.
+    """
+    url = get_page_url(page)
+    print(f"[INFO] Scraping halaman {page}: {url}")
+
+    cached = cache.get(url) if cache else None
+    request_headers = {**HEADERS, **cached.conditional_headers()} if cached else HEADERS
+    started = time.perf_counter()
+    response = fetch(url, headers=request_headers, timeout=10)
+    _record_fetch(page, started, response)
+
+    if cached and response.status_code == 304:
+        print(f"[INFO] Halaman {page} tidak berubah (304), memakai cache")
+        cache.touch(url)
+        products = [raw_from_dict(product) for product in cached.products] if as_records else cached.products
+        return _refresh_timestamps(products)
+
+    response.raise_for_status()
+    body_hash = hash_body(response.content) if cache else None
+    unchanged = cached is not None and cached.body_hash == body_hash
+    if unchanged:
+        print(f"[INFO] Isi halaman {page} tidak berubah, parsing dilewati")
+        stored = cached.products
+        products = [raw_from_dict(product) for product in stored] if as_records else stored
+    else:
+        started = time.perf_counter()
+        records = parse_page_batch(response.text, parser)
+        stored = to_dicts(records) if cache or not as_records else None
+        products = records if as_records else stored
+        _record_parse(page, started, products)
+
+    if cache:
+        cache.put(
+            url,
+            body_hash,
+            stored,
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified'),
+        )
+
+    if not products:
+        print(f"[WARNING] Tidak ada produk ditemukan di halaman {page}")
+        return []
+
+    return _refresh_timestamps(products) if unchanged else products
+
+def describe_error(page: int, error: Exception) -> str:
+    """Pesan error yang mudah dibaca untuk kegagalan scraping satu halaman."""
+    if isinstance(error, requests.Timeout):
+        return f"Timeout saat mengakses halaman {page}"
+    if isinstance(error, requests.ConnectionError):
+        return f"Koneksi gagal saat mengakses halaman {page}"
+    if isinstance(error, requests.HTTPError):
+        return f"HTTP error ({error.response.status_code}) pada halaman {page}"
+    return f"Gagal memproses halaman {page}: {error}"
+
+def scrape_page(page: int, cache: Optional[ResponseCache] = None, parser: Optional[str] = None) -> List[Dict[str, str]]:
+    """
+    Melakukan scraping pada satu halaman dan mengembalikan daftar produk.
+
+    Jika `cache` diberikan, halaman direvalidasi dengan If-None-Match/If-Modified-Since
+    dan parsing dilewati bila halaman tidak berubah. `parser` memilih backend
+    dari `PARSER_BACKENDS`. Kegagalan dicatat dan menghasilkan list kosong;
+    gunakan `scrape_page_checked` untuk membedakannya dari halaman kosong.
+    """
+    try:
+        return scrape_page_checked(page, cache, parser)
+    except Exception as error:
+        print(f"[ERROR] {describe_error(page, error)}")
+        return []
+
+@dataclass
+class PageResult:
+    """
+    Hasil scraping satu halaman; `error` terisi jika halaman gagal diambil dan
+    `not_found` bernilai True jika server menjawab 404 (halaman tidak ada).
+    """
+    page: int
+    products: List[Dict[str, str]]
+    error: Optional[str] = None
+    not_found: bool = False
+
+    @property
+    def empty(self) -> bool:
+        """Halaman tanpa produk: kosong atau tidak ada, tetapi bukan gagal sementara."""
+        return not self.products and (self.error is None or self.not_found)
+
+@dataclass
+class ExtractReport:
+    """
+    Kelengkapan satu run extract, diisi oleh `extract_data` dan
+    `utils.distributed.extract_distributed`: halaman yang tetap gagal setelah
+    retry, halaman tempat ekstraksi berhenti lebih awal karena halaman kosong
+    berturut-turut, dan jumlah produk.
+    """
+    failed: List[int] = field(default_factory=list)
+    stopped_at: Optional[int] = None
+    products: int = 0
+
+    @property
+    def complete(self) -> bool:
+        """True jika semua halaman dalam rentang terbaca dan ada produk yang diekstrak."""
+        return not self.failed and self.stopped_at is None and self.products > 0
+
+    def describe(self) -> str:
+        if self.failed:
+            return f"{len(self.failed)} halaman gagal"
+        if self.stopped_at is not None:
+            return f"berhenti lebih awal di halaman {self.stopped_at}"
+        return "tidak ada produk"
+
+def scrape_page_limited(page: int, limiter: HostRateLimiter, **scrape_kwargs) -> PageResult:
+    """
+    Scrape satu halaman setelah mendapat giliran dari rate limiter host.
+    Kegagalan tidak dilempar, tetapi dikembalikan sebagai `PageResult` dengan
+    `error` terisi. Dipakai juga oleh worker `utils.distributed`.
+    """
+    try:
+        limiter.acquire(get_page_url(page))
+        return PageResult(page, scrape_page_checked(page, **scrape_kwargs))
+    except Exception as error:
+        message = describe_error(page, error)
+        print(f"[ERROR] {message}")
+        not_found = isinstance(error, requests.HTTPError) and error.response.status_code == 404
+        return PageResult(page, [], message, not_found)
+
+def iter_page_results(
+    pages: Iterable[int],
+    max_workers: int = 1,
+    rate_limit: Optional[float] = 0.5,
+    burst: int = 1,
+    cache: Optional[ResponseCache] = None,
+    parser: Optional[str] = None,
+    empty_page_limit: int = 0,
+    as_records: bool = False,
+) -> Iterator[PageResult]:
+    """
+    Menghasilkan `PageResult` untuk setiap nomor halaman di `pages`, berurutan.
+
+    Paling banyak `2 * max_workers` halaman berada dalam proses atau menunggu
+    dikonsumsi, sehingga memori tetap terbatas berapa pun jumlah halamannya.
+    Jika `empty_page_limit` lebih dari 0, iterasi berhenti setelah sejumlah itu
+    halaman kosong (atau 404) berturut-turut. `as_records` diteruskan ke
+    `scrape_page_checked`.
+    """
+    if max_workers < 1:
+        raise ValueError("Parameter 'max_workers' harus bernilai minimal 1.")
+
+    get_session(pool_size=max(max_workers, HTTP_POOL_SIZE))
+    limiter = HostRateLimiter(rate_limit, capacity=burst)
+    scrape = partial(scrape_page_limited, limiter=limiter, cache=cache, parser=parser, as_records=as_records)
+    results = _ordered_results(scrape, pages, max_workers)
+
+    empty_streak = 0
+    for result in results:
+        yield result
+        empty_streak = empty_streak + 1 if result.empty else 0
+        if empty_page_limit and empty_streak >= empty_page_limit:
+            print(f"[INFO] {empty_streak} halaman kosong berturut-turut, berhenti di halaman {result.page}")
+            results.close()
+            return
+
+def _ordered_results(scrape, pages: Iterable[int], max_workers: int) -> Iterator[PageResult]:
+    if max_workers == 1:
+        for page in pages:
+            yield scrape(page)
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
         try:
-            products = scrape_page(page)
-            all_products.extend(products)
-            time.sleep(2)
-        except Exception as e:
-            print(f"[ERROR] Gagal mengekstrak data dari halaman {page}: {e}")
-    print(f"[INFO] Total produk yang diekstrak: {len(all_products)}")
+            for page in pages:
+                pending.append(executor.submit(scrape, page))
+                if len(pending) >= 2 * max_workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+def resolve_end_page(end_page: Optional[int]) -> int:
+    """`end_page` apa adanya, atau halaman terakhir dari `utils.pagination.discover_last_page` jika None."""
+    if end_page is not None:
+        return end_page
+    from utils.pagination import discover_last_page
+    return discover_last_page()
+
+def iter_pages(
+    start_page: int = 1,
+    end_page: Optional[int] = 50,
+    max_workers: int = 1,
+    rate_limit: Optional[float] = 0.5,
+    burst: int = 1,
+    cache: Optional[ResponseCache] = None,
+    parser: Optional[str] = None,
+) -> Iterator[List[Dict[str, str]]]:
+    """
+    Menghasilkan daftar produk per halaman secara berurutan (generator).
+    Halaman yang gagal menghasilkan list kosong. Jika `end_page` None, jumlah
+    halaman ditemukan otomatis lewat `utils.pagination.discover_last_page`.
+    """
+    pages = range(start_page, resolve_end_page(end_page) + 1)
+    results = iter_page_results(pages, max_workers, rate_limit, burst, cache, parser, EMPTY_PAGE_LIMIT)
+    for result in results:
+        yield result.products
+
+def extract_data(
+    start_page: int = 1,
+    end_page: Optional[int] = 50,
+    max_workers: int = 1,
+    rate_limit: Optional[float] = 0.5,
+    burst: int = 1,
+    cache: Optional[ResponseCache] = None,
+    parser: Optional[str] = None,
+    journal: Optional[RunJournal] = None,
+    resume: bool = False,
+    retry_rounds: int = EXTRACT_RETRY_ROUNDS,
+    empty_page_limit: int = EMPTY_PAGE_LIMIT,
+    as_records: bool = False,
+    report: Optional[ExtractReport] = None,
+) -> list:
+    """
+    Scrape data dari beberapa halaman dan mengembalikan sebagai list of dictionaries,
+    atau list `RawProduct` jika `as_records=True` (tanpa membuat dict per produk;
+    cocok untuk `transform_records`).
+
+    `max_workers` menentukan jumlah halaman yang di-fetch bersamaan, sedangkan
+    `rate_limit` (request per detik per host, None berarti tanpa batas) dan
+    `burst` mengatur token bucket pengganti jeda tetap antar halaman.
+    Hasil selalu dikembalikan sesuai urutan halaman. `cache` mengaktifkan
+    revalidasi kondisional sehingga halaman yang tidak berubah tidak di-parse ulang,
+    dan `parser` memilih backend parsing HTML. Jika `end_page` None, halaman
+    terakhir ditemukan otomatis; ekstraksi juga berhenti lebih awal setelah
+    `empty_page_limit` halaman kosong berturut-turut.
+
+    Halaman yang gagal masuk antrean retry dan dicoba ulang hingga `retry_rounds`
+    putaran setelah putaran utama. Jika `journal` diberikan, hasil setiap halaman
+    dicatat ke disk; dengan `resume=True` hanya halaman yang belum tercatat atau
+    gagal yang diambil ulang, sisanya dibaca dari journal. Jika `report`
+    diberikan, kelengkapan run dicatat ke sana (lihat `ExtractReport`).
+    """
+    started = time.perf_counter()
+    pages = range(start_page, resolve_end_page(end_page) + 1)
+    if journal is not None and not resume:
+        journal.reset()
+    queue = journal.pending(pages) if journal is not None and resume else list(pages)
+    if resume and journal is not None:
+        print(f"[INFO] Melanjutkan run: {len(pages) - len(queue)} halaman dari journal, {len(queue)} halaman diambil")
+
+    results = {}
+    stopped_at = None
+    for attempt in range(retry_rounds + 1):
+        if attempt:
+            print(f"[INFO] Retry putaran {attempt}: {len(queue)} halaman gagal")
+            time.sleep(backoff_delay(attempt))
+
+        failed = []
+        fetched = 0
+        limit = 0 if attempt else empty_page_limit
+        for result in iter_page_results(queue, max_workers, rate_limit, burst, cache, parser, limit, as_records):
+            fetched += 1
+            if journal is not None:
+                journal.record(result.page, to_dicts(result.products) if as_records else result.products, result.error)
+            else:
+                results[result.page] = result.products
+            if result.error is not None and not result.not_found:
+                failed.append(result.page)
+        if not attempt and fetched < len(queue):
+            stopped_at = result.page
+
+        queue = failed
+        if not queue:
+            break
+
+    if queue:
+        print(f"[WARN] {len(queue)} halaman tetap gagal setelah retry: {queue}")
+
+    if journal is not None:
+        all_products = journal.products(pages)
+        if as_records:
+            all_products = [raw_from_dict(product) for product in all_products]
+    else:
+        all_products = [product for page in pages for product in results.get(page, [])]
+
+    elapsed = time.perf_counter() - started
+    print(f"[INFO] Total produk yang diekstrak: {len(all_products)} ({elapsed:.2f} detik)")
+    if report is not None:
+        report.failed, report.stopped_at, report.products = list(queue), stopped_at, len(all_products)
     return all_products
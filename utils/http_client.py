@@ -0,0 +1,152 @@
+import os
+import random
+import time
+import threading
+import requests
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from requests.adapters import HTTPAdapter
+
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "10"))
+HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "3"))
+HTTP_BACKOFF_FACTOR = float(os.getenv("HTTP_BACKOFF_FACTOR", "0.5"))
+HTTP_BACKOFF_MAX = float(os.getenv("HTTP_BACKOFF_MAX", "30"))
+
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+@dataclass
+class FetchStats:
+    """Statistik pengambilan satu URL: jumlah percobaan, latensi, dan status akhir."""
+    url: str
+    attempts: int = 0
+    latencies: List[float] = field(default_factory=list)
+    status_code: Optional[int] = None
+    error: Optional[str] = None
+
+    @property
+    def retries(self) -> int:
+        return max(self.attempts - 1, 0)
+
+    @property
+    def total_latency(self) -> float:
+        return sum(self.latencies)
+
+
+_session: Optional[requests.Session] = None
+_session_pool_size = 0
+_session_lock = threading.Lock()
+_stats: Dict[str, FetchStats] = {}
+_stats_lock = threading.Lock()
+
+
+def create_session(pool_size: int = HTTP_POOL_SIZE) -> requests.Session:
+    """Membuat session HTTP dengan connection pool dan keep-alive."""
+    if pool_size < 1:
+        raise ValueError("Parameter 'pool_size' harus bernilai minimal 1.")
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"Connection": "keep-alive"})
+    return session
+
+
+def get_session(pool_size: int = HTTP_POOL_SIZE) -> requests.Session:
+    """
+    Mengembalikan session bersama. Session dibuat ulang hanya jika pool
+    yang ada lebih kecil dari `pool_size` yang diminta.
+    """
+    global _session, _session_pool_size
+    with _session_lock:
+        if _session is None or pool_size > _session_pool_size:
+            if _session is not None:
+                _session.close()
+            _session = create_session(pool_size)
+            _session_pool_size = pool_size
+        return _session
+
+
+def close_session() -> None:
+    """Menutup session bersama beserta seluruh koneksinya."""
+    global _session, _session_pool_size
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+        _session_pool_size = 0
+
+
+def backoff_delay(attempt: int, factor: float = HTTP_BACKOFF_FACTOR, maximum: float = HTTP_BACKOFF_MAX) -> float:
+    """Menghitung jeda exponential backoff dengan full jitter untuk percobaan ke-`attempt`."""
+    return random.uniform(0, min(maximum, factor * (2 ** attempt)))
+
+
+def _retry_after(response: requests.Response) -> Optional[float]:
+    try:
+        return float(response.headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return None
+
+
+def _record(stats: FetchStats) -> None:
+    with _stats_lock:
+        _stats[stats.url] = stats
+
+
+def fetch(
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = 10,
+    max_retries: int = HTTP_MAX_RETRIES,
+    backoff_factor: float = HTTP_BACKOFF_FACTOR,
+    session: Optional[requests.Session] = None,
+) -> requests.Response:
+    """
+    Melakukan GET melalui session bersama dengan retry untuk timeout,
+    respons 5xx, dan 429. Respons terakhir dikembalikan apa adanya sehingga
+    pemanggil tetap bisa memakai `raise_for_status()`.
+    """
+    session = session or get_session()
+    stats = FetchStats(url=url)
+
+    try:
+        for attempt in range(max_retries + 1):
+            stats.attempts += 1
+            started = time.perf_counter()
+            try:
+                response = session.get(url, headers=headers, timeout=timeout)
+            except requests.Timeout as e:
+                stats.latencies.append(time.perf_counter() - started)
+                stats.error = f"timeout: {e}"
+                if attempt == max_retries:
+                    raise
+                time.sleep(backoff_delay(attempt, backoff_factor))
+                continue
+
+            stats.latencies.append(time.perf_counter() - started)
+            stats.status_code = response.status_code
+            stats.error = None
+            if response.status_code not in RETRY_STATUS_CODES or attempt == max_retries:
+                return response
+
+            delay = backoff_delay(attempt, backoff_factor)
+            if response.status_code == 429:
+                delay = max(delay, _retry_after(response) or 0.0)
+            print(f"[WARNING] Status {response.status_code} dari {url}, mencoba lagi dalam {delay:.2f} detik")
+            time.sleep(delay)
+    finally:
+        _record(stats)
+
+
+def get_fetch_stats() -> Dict[str, FetchStats]:
+    """Mengembalikan salinan statistik fetch per URL."""
+    with _stats_lock:
+        return dict(_stats)
+
+
+def reset_fetch_stats() -> None:
+    """Menghapus seluruh statistik fetch yang tersimpan."""
+    with _stats_lock:
+        _stats.clear()
@@ -0,0 +1,124 @@
+import os
+import re
+import json
+import time
+import threading
+from dataclasses import dataclass, field
+from typing import List, Dict, Iterable, Optional
+
+EXTRACT_JOURNAL_DIR = os.getenv("EXTRACT_JOURNAL_DIR")
+
+STATUS_OK = "ok"
+STATUS_EMPTY = "empty"
+STATUS_FAILED = "failed"
+
+PAGE_FILE = re.compile(r"page-(\d+)\.json")
+
+
+@dataclass
+class PageRecord:
+    """Status satu halaman di journal beserta produk hasil parsing-nya."""
+    page: int
+    status: str
+    products: List[Dict[str, str]] = field(default_factory=list)
+    error: Optional[str] = None
+    attempts: int = 1
+    recorded_at: float = 0.0
+
+
+def _write_json_atomic(path: str, payload) -> None:
+    """Menulis JSON ke file sementara lalu menggantikan file tujuan dengan os.replace."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as file:
+        json.dump(payload, file, ensure_ascii=False)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp_path, path)
+
+
+class RunJournal:
+    """
+    Journal run ekstraksi di disk: satu file JSON per halaman berisi status
+    (`ok`, `empty`, atau `failed`) dan produk hasil parsing.
+
+    Setiap file ditulis secara atomik, sehingga crash di tengah run hanya
+    kehilangan halaman yang sedang diproses. Run berikutnya dapat melanjutkan
+    dengan mengambil halaman yang belum tercatat atau gagal saja.
+    """
+
+    def __init__(self, path: str = EXTRACT_JOURNAL_DIR):
+        if not path:
+            raise ValueError("Direktori journal belum diatur (EXTRACT_JOURNAL_DIR).")
+
+        self.path = path
+        self._lock = threading.Lock()
+        os.makedirs(path, exist_ok=True)
+        self._records = self._load()
+
+    def _page_path(self, page: int) -> str:
+        return os.path.join(self.path, f"page-{page:05d}.json")
+
+    def _load(self) -> Dict[int, PageRecord]:
+        records = {}
+        for name in os.listdir(self.path):
+            if not PAGE_FILE.fullmatch(name):
+                continue
+            try:
+                with open(os.path.join(self.path, name), encoding="utf-8") as file:
+                    record = PageRecord(**json.load(file))
+            except (OSError, ValueError, TypeError) as error:
+                print(f"[WARN] Entri journal {name} rusak dan diabaikan: {error}")
+                continue
+            records[record.page] = record
+        return records
+
+    def record(self, page: int, products: List[Dict[str, str]], error: Optional[str] = None) -> PageRecord:
+        """Mencatat hasil satu halaman; produk halaman yang gagal tidak disimpan."""
+        if error is not None:
+            status = STATUS_FAILED
+        else:
+            status = STATUS_OK if products else STATUS_EMPTY
+
+        with self._lock:
+            previous = self._records.get(page)
+            record = PageRecord(
+                page=page,
+                status=status,
+                products=list(products) if error is None else [],
+                error=error,
+                attempts=previous.attempts + 1 if previous else 1,
+                recorded_at=time.time(),
+            )
+            _write_json_atomic(self._page_path(page), record.__dict__)
+            self._records[page] = record
+        return record
+
+    def get(self, page: int) -> Optional[PageRecord]:
+        return self._records.get(page)
+
+    def pending(self, pages: Iterable[int]) -> List[int]:
+        """Halaman yang belum tercatat atau tercatat gagal."""
+        return [
+            page for page in pages
+            if page not in self._records or self._records[page].status == STATUS_FAILED
+        ]
+
+    def failed(self) -> List[int]:
+        return sorted(page for page, record in self._records.items() if record.status == STATUS_FAILED)
+
+    def products(self, pages: Iterable[int]) -> List[Dict[str, str]]:
+        """Menggabungkan produk dari journal sesuai urutan halaman."""
+        all_products = []
+        for page in pages:
+            record = self._records.get(page)
+            if record is not None:
+                all_products.extend(record.products)
+        return all_products
+
+    def reset(self) -> None:
+        """Menghapus semua catatan untuk memulai run baru dari awal."""
+        with self._lock:
+            for name in os.listdir(self.path):
+                if PAGE_FILE.fullmatch(name):
+                    os.remove(os.path.join(self.path, name))
+            self._records = {}
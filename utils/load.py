@@ -1,49 +1,276 @@
+import io
 import os
-import pandas as pd
-from typing import List, Dict
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
-from sqlalchemy import create_engine
+import re
+import json
+import uuid
+import importlib
+import threading
+from datetime import datetime
+from functools import lru_cache
+from typing import List, Dict, Iterable, Mapping, Optional
+from utils.rate_limit import TokenBucket
+from utils.sinks import register_sink
 
 CSV_FILENAME = os.getenv("CSV_FILENAME")
 GSHEET_SERVICE_ACCOUNT_FILE = os.getenv("GSHEET_SERVICE_ACCOUNT_FILE")
 GSHEET_SPREADSHEET_ID = os.getenv("GSHEET_SPREADSHEET_ID")
 GSHEET_RANGE = os.getenv("GSHEET_RANGE")
+GSHEET_SNAPSHOT_PATH = os.getenv("GSHEET_SNAPSHOT_PATH")
+GSHEET_CHUNK_ROWS = int(os.getenv("GSHEET_CHUNK_ROWS", "1000"))
+GSHEET_WRITE_RATE = float(os.getenv("GSHEET_WRITE_RATE", "1"))
+PARQUET_DIR = os.getenv("PARQUET_DIR")
+PARQUET_FORMAT = os.getenv("PARQUET_FORMAT", "parquet")
 POSTGRESQL_URL = os.getenv("POSTGRESQL_URL")
+POSTGRESQL_TABLE = os.getenv("POSTGRESQL_TABLE", "fashion_data")
+POSTGRESQL_BATCH_SIZE = int(os.getenv("POSTGRESQL_BATCH_SIZE", "5000"))
 
-def load_to_csv(cleaned_data: List[Dict[str, any]], filename: str = CSV_FILENAME) -> None:
+
+class _LazyModule:
+    """
+    Modul dependensi sink yang baru diimpor saat atributnya pertama kali dipakai,
+    sehingga `import utils.load` tidak memuat pandas, pyarrow, SQLAlchemy, atau
+    client Google untuk sink yang tidak dijalankan.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+
+    def __getattr__(self, attribute: str):
+        return getattr(importlib.import_module(self._name), attribute)
+
+
+class _LazyFunction:
+    """Fungsi dari modul dependensi sink yang baru diimpor saat dipanggil."""
+
+    def __init__(self, module: str, name: str):
+        self._module = module
+        self._name = name
+
+    def __call__(self, *args, **kwargs):
+        return getattr(importlib.import_module(self._module), self._name)(*args, **kwargs)
+
+
+pd = _LazyModule("pandas")
+pa = _LazyModule("pyarrow")
+ds = _LazyModule("pyarrow.dataset")
+pq = _LazyModule("pyarrow.parquet")
+pafs = _LazyModule("pyarrow.fs")
+service_account = _LazyModule("google.oauth2.service_account")
+build = _LazyFunction("googleapiclient.discovery", "build")
+create_engine = _LazyFunction("sqlalchemy", "create_engine")
+text = _LazyFunction("sqlalchemy", "text")
+
+COLUMNS = ["Title", "Price", "Rating", "Colors", "Size", "Gender", "Timestamp"]
+UNIQUE_KEY = ["Title", "Price", "Rating", "Colors", "Size", "Gender"]
+
+
+@lru_cache(maxsize=None)
+def arrow_schema():
+    """Skema Arrow untuk output kolumnar (dibuat saat pertama kali dibutuhkan)."""
+    return pa.schema([
+        ("Title", pa.string()),
+        ("Price", pa.float64()),
+        ("Rating", pa.float64()),
+        ("Colors", pa.int64()),
+        ("Size", pa.string()),
+        ("Gender", pa.string()),
+        ("Timestamp", pa.timestamp("us")),
+    ])
+
+
+def _frame(rows: Iterable) -> "pd.DataFrame":
+    """
+    DataFrame dari baris dict, record `Product`, atau snapshot read-only dari
+    `run_sinks` (`MappingProxyType`). pandas mengurutkan kolom mapping selain
+    dict secara alfabetis, sehingga baris seperti itu disalin ke dict dulu agar
+    urutan kolom tetap mengikuti data.
+    """
+    rows = list(rows)
+    if rows and isinstance(rows[0], Mapping) and not isinstance(rows[0], dict):
+        rows = [dict(row) for row in rows]
+    return pd.DataFrame(rows)
+
+
+PARTITION_FIELD = "scrape_date"
+DEFAULT_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+COLUMNAR_EXTENSIONS = {"parquet": ".parquet", "arrow": ".arrow"}
+
+_engines = {}
+_engines_lock = threading.Lock()
+_sheets_service = None
+_sheets_lock = threading.Lock()
+
+def load_to_csv(cleaned_data: List[Dict[str, any]], filename: str = CSV_FILENAME) -> bool:
     """
-    Menyimpan data bersih ke dalam file CSV.
+    Menyimpan data bersih ke dalam file CSV. Mengembalikan False jika gagal.
     """
     if not cleaned_data:
         print("[WARN] Tidak ada data untuk disimpan ke CSV.")
-        return
+        return True
 
     try:
-        df = pd.DataFrame(cleaned_data)
+        df = _frame(cleaned_data)
         df.to_csv(filename, index=False, encoding="utf-8")
         print(f"[INFO] Data berhasil disimpan ke file CSV: {filename}")
+        return True
     except Exception as error:
         print(f"[ERROR] Gagal menyimpan data ke CSV: {error}")
+        return False
+
+
+def _partition_tables(rows: List[Dict[str, any]]):
+    """
+    Mengubah baris menjadi tabel Arrow bertipe sesuai `arrow_schema()`, dipisah per
+    tanggal scraping (YYYY-MM-DD dari kolom Timestamp).
+    """
+    df = pd.DataFrame(list(rows), columns=COLUMNS)
+    df["Timestamp"] = pd.to_datetime(df["Timestamp"], format="ISO8601", errors="coerce")
+    dates = df["Timestamp"].dt.strftime("%Y-%m-%d").fillna(DEFAULT_PARTITION)
+    for date, group in df.groupby(dates, sort=True):
+        yield date, pa.Table.from_pandas(group, schema=arrow_schema(), preserve_index=False)
+
+
+class ParquetStreamWriter:
+    """
+    Menulis data bersih ke dataset kolumnar yang dipartisi per tanggal scraping:
+    `<root>/scrape_date=YYYY-MM-DD/part-<waktu>-<id>.parquet`.
+
+    Setiap run menulis file baru per partisi (setiap batch menjadi satu row group),
+    sehingga data lama tidak pernah ditulis ulang. File ditulis dengan nama
+    sementara berawalan titik lalu di-rename saat `close`, sehingga pembaca tidak
+    pernah melihat file setengah jadi. Dengan `format="arrow"` file ditulis
+    sebagai Arrow IPC tanpa kompresi yang bisa di-memory-map tanpa salinan.
+    """
+
+    def __init__(self, root: str = PARQUET_DIR, format: str = PARQUET_FORMAT):
+        if not root:
+            raise ValueError("Direktori output belum diatur (PARQUET_DIR).")
+        if format not in COLUMNAR_EXTENSIONS:
+            raise ValueError(f"Format kolumnar tidak dikenal: {format}")
+
+        self.root = root
+        self.format = format
+        self.run_id = f"{datetime.now():%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}"
+        self.rows = 0
+        self._writers = {}
+
+    def _writer(self, date: str):
+        if date not in self._writers:
+            directory = os.path.join(self.root, f"{PARTITION_FIELD}={date}")
+            os.makedirs(directory, exist_ok=True)
+            filename = f"part-{self.run_id}{COLUMNAR_EXTENSIONS[self.format]}"
+            tmp_path = os.path.join(directory, f".{filename}.tmp")
+            if self.format == "parquet":
+                writer = pq.ParquetWriter(tmp_path, arrow_schema(), compression="zstd")
+            else:
+                writer = pa.ipc.new_file(tmp_path, arrow_schema())
+            self._writers[date] = (writer, tmp_path, os.path.join(directory, filename))
+        return self._writers[date][0]
+
+    def write(self, rows: List[Dict[str, any]]) -> None:
+        for date, table in _partition_tables(rows):
+            self._writer(date).write_table(table)
+        self.rows += len(rows)
+
+    def finish(self) -> List[str]:
+        """Menutup semua file partisi dan memindahkannya ke nama akhirnya."""
+        paths = []
+        for writer, tmp_path, path in self._writers.values():
+            writer.close()
+            os.replace(tmp_path, path)
+            paths.append(path)
+        self._writers = {}
+        return paths
 
+    def close(self) -> None:
+        paths = self.finish()
+        print(f"[INFO] {self.rows} baris berhasil di-stream ke {len(paths)} file {self.format}: {self.root}")
 
-def load_to_google_sheets(cleaned_data: List[Dict[str, any]]) -> None:
+
+def load_to_parquet(cleaned_data: List[Dict[str, any]], root: str = PARQUET_DIR, format: str = PARQUET_FORMAT) -> bool:
+    """
+    Menambahkan data bersih ke dataset Parquet/Arrow yang dipartisi per tanggal
+    scraping tanpa menulis ulang partisi lama. Mengembalikan False jika gagal.
+    """
+    if not cleaned_data:
+        print("[WARN] Tidak ada data untuk disimpan ke Parquet.")
+        return True
+    if not root:
+        print("[WARN] PARQUET_DIR belum diatur, output Parquet dilewati.")
+        return True
+
+    try:
+        writer = ParquetStreamWriter(root, format)
+        writer.write(cleaned_data)
+        paths = writer.finish()
+        print(f"[INFO] Data berhasil disimpan ke {len(paths)} file {format}: {root}")
+        return True
+    except Exception as error:
+        print(f"[ERROR] Gagal menyimpan data ke Parquet: {error}")
+        return False
+
+
+def read_columnar(
+    root: str = PARQUET_DIR,
+    columns: Optional[List[str]] = None,
+    dates: Optional[List[str]] = None,
+    format: str = PARQUET_FORMAT,
+) -> "pa.Table":
+    """
+    Membaca dataset kolumnar sebagai tabel Arrow. Hanya kolom di `columns` dan
+    partisi di `dates` yang dibaca; file dibuka dengan memory map.
+    """
+    dataset = ds.dataset(
+        root,
+        format="ipc" if format == "arrow" else format,
+        partitioning=ds.partitioning(pa.schema([(PARTITION_FIELD, pa.string())]), flavor="hive"),
+        filesystem=pafs.LocalFileSystem(use_mmap=True),
+    )
+    partition_filter = ds.field(PARTITION_FIELD).isin(dates) if dates else None
+    return dataset.to_table(columns=columns, filter=partition_filter)
+
+
+def get_sheets_service():
+    """Mengembalikan client Google Sheets yang dibuat sekali lalu dipakai ulang."""
+    global _sheets_service
+    with _sheets_lock:
+        if _sheets_service is None:
+            creds = service_account.Credentials.from_service_account_file(
+                GSHEET_SERVICE_ACCOUNT_FILE,
+                scopes=["https://www.googleapis.com/auth/spreadsheets"],
+            )
+            _sheets_service = build("sheets", "v4", credentials=creds)
+        return _sheets_service
+
+
+def reset_sheets_service() -> None:
+    """Membuang client Google Sheets yang tersimpan."""
+    global _sheets_service
+    with _sheets_lock:
+        _sheets_service = None
+
+
+def load_to_google_sheets(cleaned_data: List[Dict[str, any]], snapshot_path: str = GSHEET_SNAPSHOT_PATH) -> bool:
     """
-    Menyimpan data bersih ke Google Sheets.
+    Menyimpan data bersih ke Google Sheets. Mengembalikan False jika gagal.
+
+    Jika `snapshot_path` diatur, hanya baris yang berubah yang dikirim lewat
+    `sync_to_google_sheets`.
     """
     if not cleaned_data:
         print("[WARN] Tidak ada data untuk disimpan ke Google Sheets.")
-        return
+        return True
 
     try:
-        df = pd.DataFrame(cleaned_data)
+        if snapshot_path:
+            updated = sync_to_google_sheets(cleaned_data, snapshot_path)
+            print(f"[INFO] Data berhasil disinkronkan ke Google Sheets: {updated} baris diperbarui.")
+            return True
+
+        df = _frame(cleaned_data)
         values = [df.columns.tolist()] + df.values.tolist()
 
-        creds = service_account.Credentials.from_service_account_file(
-            GSHEET_SERVICE_ACCOUNT_FILE,
-            scopes=["https://www.googleapis.com/auth/spreadsheets"],
-        )
-        service = build("sheets", "v4", credentials=creds)
+        service = get_sheets_service()
 
         body = {"values": values}
         result = (
@@ -59,24 +286,390 @@ def load_to_google_sheets(cleaned_data: List[Dict[str, any]]) -> None:
         )
 
         print(f"[INFO] Data berhasil disimpan ke Google Sheets: {result.get('updatedCells')} sel diperbarui.")
+        return True
 
     except Exception as error:
         print(f"[ERROR] Gagal menyimpan data ke Google Sheets: {error}")
+        return False
+
+
+def _column_letters(index: int) -> str:
+    """Mengubah nomor kolom (mulai 1) menjadi huruf kolom A1, misalnya 28 -> AB."""
+    letters = ""
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord("A") + remainder) + letters
+    return letters
+
+
+def _column_index(letters: str) -> int:
+    index = 0
+    for letter in letters.upper():
+        index = index * 26 + ord(letter) - ord("A") + 1
+    return index
+
+
+def _parse_range_start(range_a1: str):
+    """Memecah range A1 seperti 'Sheet1!B2:H' menjadi (prefix sheet, kolom awal, baris awal)."""
+    sheet, separator, cells = range_a1.rpartition("!")
+    match = re.fullmatch(r"([A-Za-z]*)(\d*)", cells.split(":")[0])
+    if not match:
+        raise ValueError(f"Range Google Sheets tidak valid: {range_a1}")
+    prefix = f"{sheet}!" if separator else ""
+    return prefix, _column_index(match.group(1) or "A"), int(match.group(2) or 1)
+
+
+def _changed_blocks(old_rows: List[str], new_rows: List[str]) -> List[tuple]:
+    """Rentang indeks baris berurutan (inklusif) yang berbeda antara snapshot lama dan data baru."""
+    blocks = []
+    start = None
+    for index in range(max(len(old_rows), len(new_rows))):
+        old = old_rows[index] if index < len(old_rows) else None
+        new = new_rows[index] if index < len(new_rows) else None
+        if old != new:
+            start = index if start is None else start
+        elif start is not None:
+            blocks.append((start, index - 1))
+            start = None
+    if start is not None:
+        blocks.append((start, max(len(old_rows), len(new_rows)) - 1))
+    return blocks
+
+
+def _read_snapshot(path: str) -> dict:
+    try:
+        with open(path, encoding="utf-8") as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {}
+
+
+def _write_snapshot(path: str, snapshot: dict) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as file:
+        json.dump(snapshot, file, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def sync_to_google_sheets(
+    cleaned_data: List[Dict[str, any]],
+    snapshot_path: str = GSHEET_SNAPSHOT_PATH,
+    chunk_rows: int = GSHEET_CHUNK_ROWS,
+    write_rate: float = GSHEET_WRITE_RATE,
+    service=None,
+) -> int:
+    """
+    Menyinkronkan data ke Google Sheets secara diff.
+
+    Snapshot lokal menyimpan isi terakhir yang berhasil dikirim. Hanya rentang
+    baris yang berubah (termasuk baris lama yang kini harus dikosongkan) yang
+    dikirim lewat `values().batchUpdate`, dipecah per `chunk_rows` baris dan
+    dibatasi `write_rate` request per detik. Mengembalikan jumlah baris yang dikirim.
+    """
+    if chunk_rows < 1:
+        raise ValueError("Parameter 'chunk_rows' harus bernilai minimal 1.")
+
+    df = _frame(cleaned_data)
+    values = [df.columns.tolist()] + df.values.tolist()
+    new_rows = [json.dumps(row, ensure_ascii=False) for row in values]
+
+    snapshot = _read_snapshot(snapshot_path)
+    if snapshot.get("spreadsheet_id") != GSHEET_SPREADSHEET_ID or snapshot.get("range") != GSHEET_RANGE:
+        snapshot = {}
+    old_rows = snapshot.get("rows", [])
+    blocks = _changed_blocks(old_rows, new_rows)
+
+    prefix, first_column, first_row = _parse_range_start(GSHEET_RANGE)
+    width = max([len(row) for row in values] + [len(json.loads(row)) for row in old_rows[len(values):]])
+    last_column = _column_letters(first_column + width - 1)
+
+    data = []
+    for start, end in blocks:
+        for chunk_start in range(start, end + 1, chunk_rows):
+            chunk_end = min(chunk_start + chunk_rows - 1, end)
+            rows = [
+                values[index] + [""] * (width - len(values[index])) if index < len(values) else [""] * width
+                for index in range(chunk_start, chunk_end + 1)
+            ]
+            data.append({
+                "range": f"{prefix}{_column_letters(first_column)}{first_row + chunk_start}:"
+                         f"{last_column}{first_row + chunk_end}",
+                "values": rows,
+            })
+
+    requests = []
+    request_rows = 0
+    for entry in data:
+        if requests and request_rows + len(entry["values"]) <= chunk_rows:
+            requests[-1].append(entry)
+            request_rows += len(entry["values"])
+        else:
+            requests.append([entry])
+            request_rows = len(entry["values"])
+
+    service = service or get_sheets_service()
+    limiter = TokenBucket(write_rate)
+    sent_rows = 0
+    for batch in requests:
+        limiter.acquire()
+        service.spreadsheets().values().batchUpdate(
+            spreadsheetId=GSHEET_SPREADSHEET_ID,
+            body={"valueInputOption": "RAW", "data": batch},
+        ).execute()
+        sent_rows += sum(len(entry["values"]) for entry in batch)
+
+    _write_snapshot(snapshot_path, {
+        "spreadsheet_id": GSHEET_SPREADSHEET_ID,
+        "range": GSHEET_RANGE,
+        "rows": new_rows,
+    })
+    return sent_rows
+
+
+def get_engine(url: str = POSTGRESQL_URL):
+    """Mengembalikan engine SQLAlchemy (dengan connection pool) yang dipakai ulang per URL."""
+    with _engines_lock:
+        engine = _engines.get(url)
+        if engine is None:
+            engine = create_engine(url, pool_pre_ping=True)
+            _engines[url] = engine
+        return engine
+
+
+def dispose_engines() -> None:
+    """Menutup seluruh engine yang tersimpan beserta koneksinya."""
+    with _engines_lock:
+        for engine in _engines.values():
+            engine.dispose()
+        _engines.clear()
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _ensure_table(conn, table: str) -> None:
+    """Membuat tabel dan unique index pada key deduplikasi jika belum ada."""
+    conn.execute(text(
+        f"CREATE TABLE IF NOT EXISTS {_quote(table)} ("
+        '"Title" TEXT, "Price" DOUBLE PRECISION, "Rating" DOUBLE PRECISION, "Colors" BIGINT, '
+        '"Size" TEXT, "Gender" TEXT, "Timestamp" TEXT)'
+    ))
+    key_columns = ", ".join(_quote(column) for column in UNIQUE_KEY)
+    conn.execute(text(
+        f"CREATE UNIQUE INDEX IF NOT EXISTS {_quote(table + '_unique_key')} "
+        f"ON {_quote(table)} ({key_columns})"
+    ))
+
+
+def _conflict_clause(table: str, update_timestamp: bool) -> str:
+    key_columns = ", ".join(_quote(column) for column in UNIQUE_KEY)
+    if update_timestamp:
+        return (
+            f'ON CONFLICT ({key_columns}) DO UPDATE SET "Timestamp" = EXCLUDED."Timestamp" '
+            f'WHERE {_quote(table)}."Timestamp" IS NULL OR {_quote(table)}."Timestamp" <> EXCLUDED."Timestamp"'
+        )
+    return f"ON CONFLICT ({key_columns}) DO NOTHING"
+
+
+def _upsert_postgresql(engine, df: "pd.DataFrame", table: str, batch_size: int, update_timestamp: bool) -> int:
+    """COPY ke tabel staging sementara lalu INSERT ... ON CONFLICT ke tabel tujuan."""
+    staging = f"{table}_staging"
+    columns = ", ".join(_quote(column) for column in COLUMNS)
+
+    with engine.begin() as conn:
+        _ensure_table(conn, table)
+
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        cursor.execute(
+            f"CREATE TEMP TABLE {_quote(staging)} (LIKE {_quote(table)} INCLUDING DEFAULTS) ON COMMIT DROP"
+        )
+        for start in range(0, len(df), batch_size):
+            buffer = io.StringIO()
+            df.iloc[start:start + batch_size].to_csv(buffer, index=False, header=False)
+            buffer.seek(0)
+            cursor.copy_expert(f"COPY {_quote(staging)} ({columns}) FROM STDIN WITH (FORMAT csv)", buffer)
+
+        cursor.execute(
+            f"INSERT INTO {_quote(table)} ({columns}) SELECT {columns} FROM {_quote(staging)} "
+            + _conflict_clause(table, update_timestamp)
+        )
+        written = cursor.rowcount
+        raw.commit()
+        return written
+    except Exception:
+        raw.rollback()
+        raise
+    finally:
+        raw.close()
+
+
+def _upsert_generic(engine, df: "pd.DataFrame", table: str, batch_size: int, update_timestamp: bool) -> int:
+    """INSERT ... ON CONFLICT per batch untuk database lain yang mendukungnya (misalnya SQLite)."""
+    columns = ", ".join(_quote(column) for column in COLUMNS)
+    params = ", ".join(f":p{index}" for index in range(len(COLUMNS)))
+    statement = text(
+        f"INSERT INTO {_quote(table)} ({columns}) VALUES ({params}) "
+        + _conflict_clause(table, update_timestamp)
+    )
+
+    written = 0
+    with engine.begin() as conn:
+        _ensure_table(conn, table)
+        for start in range(0, len(df), batch_size):
+            rows = [
+                {f"p{index}": value for index, value in enumerate(row)}
+                for row in df.iloc[start:start + batch_size][COLUMNS].itertuples(index=False, name=None)
+            ]
+            result = conn.execute(statement, rows)
+            written += max(result.rowcount, 0)
+    return written
+
+
+def upsert_to_sql(
+    cleaned_data: List[Dict[str, any]],
+    url: str = POSTGRESQL_URL,
+    table: str = POSTGRESQL_TABLE,
+    batch_size: int = POSTGRESQL_BATCH_SIZE,
+    update_timestamp: bool = False,
+) -> int:
+    """
+    Menambahkan data bersih secara inkremental dengan key unik yang sama seperti
+    `transform_data`. Baris yang sudah ada dilewati (atau hanya Timestamp-nya
+    diperbarui jika `update_timestamp`), sehingga biaya tulis mengikuti jumlah
+    baris yang berubah. Mengembalikan jumlah baris yang ditulis.
+    """
+    if batch_size < 1:
+        raise ValueError("Parameter 'batch_size' harus bernilai minimal 1.")
 
+    engine = get_engine(url)
+    df = pd.DataFrame(cleaned_data, columns=COLUMNS)
+    if engine.dialect.name == "postgresql":
+        return _upsert_postgresql(engine, df, table, batch_size, update_timestamp)
+    return _upsert_generic(engine, df, table, batch_size, update_timestamp)
 
-def load_to_postgresql(cleaned_data: List[Dict[str, any]]) -> None:
+
+def load_to_postgresql(
+    cleaned_data: List[Dict[str, any]],
+    url: str = POSTGRESQL_URL,
+    mode: str = "upsert",
+    batch_size: int = POSTGRESQL_BATCH_SIZE,
+) -> bool:
     """
-    Menyimpan data bersih ke PostgreSQL.
+    Menyimpan data bersih ke PostgreSQL. Mengembalikan False jika gagal.
+
+    `mode="upsert"` (default) menambahkan baris baru secara inkremental lewat
+    `upsert_to_sql`; `mode="replace"` membuat ulang tabel seperti sebelumnya.
     """
     if not cleaned_data:
         print("[WARN] Tidak ada data untuk disimpan ke PostgreSQL.")
-        return
+        return True
 
     try:
-        engine = create_engine(POSTGRESQL_URL)
-        df = pd.DataFrame(cleaned_data)
-        df.to_sql("fashion_data", con=engine, if_exists="replace", index=False)
-        print("[INFO] Data berhasil disimpan ke PostgreSQL.")
+        if mode == "replace":
+            df = _frame(cleaned_data)
+            df.to_sql(POSTGRESQL_TABLE, con=get_engine(url), if_exists="replace", index=False, chunksize=batch_size)
+            print("[INFO] Data berhasil disimpan ke PostgreSQL.")
+        else:
+            written = upsert_to_sql(cleaned_data, url=url, batch_size=batch_size)
+            print(f"[INFO] Data berhasil disimpan ke PostgreSQL: {written} baris baru/berubah dari {len(cleaned_data)}.")
+        return True
     except Exception as error:
         print(f"[ERROR] Gagal menyimpan data ke PostgreSQL: {error}")
-        
\ No newline at end of file
+        return False
+
+
+class CsvStreamWriter:
+    """
+    Menulis data bersih ke CSV secara bertahap, satu batch setiap kali.
+    Batch pertama menimpa file beserta header, batch berikutnya di-append.
+    """
+
+    def __init__(self, filename: str = CSV_FILENAME):
+        self.filename = filename
+        self.rows = 0
+
+    def write(self, rows: List[Dict[str, any]]) -> None:
+        df = _frame(rows)
+        first = self.rows == 0
+        df.to_csv(self.filename, mode="w" if first else "a", header=first, index=False, encoding="utf-8")
+        self.rows += len(rows)
+
+    def close(self) -> None:
+        print(f"[INFO] {self.rows} baris berhasil di-stream ke file CSV: {self.filename}")
+
+
+class GoogleSheetsStreamWriter:
+    """
+    Menulis data bersih ke Google Sheets secara bertahap. Batch pertama
+    ditulis bersama header, batch berikutnya ditambahkan dengan `values().append`.
+    """
+
+    def __init__(self):
+        self.service = get_sheets_service()
+        self.rows = 0
+
+    def write(self, rows: List[Dict[str, any]]) -> None:
+        df = _frame(rows)
+        values = df.values.tolist()
+        sheet_values = self.service.spreadsheets().values()
+
+        if self.rows == 0:
+            request = sheet_values.update(
+                spreadsheetId=GSHEET_SPREADSHEET_ID,
+                range=GSHEET_RANGE,
+                valueInputOption="RAW",
+                body={"values": [df.columns.tolist()] + values},
+            )
+        else:
+            request = sheet_values.append(
+                spreadsheetId=GSHEET_SPREADSHEET_ID,
+                range=GSHEET_RANGE,
+                valueInputOption="RAW",
+                insertDataOption="INSERT_ROWS",
+                body={"values": values},
+            )
+        request.execute()
+        self.rows += len(rows)
+
+    def close(self) -> None:
+        print(f"[INFO] {self.rows} baris berhasil di-stream ke Google Sheets.")
+
+
+class PostgreSQLStreamWriter:
+    """
+    Menulis data bersih ke PostgreSQL secara bertahap. Dengan `mode="upsert"`
+    setiap batch di-upsert; dengan `mode="replace"` batch pertama menggantikan
+    tabel dan batch berikutnya di-append.
+    """
+
+    def __init__(self, url: str = POSTGRESQL_URL, mode: str = "upsert"):
+        self.url = url
+        self.mode = mode
+        self.engine = get_engine(url)
+        self.rows = 0
+
+    def write(self, rows: List[Dict[str, any]]) -> None:
+        if self.mode == "upsert":
+            upsert_to_sql(rows, url=self.url)
+        else:
+            df = _frame(rows)
+            if_exists = "replace" if self.rows == 0 else "append"
+            df.to_sql(POSTGRESQL_TABLE, con=self.engine, if_exists=if_exists, index=False)
+        self.rows += len(rows)
+
+    def close(self) -> None:
+        print(f"[INFO] {self.rows} baris berhasil di-stream ke PostgreSQL.")
+
+
+def _parquet_stream_writer() -> Optional[ParquetStreamWriter]:
+    """Writer stream Parquet, atau None jika PARQUET_DIR tidak diatur (sink dilewati)."""
+    return ParquetStreamWriter() if PARQUET_DIR else None
+
+
+register_sink("csv", load_to_csv, stream_writer=CsvStreamWriter)
+register_sink("parquet", load_to_parquet, incremental=True, stream_writer=_parquet_stream_writer)
+register_sink("google_sheets", load_to_google_sheets, stream_writer=GoogleSheetsStreamWriter)
+register_sink("postgresql", load_to_postgresql, incremental=True, stream_writer=PostgreSQLStreamWriter)
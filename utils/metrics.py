@@ -0,0 +1,163 @@
+import os
+import json
+import time
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+METRICS_REPORT_PATH = os.getenv("METRICS_REPORT_PATH")
+METRICS_PROMETHEUS_PATH = os.getenv("METRICS_PROMETHEUS_PATH")
+METRICS_PREFIX = "etl_"
+
+MetricKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+@dataclass
+class Summary:
+    """Ringkasan observasi: jumlah, total, minimum, dan maksimum."""
+    count: int = 0
+    sum: float = 0.0
+    min: float = float("inf")
+    max: float = 0.0
+
+    def observe(self, value: float) -> None:
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+            "mean": self.sum / self.count if self.count else 0.0,
+        }
+
+
+def _key(name: str, labels: Dict[str, any]) -> MetricKey:
+    return name, tuple(sorted((label, str(value)) for label, value in labels.items()))
+
+
+def _format_key(key: MetricKey, suffix: str = "") -> str:
+    name, labels = key
+    if not labels:
+        return f"{name}{suffix}"
+    rendered = ",".join(f'{label}="{_escape(value)}"' for label, value in labels)
+    return f"{name}{suffix}{{{rendered}}}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class RunMetrics:
+    """
+    Pengumpul metrik satu run ETL: counter, ringkasan durasi/ukuran, dan detail
+    per halaman (latensi fetch, byte, waktu parsing, jumlah kartu).
+
+    Aman dipakai dari banyak thread.
+    """
+
+    def __init__(self):
+        self.started_at = datetime.now()
+        self._started = time.perf_counter()
+        self._lock = threading.Lock()
+        self.counters: Dict[MetricKey, float] = {}
+        self.summaries: Dict[MetricKey, Summary] = {}
+        self.pages: Dict[int, Dict[str, float]] = {}
+
+    def increment(self, name: str, amount: float = 1, **labels) -> None:
+        key = _key(name, labels)
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        key = _key(name, labels)
+        with self._lock:
+            summary = self.summaries.get(key)
+            if summary is None:
+                summary = self.summaries[key] = Summary()
+            summary.observe(value)
+
+    def record_page(self, page: int, **values: float) -> None:
+        """Menambahkan nilai ke detail satu halaman di laporan JSON."""
+        with self._lock:
+            self.pages.setdefault(page, {}).update(values)
+
+    def report(self) -> Dict[str, any]:
+        """Laporan run dalam bentuk dictionary yang siap di-serialisasi ke JSON."""
+        with self._lock:
+            return {
+                "started_at": self.started_at.isoformat(),
+                "elapsed_seconds": time.perf_counter() - self._started,
+                "counters": {_format_key(key): value for key, value in sorted(self.counters.items())},
+                "summaries": {_format_key(key): summary.to_dict() for key, summary in sorted(self.summaries.items())},
+                "pages": {str(page): values for page, values in sorted(self.pages.items())},
+            }
+
+    def to_prometheus(self) -> str:
+        """Metrik dalam format teks Prometheus (counter dan summary tanpa kuantil)."""
+        lines = []
+        with self._lock:
+            counters = sorted(self.counters.items())
+            summaries = sorted(self.summaries.items())
+
+        declared = set()
+        for key, value in counters:
+            name = METRICS_PREFIX + key[0]
+            if name not in declared:
+                lines.append(f"# TYPE {name} counter")
+                declared.add(name)
+            lines.append(f"{_format_key((name, key[1]))} {value}")
+        for key, summary in summaries:
+            name = METRICS_PREFIX + key[0]
+            if name not in declared:
+                lines.append(f"# TYPE {name} summary")
+                declared.add(name)
+            lines.append(f"{_format_key((name, key[1]), '_count')} {summary.count}")
+            lines.append(f"{_format_key((name, key[1]), '_sum')} {summary.sum}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, report_path: Optional[str] = None, prometheus_path: Optional[str] = None) -> None:
+        """Menulis laporan JSON dan/atau file Prometheus secara atomik."""
+        if report_path:
+            _write_atomic(report_path, json.dumps(self.report(), indent=2, ensure_ascii=False))
+            print(f"[INFO] Laporan metrik disimpan ke: {report_path}")
+        if prometheus_path:
+            _write_atomic(prometheus_path, self.to_prometheus())
+            print(f"[INFO] Metrik Prometheus disimpan ke: {prometheus_path}")
+
+
+def _write_atomic(path: str, content: str) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as file:
+        file.write(content)
+    os.replace(tmp_path, path)
+
+
+_active: Optional[RunMetrics] = None
+
+
+def enable_metrics() -> RunMetrics:
+    """Mengaktifkan pengumpulan metrik untuk run baru."""
+    global _active
+    _active = RunMetrics()
+    return _active
+
+
+def disable_metrics() -> Optional[RunMetrics]:
+    """Menonaktifkan pengumpulan metrik dan mengembalikan metrik yang terkumpul."""
+    global _active
+    metrics, _active = _active, None
+    return metrics
+
+
+def active_metrics() -> Optional[RunMetrics]:
+    """
+    Pengumpul metrik yang aktif, atau None jika metrik dimatikan. Titik
+    instrumentasi cukup memeriksa None sehingga biayanya nol saat tidak aktif.
+    """
+    return _active
@@ -0,0 +1,143 @@
+import os
+import re
+import json
+import time
+from typing import Callable, Optional
+from bs4 import BeautifulSoup, SoupStrainer
+from utils.extract import CARD_STRAINER, HEADERS, get_page_url
+from utils.http_client import fetch
+
+PAGE_COUNT_CACHE_PATH = os.getenv("PAGE_COUNT_CACHE_PATH")
+PAGE_COUNT_TTL = float(os.getenv("PAGE_COUNT_TTL", str(24 * 3600)))
+MAX_PROBE_PAGE = int(os.getenv("MAX_PROBE_PAGE", "100000"))
+
+PAGINATION_STRAINER = SoupStrainer(class_="pagination")
+PAGE_OF_PATTERN = re.compile(r"Page\s+\d+\s+of\s+(\d+)", re.IGNORECASE)
+PAGE_LINK_PATTERN = re.compile(r"/page(\d+)/?$")
+
+
+def parse_last_page(html: str) -> Optional[int]:
+    """
+    Membaca nomor halaman terakhir dari navigasi pagination: teks "Page X of N"
+    jika ada, atau nomor terbesar dari link `/page{n}`. None jika tidak ditemukan.
+    """
+    soup = BeautifulSoup(html, "html.parser", parse_only=PAGINATION_STRAINER)
+    match = PAGE_OF_PATTERN.search(soup.get_text(" "))
+    if match:
+        return int(match.group(1))
+
+    pages = [
+        int(link_match.group(1))
+        for link in soup.find_all("a", href=True)
+        for link_match in [PAGE_LINK_PATTERN.search(link["href"])]
+        if link_match
+    ]
+    return max(pages) if pages else None
+
+
+def page_has_products(page: int) -> bool:
+    """
+    True jika halaman berisi minimal satu kartu produk; False jika halaman tidak
+    ada (404) atau berhasil diambil tetapi kosong. Kegagalan koneksi, timeout,
+    dan respons error lain (termasuk 5xx) dilempar sebagai exception agar situs
+    yang tidak dapat dijangkau tidak dianggap katalog kosong.
+    """
+    response = fetch(get_page_url(page), headers=HEADERS, timeout=10)
+    if response.status_code == 404:
+        return False
+    response.raise_for_status()
+    soup = BeautifulSoup(response.text, "html.parser", parse_only=CARD_STRAINER)
+    return soup.select_one(".collection-card") is not None
+
+
+def probe_last_page(
+    exists: Callable[[int], bool] = page_has_products,
+    hint: int = 1,
+    limit: int = MAX_PROBE_PAGE,
+) -> int:
+    """
+    Mencari halaman terakhir yang berisi produk dengan exponential search lalu
+    binary search, mulai dari `hint` (misalnya hasil run sebelumnya). Mengembalikan
+    0 jika halaman 1 pun kosong. Jumlah request sekitar 2 * log2(jumlah halaman).
+    Exception dari `exists` diteruskan ke pemanggil.
+    """
+    hint = min(max(hint, 1), limit)
+    if exists(hint):
+        low, high = hint, hint + 1
+        while high <= limit and exists(high):
+            low, high = high, min(high * 2, limit + 1)
+    else:
+        low, high = hint // 2, hint
+        while low >= 1 and not exists(low):
+            low, high = low // 2, low
+
+    # Invariant: halaman `low` berisi produk (atau 0), halaman `high` tidak.
+    while low + 1 < high:
+        mid = (low + high) // 2
+        if exists(mid):
+            low = mid
+        else:
+            high = mid
+    return low
+
+
+def _read_page_count(path: str, base_url: str, ttl: float) -> Optional[dict]:
+    try:
+        with open(path, encoding="utf-8") as file:
+            entry = json.load(file).get(base_url)
+    except (OSError, ValueError):
+        return None
+    if entry is None or entry.get("last_page", 0) < 1:
+        return None
+    entry["fresh"] = time.time() - entry["discovered_at"] <= ttl
+    return entry
+
+
+def _write_page_count(path: str, base_url: str, last_page: int) -> None:
+    try:
+        with open(path, encoding="utf-8") as file:
+            counts = json.load(file)
+    except (OSError, ValueError):
+        counts = {}
+    counts[base_url] = {"last_page": last_page, "discovered_at": time.time()}
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as file:
+        json.dump(counts, file)
+    os.replace(tmp_path, path)
+
+
+def discover_last_page(cache_path: Optional[str] = PAGE_COUNT_CACHE_PATH, ttl: float = PAGE_COUNT_TTL) -> int:
+    """
+    Menentukan jumlah halaman katalog.
+
+    Urutannya: nilai cache yang belum kedaluwarsa, navigasi pagination di
+    halaman 1, lalu probing exponential/binary search dengan nilai cache lama
+    sebagai titik awal. Hasilnya disimpan ke `cache_path` untuk run berikutnya,
+    kecuali 0. Jika probing gagal (situs tidak dapat dijangkau atau error 5xx),
+    exception diteruskan dan tidak ada yang disimpan.
+    """
+    base_url = get_page_url(1)
+    cached = _read_page_count(cache_path, base_url, ttl) if cache_path else None
+    if cached and cached["fresh"]:
+        print(f"[INFO] Jumlah halaman dari cache: {cached['last_page']}")
+        return cached["last_page"]
+
+    last_page = None
+    try:
+        response = fetch(base_url, headers=HEADERS, timeout=10)
+        if response.status_code == 200:
+            last_page = parse_last_page(response.text)
+    except Exception as error:
+        print(f"[WARN] Gagal membaca pagination halaman 1: {error}")
+
+    if last_page is None:
+        hint = cached["last_page"] if cached else 1
+        last_page = probe_last_page(hint=hint)
+        print(f"[INFO] Jumlah halaman hasil probing: {last_page}")
+    else:
+        print(f"[INFO] Jumlah halaman dari pagination: {last_page}")
+
+    if cache_path and last_page >= 1:
+        _write_page_count(cache_path, base_url, last_page)
+    return last_page
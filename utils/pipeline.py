@@ -0,0 +1,306 @@
+import os
+import time
+import queue
+import multiprocessing
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple
+from utils.extract import fetch_page_html, get_page_url, iter_pages, parse_page
+from utils.http_client import HTTP_POOL_SIZE, get_session
+from utils.metrics import active_metrics
+from utils.rate_limit import HostRateLimiter
+from utils.sinks import SinkResult
+from utils.transform import transform_stream
+
+STREAM_BATCH_SIZE = int(os.getenv("STREAM_BATCH_SIZE", "500"))
+STREAM_FLUSH_SECONDS = float(os.getenv("STREAM_FLUSH_SECONDS", "5"))
+PARSE_PROCESSES = int(os.getenv("PARSE_PROCESSES", "0"))
+
+
+@dataclass
+class StageStats:
+    """Statistik satu stage pipeline: jumlah item, waktu kerja, dan waktu menunggu antrean."""
+    name: str
+    workers: int
+    items: int = 0
+    bytes: int = 0
+    busy: float = 0.0
+    waiting: float = 0.0
+    elapsed: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Item per detik selama pipeline berjalan."""
+        return self.items / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def capacity(self) -> float:
+        """Perkiraan item per detik jika stage tidak pernah menunggu stage lain."""
+        return self.items * self.workers / self.busy if self.busy else 0.0
+
+
+def _timed_parse(html: str, backend: Optional[str]) -> Tuple[List[Dict[str, str]], float]:
+    started = time.perf_counter()
+    products = parse_page(html, backend)
+    return products, time.perf_counter() - started
+
+
+class StagedExtractor:
+    """
+    Ekstraksi dua stage: fetch HTML di thread pool (I/O bound) dan parsing di
+    `ProcessPoolExecutor` (CPU bound, bebas dari GIL).
+
+    HTML mentah dioper lewat antrean terbatas; jika parsing lebih lambat,
+    antrean penuh dan thread fetch tertahan (backpressure).
+    """
+
+    def __init__(
+        self,
+        fetch_workers: int = 4,
+        parse_workers: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        rate_limit: Optional[float] = 0.5,
+        burst: int = 1,
+        parser: Optional[str] = None,
+    ):
+        self.fetch_workers = fetch_workers
+        self.parse_workers = parse_workers or os.cpu_count() or 1
+        self.queue_size = queue_size or 2 * self.parse_workers
+        self.limiter = HostRateLimiter(rate_limit, capacity=burst)
+        self.parser = parser
+        self.stats = {
+            "fetch": StageStats("fetch", self.fetch_workers),
+            "parse": StageStats("parse", self.parse_workers),
+        }
+        self._lock = threading.Lock()
+
+    def _fetch_worker(self, pages: queue.Queue, html_queue: queue.Queue, stop: threading.Event) -> None:
+        stats = self.stats["fetch"]
+        while not stop.is_set():
+            try:
+                page = pages.get_nowait()
+            except queue.Empty:
+                return
+
+            started = time.perf_counter()
+            try:
+                self.limiter.acquire(get_page_url(page))
+                started = time.perf_counter()
+                html = fetch_page_html(page)
+            except Exception as e:
+                print(f"[ERROR] Gagal mengambil halaman {page}: {e}")
+                html = None
+            busy = time.perf_counter() - started
+
+            started = time.perf_counter()
+            while not stop.is_set():
+                try:
+                    html_queue.put((page, html), timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+
+            with self._lock:
+                stats.items += 1
+                stats.bytes += len(html or "")
+                stats.busy += busy
+                stats.waiting += time.perf_counter() - started
+
+    @staticmethod
+    def _next_html(html_queue: queue.Queue, fetch_futures: list) -> tuple:
+        """
+        Mengambil HTML berikutnya dari antrean. Jika semua thread fetch sudah
+        berhenti sementara antrean kosong, exception thread yang mati diteruskan
+        (atau RuntimeError) alih-alih menunggu selamanya.
+        """
+        while True:
+            try:
+                return html_queue.get(timeout=0.1)
+            except queue.Empty:
+                pass
+            if all(future.done() for future in fetch_futures):
+                for future in fetch_futures:
+                    future.result()
+                try:
+                    return html_queue.get_nowait()
+                except queue.Empty:
+                    raise RuntimeError("Semua thread fetch berhenti sebelum semua halaman diambil") from None
+
+    def iter_pages(self, start_page: int = 1, end_page: int = 50) -> Iterator[List[Dict[str, str]]]:
+        """
+        Menghasilkan daftar produk per halaman sesuai urutan halaman. Jika
+        thread fetch mati karena error tak terduga, exception-nya dilempar ke pemanggil.
+        """
+        pages = queue.Queue()
+        for page in range(start_page, end_page + 1):
+            pages.put(page)
+        total = pages.qsize()
+        get_session(pool_size=max(self.fetch_workers, HTTP_POOL_SIZE))
+
+        html_queue = queue.Queue(maxsize=self.queue_size)
+        stop = threading.Event()
+        parse_stats = self.stats["parse"]
+        metrics = active_metrics()
+        started = time.perf_counter()
+
+        fetchers = ThreadPoolExecutor(max_workers=self.fetch_workers)
+        # Proses parser di-spawn, bukan di-fork: saat proses pertama dibuat thread
+        # fetch sudah berjalan dan mungkin memegang lock (sesi, antrean, stats).
+        parsers = ProcessPoolExecutor(max_workers=self.parse_workers, mp_context=multiprocessing.get_context("spawn"))
+        try:
+            fetch_futures = [
+                fetchers.submit(self._fetch_worker, pages, html_queue, stop)
+                for _ in range(self.fetch_workers)
+            ]
+
+            in_flight = {}
+            done = {}
+            received = 0
+            next_page = start_page
+            while next_page <= end_page:
+                if next_page in done:
+                    yield done.pop(next_page)
+                    next_page += 1
+                    continue
+
+                if received < total and len(in_flight) < 2 * self.parse_workers:
+                    wait_started = time.perf_counter()
+                    page, html = self._next_html(html_queue, fetch_futures)
+                    parse_stats.waiting += time.perf_counter() - wait_started
+                    received += 1
+                    if html is None:
+                        done[page] = []
+                    else:
+                        in_flight[parsers.submit(_timed_parse, html, self.parser)] = page
+                    continue
+
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    page = in_flight.pop(future)
+                    try:
+                        products, busy = future.result()
+                        parse_stats.busy += busy
+                        if metrics is not None:
+                            metrics.observe("parse_page_seconds", busy)
+                            metrics.increment("parsed_cards", len(products))
+                            metrics.record_page(page, parse_seconds=busy, cards=len(products))
+                    except Exception as e:
+                        print(f"[ERROR] Gagal mem-parsing halaman {page}: {e}")
+                        products = []
+                    parse_stats.items += 1
+                    done[page] = products
+        finally:
+            stop.set()
+            fetchers.shutdown(wait=True, cancel_futures=True)
+            parsers.shutdown(wait=True, cancel_futures=True)
+            elapsed = time.perf_counter() - started
+            self.stats["fetch"].elapsed = elapsed
+            parse_stats.elapsed = elapsed
+            print(f"[INFO] {self.report()}")
+
+    def bottleneck(self) -> str:
+        """
+        'network' jika stage parse lebih banyak menunggu HTML daripada stage
+        fetch menunggu antrean kosong, selain itu 'cpu'.
+        """
+        fetch, parse = self.stats["fetch"], self.stats["parse"]
+        return "network" if parse.waiting >= fetch.waiting / max(fetch.workers, 1) else "cpu"
+
+    def report(self) -> str:
+        """Ringkasan throughput per stage dalam satu baris."""
+        parts = [
+            f"{stats.name}: {stats.throughput:.2f} halaman/detik "
+            f"(kapasitas {stats.capacity:.2f}, menunggu {stats.waiting:.2f} detik)"
+            for stats in self.stats.values()
+        ]
+        return "; ".join(parts) + f"; bottleneck: {self.bottleneck()}"
+
+
+def rebatch(
+    batches: Iterable[List[Dict[str, any]]],
+    batch_size: int = STREAM_BATCH_SIZE,
+    flush_seconds: Optional[float] = STREAM_FLUSH_SECONDS,
+) -> Iterator[List[Dict[str, any]]]:
+    """
+    Mengelompokkan ulang aliran batch menjadi batch berukuran maksimal `batch_size`.
+
+    Jika `flush_seconds` diatur, baris yang tertahan juga dikirim ketika batch
+    berikutnya tiba dan flush terakhir sudah lebih dari `flush_seconds` detik
+    yang lalu, sehingga scraping yang lambat tetap menulis baris pertama dalam
+    hitungan detik. None atau 0 berarti flush hanya saat batch penuh.
+    """
+    if batch_size < 1:
+        raise ValueError("Parameter 'batch_size' harus bernilai minimal 1.")
+
+    buffer = []
+    last_flush = time.monotonic()
+    for batch in batches:
+        buffer.extend(batch)
+        while len(buffer) >= batch_size:
+            yield buffer[:batch_size]
+            buffer = buffer[batch_size:]
+            last_flush = time.monotonic()
+        if buffer and flush_seconds and time.monotonic() - last_flush >= flush_seconds:
+            yield buffer
+            buffer = []
+            last_flush = time.monotonic()
+    if buffer:
+        yield buffer
+
+
+def run_stream(
+    writers: Dict[str, object],
+    batch_size: int = STREAM_BATCH_SIZE,
+    pages: Optional[Iterable[List[Dict[str, str]]]] = None,
+    seen=None,
+    flush_seconds: Optional[float] = STREAM_FLUSH_SECONDS,
+    results: Optional[Dict[str, SinkResult]] = None,
+    **extract_kwargs,
+) -> int:
+    """
+    Menjalankan ETL secara streaming: halaman di-scrape satu per satu,
+    ditransformasi secara inkremental, lalu di-flush ke setiap writer per batch.
+    `pages` dapat diisi aliran halaman lain (misalnya `StagedExtractor.iter_pages`);
+    jika kosong, `iter_pages(**extract_kwargs)` dipakai. `seen` adalah backend
+    deduplikasi (default `set`).
+
+    Writer yang gagal dinonaktifkan tanpa menghentikan writer lain. Jika
+    `results` diberikan, dict tersebut diisi `SinkResult` per writer untuk
+    `exit_status`. Mengembalikan jumlah baris bersih yang diproses.
+    """
+    active = dict(writers)
+    durations = dict.fromkeys(writers, 0.0)
+    errors = {}
+    total = 0
+
+    if pages is None:
+        pages = iter_pages(**extract_kwargs)
+
+    metrics = active_metrics()
+    for batch in rebatch(transform_stream(pages, seen), batch_size, flush_seconds):
+        total += len(batch)
+        for name, writer in list(active.items()):
+            started = time.perf_counter()
+            try:
+                writer.write(batch)
+                if metrics is not None:
+                    metrics.observe("load_seconds", time.perf_counter() - started, sink=name)
+            except Exception as error:
+                print(f"[ERROR] Proses load stream ke {name} gagal: {error}")
+                errors[name] = str(error)
+                del active[name]
+            durations[name] += time.perf_counter() - started
+
+    for name, writer in active.items():
+        try:
+            writer.close()
+        except Exception as error:
+            print(f"[ERROR] Gagal menutup writer {name}: {error}")
+            errors[name] = str(error)
+
+    if results is not None:
+        results.update({name: SinkResult(name, name not in errors, durations[name], errors.get(name)) for name in writers})
+
+    print(f"[INFO] Total baris yang di-stream: {total}")
+    return total
@@ -0,0 +1,61 @@
+import time
+import threading
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """
+    Rate limiter token bucket yang aman dipakai bersama oleh banyak thread.
+
+    Setiap pemanggilan `acquire()` memesan satu token. Jika token habis,
+    pemanggil menunggu sampai slot berikutnya tersedia.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        if rate <= 0:
+            raise ValueError("Parameter 'rate' harus lebih besar dari 0.")
+        if capacity < 1:
+            raise ValueError("Parameter 'capacity' harus bernilai minimal 1.")
+
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Mengambil satu token dan mengembalikan lama waktu tunggu (detik)."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class HostRateLimiter:
+    """Kumpulan token bucket terpisah untuk setiap host."""
+
+    def __init__(self, rate: Optional[float], capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = capacity
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, url: str) -> float:
+        """Menunggu giliran untuk host dari URL; tanpa batas jika rate None."""
+        if self.rate is None:
+            return 0.0
+
+        host = urlparse(url).netloc
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self.rate, self.capacity)
+                self._buckets[host] = bucket
+        return bucket.acquire()
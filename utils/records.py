@@ -0,0 +1,54 @@
+from typing import List, Dict, Iterable, NamedTuple, Optional, Union
+
+
+class RawProduct(NamedTuple):
+    """Produk hasil scraping sebelum dibersihkan; semua nilai masih berupa string."""
+    Title: str
+    Price: str
+    Rating: str
+    Colors: str
+    Size: str
+    Gender: str
+    Timestamp: str
+
+
+class Product(NamedTuple):
+    """Produk yang sudah dibersihkan dengan nilai bertipe."""
+    Title: str
+    Price: float
+    Rating: float
+    Colors: int
+    Size: str
+    Gender: str
+    Timestamp: str
+
+
+class TypedProduct(NamedTuple):
+    """
+    Produk hasil `parse_page_batch(typed=True)`: nilai sudah dibersihkan seperti
+    pada transform. `Rejected` berisi kategori `INVALID_VALUES` atau alasan lain
+    (`unparsable_price`, `unparsable_rating`, `error`) jika transform akan membuangnya.
+    """
+    Title: str
+    Price: Optional[float]
+    Rating: Optional[float]
+    Colors: int
+    Size: str
+    Gender: str
+    Timestamp: str
+    Rejected: Optional[str] = None
+
+
+FIELDS = RawProduct._fields
+
+Record = Union[RawProduct, Product]
+
+
+def raw_from_dict(item: Dict[str, str]) -> RawProduct:
+    """Mengubah dictionary produk mentah menjadi `RawProduct`; field yang hilang menjadi ""."""
+    return RawProduct(*(item.get(field, "") for field in FIELDS))
+
+
+def to_dicts(records: Iterable[Record]) -> List[Dict[str, any]]:
+    """Adapter ke API lama berbasis list of dict."""
+    return [record._asdict() for record in records]
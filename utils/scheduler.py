@@ -0,0 +1,210 @@
+import os
+import time
+import fcntl
+import signal
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Callable, Iterator, Optional, Set
+from crontab import CronSlices
+
+SCHEDULE_INTERVAL = float(os.getenv("SCHEDULE_INTERVAL", "0"))
+SCHEDULE_CRON = os.getenv("SCHEDULE_CRON")
+SCHEDULE_LOCK_PATH = os.getenv("SCHEDULE_LOCK_PATH")
+
+# Batas pencarian jadwal cron berikutnya (misalnya "0 0 30 2 *" tidak pernah cocok).
+CRON_SEARCH_YEARS = 5
+
+
+class IntervalSchedule:
+    """Menjalankan job segera saat daemon mulai, lalu setiap `seconds` detik."""
+
+    def __init__(self, seconds: float):
+        if seconds <= 0:
+            raise ValueError(f"Interval jadwal harus lebih dari 0 detik, bukan {seconds}")
+        self.seconds = seconds
+
+    def first_run(self, now: float) -> float:
+        return now
+
+    def next_after(self, moment: float) -> float:
+        return moment + self.seconds
+
+    def __repr__(self) -> str:
+        return f"setiap {self.seconds:g} detik"
+
+
+def _slice_values(cron_slice) -> Set[int]:
+    values = set()
+    for part in cron_slice.parts:
+        values.update(part.range() if hasattr(part, "range") else [int(part)])
+    return values
+
+
+class CronSchedule:
+    """
+    Jadwal dengan ekspresi cron lima field (atau alias seperti `@hourly`) dalam
+    waktu lokal. Ekspresi di-parse dengan python-crontab. Seperti cron, jika
+    day-of-month dan day-of-week sama-sama dibatasi, salah satunya cukup cocok.
+    """
+
+    def __init__(self, expression: str):
+        if not CronSlices.is_valid(expression):
+            raise ValueError(f"Ekspresi cron tidak valid: {expression}")
+        self.expression = expression
+        minutes, hours, days, months, weekdays = CronSlices(expression)
+        self.minutes = _slice_values(minutes)
+        self.hours = _slice_values(hours)
+        self.days = _slice_values(days)
+        self.months = _slice_values(months)
+        self.weekdays = {0 if value == 7 else value for value in _slice_values(weekdays)}
+        self._any_day = str(days) == "*"
+        self._any_weekday = str(weekdays) == "*"
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day = moment.day in self.days
+        weekday = (moment.weekday() + 1) % 7 in self.weekdays
+        if self._any_day:
+            return weekday
+        if self._any_weekday:
+            return day
+        return day or weekday
+
+    def first_run(self, now: float) -> float:
+        return self.next_after(now)
+
+    def next_after(self, moment: float) -> float:
+        """Waktu (epoch) menit pertama setelah `moment` yang cocok dengan ekspresi."""
+        candidate = datetime.fromtimestamp(moment).replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + timedelta(days=366 * CRON_SEARCH_YEARS)
+        while candidate < limit:
+            if candidate.month not in self.months:
+                candidate = (candidate.replace(day=1) + timedelta(days=32)).replace(day=1, hour=0, minute=0)
+            elif not self._day_matches(candidate):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+            elif candidate.hour not in self.hours:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+            elif candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+            else:
+                return candidate.timestamp()
+        raise ValueError(f"Ekspresi cron tidak pernah cocok: {self.expression}")
+
+    def __repr__(self) -> str:
+        return f"cron '{self.expression}'"
+
+
+def parse_schedule(interval: float = SCHEDULE_INTERVAL, cron: Optional[str] = SCHEDULE_CRON):
+    """Membuat jadwal dari interval (detik) atau ekspresi cron; cron diutamakan."""
+    if cron:
+        return CronSchedule(cron)
+    if interval:
+        return IntervalSchedule(interval)
+    raise ValueError("Jadwal belum diatur (SCHEDULE_INTERVAL atau SCHEDULE_CRON).")
+
+
+class Scheduler:
+    """
+    Menjalankan `job` berulang sesuai jadwal di satu proses yang berumur panjang,
+    sehingga sesi HTTP, engine database, client Sheets, dan cache tetap hangat.
+
+    Run tidak pernah tumpang tindih: jadwal yang terlewat saat run masih berjalan
+    dilewati, dan jika `lock_path` diatur, file lock mencegah run bersamaan dari
+    proses lain yang memakai lock yang sama.
+    """
+
+    def __init__(
+        self,
+        job: Callable[[], int],
+        schedule,
+        lock_path: Optional[str] = SCHEDULE_LOCK_PATH,
+        max_runs: Optional[int] = None,
+    ):
+        self.job = job
+        self.schedule = schedule
+        self.lock_path = lock_path
+        self.max_runs = max_runs
+        self.runs = 0
+        self.skipped = 0
+        self._stop = threading.Event()
+        self._running = threading.Lock()
+
+    def stop(self, *_) -> None:
+        """
+        Menghentikan daemon setelah run yang sedang berjalan selesai; sinyal kedua
+        menghentikan run tersebut dengan KeyboardInterrupt.
+        """
+        if self._stop.is_set():
+            raise KeyboardInterrupt
+        print("[INFO] Daemon akan berhenti setelah run yang sedang berjalan selesai.")
+        self._stop.set()
+
+    def install_signal_handlers(self) -> None:
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, self.stop)
+
+    @contextmanager
+    def _exclusive(self) -> Iterator[bool]:
+        if not self._running.acquire(blocking=False):
+            yield False
+            return
+        try:
+            if not self.lock_path:
+                yield True
+                return
+            with open(self.lock_path, "a") as lock_file:
+                try:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    yield False
+                    return
+                try:
+                    yield True
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+        finally:
+            self._running.release()
+
+    def run_once(self) -> Optional[int]:
+        """Menjalankan job sekali jika tidak ada run lain; None jika dilewati."""
+        with self._exclusive() as acquired:
+            if not acquired:
+                self.skipped += 1
+                print("[WARN] Run sebelumnya masih berjalan; jadwal ini dilewati.")
+                return None
+
+            started = time.perf_counter()
+            try:
+                status = self.job()
+            except Exception as error:
+                print(f"[ERROR] Run terjadwal gagal: {error}")
+                status = 1
+            self.runs += 1
+            print(f"[INFO] Run terjadwal ke-{self.runs} selesai (status {status}) dalam {time.perf_counter() - started:.1f} detik")
+            return status
+
+    def run(self) -> int:
+        """Loop daemon; mengembalikan status run terakhir saat berhenti."""
+        print(f"[INFO] Daemon ETL berjalan {self.schedule!r}")
+        status = 0
+        due = self.schedule.first_run(time.time())
+        while not self._stop.is_set():
+            delay = due - time.time()
+            if delay > 0:
+                print(f"[INFO] Run berikutnya: {datetime.fromtimestamp(due).isoformat(timespec='seconds')}")
+                if self._stop.wait(delay):
+                    break
+
+            result = self.run_once()
+            status = status if result is None else result
+            if self.max_runs and self.runs >= self.max_runs:
+                break
+
+            due = self.schedule.next_after(due)
+            now = time.time()
+            if due <= now:
+                self.skipped += 1
+                print("[WARN] Run melewati jadwal berikutnya; jadwal yang terlewat tidak dijalankan.")
+                due = self.schedule.next_after(now)
+        print(f"[INFO] Daemon ETL berhenti setelah {self.runs} run")
+        return status
@@ -0,0 +1,207 @@
+import os
+import time
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+from utils.metrics import active_metrics
+
+SINK_TIMEOUT = float(os.getenv("SINK_TIMEOUT", "300"))
+
+
+@dataclass
+class Sink:
+    """
+    Tujuan load: fungsi loader dan batas waktunya (detik). Sink `incremental`
+    (append/upsert) cukup menerima delta CDC; sink lain selalu menerima data penuh.
+    `stream_writer` adalah factory writer untuk mode stream (objek dengan
+    `write(rows)` dan `close()`), atau None jika sink hanya mendukung mode batch.
+    Factory boleh mengembalikan None jika tujuan belum dikonfigurasi.
+    """
+    name: str
+    loader: Callable[[Tuple[Mapping[str, any], ...]], Optional[bool]]
+    timeout: float = SINK_TIMEOUT
+    incremental: bool = False
+    stream_writer: Optional[Callable[[], object]] = None
+
+
+@dataclass
+class SinkResult:
+    """Hasil menjalankan satu sink."""
+    name: str
+    ok: bool
+    duration: float
+    error: Optional[str] = None
+
+
+SINKS: Dict[str, Sink] = {}
+
+# Thread sink yang melewati batas waktu dan masih berjalan, per nama sink.
+_overdue: Dict[str, threading.Thread] = {}
+
+
+def register_sink(
+    name: str,
+    loader: Optional[Callable] = None,
+    timeout: float = SINK_TIMEOUT,
+    incremental: bool = False,
+    stream_writer: Optional[Callable[[], object]] = None,
+):
+    """
+    Mendaftarkan sink baru. Dapat dipakai langsung, `register_sink("csv", load_to_csv)`,
+    atau sebagai decorator, `@register_sink("s3")`. Loader menerima snapshot data
+    dan dianggap gagal jika mengembalikan False atau melempar exception.
+    `stream_writer` membuat sink ikut dijalankan pada `ETL_STREAM=1`.
+    """
+    def decorator(func: Callable) -> Callable:
+        SINKS[name] = Sink(name, func, timeout, incremental, stream_writer)
+        return func
+
+    if loader is not None:
+        return decorator(loader)
+    return decorator
+
+
+def freeze(cleaned_data: Iterable[Dict[str, any]]) -> Tuple[Mapping[str, any], ...]:
+    """
+    Membuat snapshot read-only dari data bersih untuk dibagikan ke semua sink.
+    Record `Product` sudah immutable sehingga dipakai apa adanya tanpa disalin.
+    """
+    return tuple(row if isinstance(row, tuple) else MappingProxyType(dict(row)) for row in cleaned_data)
+
+
+def _run_one(sink: Sink, snapshot) -> SinkResult:
+    started = time.perf_counter()
+    try:
+        ok = sink.loader(snapshot) is not False
+        return SinkResult(sink.name, ok, time.perf_counter() - started, None if ok else "loader melaporkan gagal")
+    except Exception as error:
+        return SinkResult(sink.name, False, time.perf_counter() - started, str(error))
+
+
+def _run_into(outcome: list, sink: Sink, data) -> None:
+    outcome.append(_run_one(sink, data))
+
+
+def _input_for(sink: Sink, snapshot, delta_snapshot, deltas: Dict[str, Iterable]):
+    if not sink.incremental:
+        return snapshot
+    if sink.name in deltas:
+        return freeze(deltas[sink.name])
+    return delta_snapshot
+
+
+def open_stream_writers(names: Optional[List[str]] = None) -> Tuple[Dict[str, object], Dict[str, SinkResult]]:
+    """
+    Membuat writer stream untuk sink di `names` (default semua sink terdaftar
+    yang mendukung mode stream dan sudah dikonfigurasi). Sink yang dipilih
+    secara eksplisit tetapi tidak dikenal, tidak mendukung mode stream, belum
+    dikonfigurasi, atau gagal disiapkan dikembalikan sebagai `SinkResult` gagal.
+    """
+    explicit = names is not None
+    names = list(SINKS) if names is None else names
+    writers, results = {}, {}
+    for name in names:
+        sink = SINKS.get(name)
+        if sink is None or sink.stream_writer is None:
+            if explicit:
+                error = "sink tidak terdaftar" if sink is None else "sink tidak mendukung mode stream"
+                print(f"[ERROR] Sink {name} gagal: {error}")
+                results[name] = SinkResult(name, False, 0.0, error)
+            continue
+        try:
+            writer = sink.stream_writer()
+        except Exception as error:
+            print(f"[ERROR] Gagal menyiapkan writer {name}: {error}")
+            results[name] = SinkResult(name, False, 0.0, str(error))
+            continue
+        if writer is not None:
+            writers[name] = writer
+        elif explicit:
+            print(f"[ERROR] Writer {name} belum dikonfigurasi")
+            results[name] = SinkResult(name, False, 0.0, "writer belum dikonfigurasi")
+    return writers, results
+
+
+def incremental_sinks(names: Optional[List[str]] = None) -> List[str]:
+    """Nama sink `incremental` di antara `names` (default semua sink terdaftar)."""
+    names = list(SINKS) if names is None else names
+    return [name for name in names if name in SINKS and SINKS[name].incremental]
+
+
+def run_sinks(
+    cleaned_data: Iterable[Dict[str, any]],
+    names: Optional[List[str]] = None,
+    delta: Optional[Iterable[Dict[str, any]]] = None,
+    deltas: Optional[Dict[str, Iterable[Dict[str, any]]]] = None,
+) -> Dict[str, SinkResult]:
+    """
+    Menjalankan sink secara paralel di atas satu snapshot data yang sama. Jika
+    `delta` diberikan, sink `incremental` hanya menerima delta tersebut;
+    `deltas` memberi delta tersendiri per nama sink (misalnya dari state CDC
+    masing-masing sink) dan didahulukan daripada `delta`.
+
+    Setiap sink memiliki batas waktu sendiri. Batas waktu tidak membatalkan
+    loader (Python tidak dapat menghentikan thread): sink dilaporkan gagal dan
+    thread-nya dibiarkan selesai di latar belakang sebagai daemon thread,
+    sehingga tidak menahan proses saat keluar. Selama thread itu masih
+    berjalan, sink yang sama tidak dijalankan lagi (misalnya pada run
+    terjadwal berikutnya) dan langsung dilaporkan gagal, agar dua load tidak
+    menulis ke tujuan yang sama bersamaan. Sink yang tidak dikenal dilaporkan
+    gagal tanpa dijalankan.
+    """
+    names = list(SINKS) if names is None else names
+    results = {
+        name: SinkResult(name, False, 0.0, "sink tidak terdaftar")
+        for name in names if name not in SINKS
+    }
+    sinks = [SINKS[name] for name in names if name in SINKS]
+    if not sinks:
+        return results
+
+    snapshot = freeze(cleaned_data)
+    delta_snapshot = snapshot if delta is None else freeze(delta)
+    deltas = deltas or {}
+    started = time.perf_counter()
+    running = {}
+    for sink in sinks:
+        overdue = _overdue.get(sink.name)
+        if overdue is not None and overdue.is_alive():
+            results[sink.name] = SinkResult(sink.name, False, 0.0, "load sebelumnya yang melewati batas waktu masih berjalan")
+            continue
+        outcome = []
+        thread = threading.Thread(
+            target=_run_into,
+            args=(outcome, sink, _input_for(sink, snapshot, delta_snapshot, deltas)),
+            name=f"sink-{sink.name}",
+            daemon=True,
+        )
+        thread.start()
+        running[sink.name] = (sink, thread, outcome)
+
+    for name, (sink, thread, outcome) in running.items():
+        thread.join(max(sink.timeout - (time.perf_counter() - started), 0))
+        if outcome:
+            _overdue.pop(name, None)
+            results[name] = outcome[0]
+        else:
+            _overdue[name] = thread
+            results[name] = SinkResult(name, False, time.perf_counter() - started, f"timeout setelah {sink.timeout} detik")
+
+    metrics = active_metrics()
+    for result in results.values():
+        if metrics is not None:
+            metrics.observe("load_seconds", result.duration, sink=result.name, ok=str(result.ok).lower())
+        if result.ok:
+            print(f"[INFO] Sink {result.name} selesai dalam {result.duration:.2f} detik")
+        else:
+            print(f"[ERROR] Sink {result.name} gagal: {result.error}")
+    return results
+
+
+def exit_status(results: Dict[str, SinkResult]) -> int:
+    """0 jika semua sink berhasil, 1 jika semuanya gagal, 2 jika gagal sebagian."""
+    failed = sum(1 for result in results.values() if not result.ok)
+    if failed == 0:
+        return 0
+    return 1 if failed == len(results) else 2
@@ -1,5 +1,7 @@
 import re
-from typing import List, Dict
+from typing import List, Dict, Iterable, Iterator, Optional, Set
+from utils.metrics import active_metrics
+from utils.records import Product, RawProduct, TypedProduct
 
 EXCHANGE_RATE = 16000
 
@@ -33,51 +35,159 @@ def clean_colors(colors_str: str) -> int:
         print(f"[ERROR] Gagal membersihkan warna '{colors_str}': {e}")
         return 0
 
-def transform_data(raw_data: List[Dict[str, str]]) -> List[Dict[str, any]]:
+_new_tuple = tuple.__new__
+_DROP_REASONS = {"unparsable_price", "unparsable_rating", "error"}
+
+def _cached(memo: Optional[dict], cleaner, value: str):
+    if memo is None:
+        return cleaner(value)
+    key = (cleaner, value)
+    if key not in memo:
+        memo[key] = cleaner(value)
+    return memo[key]
+
+def type_record(raw: RawProduct, memo: Optional[dict] = None) -> TypedProduct:
     """
-    Membersihkan dan memproses data hasil scraping.
+    Membersihkan satu `RawProduct` menjadi `TypedProduct` dengan aturan yang sama
+    seperti `transform_data`, tanpa deduplikasi. `memo` menyimpan hasil pembersih
+    per nilai string sehingga nilai yang berulang hanya di-parse sekali.
     """
+    try:
+        title, price_str, rating_str, colors_str, size, gender = (value.strip() for value in raw[:6])
+        timestamp = raw[6]
+        for value in (title, price_str, rating_str, colors_str, size, gender):
+            if value in INVALID_VALUES:
+                return TypedProduct(title, None, None, 0, size, gender, timestamp, value)
+
+        price_value = _cached(memo, clean_price, price_str)
+        rating_value = _cached(memo, clean_rating, rating_str)
+        colors_value = _cached(memo, clean_colors, colors_str)
+        rejected = None
+        if price_value is None:
+            rejected = "unparsable_price"
+        elif rating_value is None:
+            rejected = "unparsable_rating"
+        return TypedProduct(title, price_value, rating_value, colors_value, size, gender, timestamp, rejected)
+    except Exception as conv_error:
+        print(f"[ERROR] Gagal membersihkan data: {conv_error}")
+        return TypedProduct("", None, None, 0, "", "", "", "error")
+
+def _count_drop(metrics, rejected: str) -> None:
+    if rejected in _DROP_REASONS:
+        metrics.increment("transform_dropped_rows", reason=rejected)
+    else:
+        metrics.increment("transform_dropped_rows", reason="invalid_value", category=rejected)
+
+def _clean(raw_data: Iterable, seen: Set[tuple], as_records: bool) -> list:
+    """Inti pembersihan untuk `transform_data` (dict) dan `transform_records` (`Product`)."""
     cleaned_data = []
-    seen = set()
+    metrics = active_metrics()
+    rows_in = 0
 
     for item in raw_data:
+        rows_in += 1
         try:
-            title = item.get("Title", "").strip()
-            price_str = item.get("Price", "").strip()
-            rating_str = item.get("Rating", "").strip()
-            colors_str = item.get("Colors", "").strip()
-            size = item.get("Size", "").strip()
-            gender = item.get("Gender", "").strip()
-
-            if any(value in INVALID_VALUES for value in [title, price_str, rating_str, colors_str, size, gender]):
-                continue
+            if type(item) is TypedProduct:
+                title, price_value, rating_value, colors_value, size, gender, timestamp, rejected = item
+                if rejected is not None:
+                    if metrics is not None:
+                        _count_drop(metrics, rejected)
+                    continue
+            else:
+                if isinstance(item, tuple):
+                    title, price_str, rating_str, colors_str, size, gender, timestamp = item
+                else:
+                    title = item.get("Title", "")
+                    price_str = item.get("Price", "")
+                    rating_str = item.get("Rating", "")
+                    colors_str = item.get("Colors", "")
+                    size = item.get("Size", "")
+                    gender = item.get("Gender", "")
+                    timestamp = item.get("Timestamp", "")
+                title = title.strip()
+                price_str = price_str.strip()
+                rating_str = rating_str.strip()
+                colors_str = colors_str.strip()
+                size = size.strip()
+                gender = gender.strip()
 
-            price_value = clean_price(price_str)
-            rating_value = clean_rating(rating_str)
-            colors_value = clean_colors(colors_str)
+                values = [title, price_str, rating_str, colors_str, size, gender]
+                if any(value in INVALID_VALUES for value in values):
+                    if metrics is not None:
+                        category = next(value for value in values if value in INVALID_VALUES)
+                        metrics.increment("transform_dropped_rows", reason="invalid_value", category=category)
+                    continue
 
-            if price_value is None or rating_value is None:
-                continue
+                price_value = clean_price(price_str)
+                rating_value = clean_rating(rating_str)
+                colors_value = clean_colors(colors_str)
+
+                if price_value is None or rating_value is None:
+                    if metrics is not None:
+                        reason = "unparsable_price" if price_value is None else "unparsable_rating"
+                        metrics.increment("transform_dropped_rows", reason=reason)
+                    continue
 
             unique_key = (title, price_value, rating_value, colors_value, size, gender)
             if unique_key in seen:
+                if metrics is not None:
+                    metrics.increment("transform_dropped_rows", reason="duplicate")
                 continue
             seen.add(unique_key)
 
-            cleaned_item = {
-                "Title": title,
-                "Price": price_value,
-                "Rating": rating_value,
-                "Colors": colors_value,
-                "Size": size,
-                "Gender": gender,
-                "Timestamp": item.get("Timestamp", "")
-            }
-            cleaned_data.append(cleaned_item)
+            if as_records:
+                cleaned_data.append(_new_tuple(Product, (*unique_key, timestamp)))
+            else:
+                cleaned_data.append({
+                    "Title": title,
+                    "Price": price_value,
+                    "Rating": rating_value,
+                    "Colors": colors_value,
+                    "Size": size,
+                    "Gender": gender,
+                    "Timestamp": timestamp
+                })
 
         except Exception as conv_error:
             print(f"[ERROR] Gagal membersihkan data: {conv_error}")
+            if metrics is not None:
+                metrics.increment("transform_dropped_rows", reason="error")
             continue
 
+    if metrics is not None:
+        metrics.increment("transform_rows_in", rows_in)
+        metrics.increment("transform_rows_out", len(cleaned_data))
     print(f"[INFO] Total data setelah transformasi: {len(cleaned_data)}")
     return cleaned_data
+
+def transform_data(raw_data: List[Dict[str, str]], seen: Optional[Set[tuple]] = None) -> List[Dict[str, any]]:
+    """
+    Membersihkan dan memproses data hasil scraping.
+
+    `seen` dapat diberikan agar deduplikasi berlanjut lintas pemanggilan; selain
+    `set`, dapat berupa backend dari `utils.dedup.make_dedup`.
+    """
+    return _clean(raw_data, set() if seen is None else seen, as_records=False)
+
+def transform_records(raw_data: Iterable, seen: Optional[Set[tuple]] = None) -> List[Product]:
+    """
+    Seperti `transform_data`, tetapi menerima dict, `RawProduct`, maupun
+    `TypedProduct` (tanpa parsing ulang) dan mengembalikan `Product`, representasi ringkas tanpa dict per baris.
+    """
+    return _clean(raw_data, set() if seen is None else seen, as_records=True)
+
+def transform_stream(batches: Iterable[List[Dict[str, str]]], seen: Optional[Set[tuple]] = None) -> Iterator[List[Dict[str, any]]]:
+    """
+    Membersihkan data hasil scraping per batch (misalnya per halaman).
+
+    Deduplikasi berlaku lintas batch sehingga hasil gabungannya sama dengan
+    `transform_data` pada seluruh data sekaligus.
+    """
+    seen = set() if seen is None else seen
+    total = 0
+    for batch in batches:
+        cleaned_batch = transform_data(batch, seen=seen)
+        total += len(cleaned_batch)
+        if cleaned_batch:
+            yield cleaned_batch
+    print(f"[INFO] Total data setelah transformasi (stream): {total}")
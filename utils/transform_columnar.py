@@ -0,0 +1,128 @@
+import numpy as np
+import pandas as pd
+from typing import List, Dict, Mapping, Sequence, Tuple
+from utils.metrics import active_metrics
+from utils.transform import INVALID_VALUES, clean_price, clean_rating, clean_colors
+
+FIELDS = ["Title", "Price", "Rating", "Colors", "Size", "Gender"]
+KEY_FIELDS = ["Title", "Price", "Rating", "Colors", "Size", "Gender"]
+OUTPUT_FIELDS = FIELDS + ["Timestamp"]
+
+
+def _as_objects(values: Sequence) -> np.ndarray:
+    return pd.Series(values, dtype=object).to_numpy()
+
+
+def _factorize(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Mengubah kolom menjadi kode integer dan daftar nilai unik. Nilai NA mendapat
+    kode -1. Kolom berisi nilai yang tidak bisa di-hash diperlakukan apa adanya.
+    """
+    try:
+        return pd.factorize(values, use_na_sentinel=True)
+    except TypeError:
+        return np.arange(len(values)), values
+
+
+def _lookup(table_values: list, na_value, codes: np.ndarray, dtype=object) -> np.ndarray:
+    """Memetakan hasil per nilai unik kembali ke setiap baris; kode -1 memakai `na_value`."""
+    table = np.empty(len(table_values) + 1, dtype=dtype)
+    for position, value in enumerate(table_values):
+        table[position] = value
+    table[-1] = na_value
+    return table[codes]
+
+
+def _clean_field(values: Sequence, cleaner=None, default=None):
+    """
+    Membersihkan satu kolom dengan menjalankan `.strip()`, filter `INVALID_VALUES`,
+    dan `cleaner` hanya sekali untuk setiap nilai unik.
+
+    Mengembalikan (nilai strip, mask valid, hasil cleaner per baris).
+    """
+    codes, uniques = _factorize(_as_objects(values))
+    stripped = [value.strip() if isinstance(value, str) else None for value in uniques]
+    valid = [value is not None and value not in INVALID_VALUES for value in stripped]
+
+    stripped_rows = _lookup(stripped, None, codes)
+    valid_rows = _lookup(valid, False, codes, dtype=bool)
+    if cleaner is None:
+        return stripped_rows, valid_rows, None
+
+    cleaned = [cleaner(value) if is_valid else default for value, is_valid in zip(stripped, valid)]
+    return stripped_rows, valid_rows, _lookup(cleaned, default, codes)
+
+
+def transform_columns(columns: Mapping[str, Sequence]) -> pd.DataFrame:
+    """
+    Membersihkan data hasil scraping dalam bentuk kolom (satu list per field).
+
+    Aturan yang dipakai sama dengan `transform_data`: nilai di `INVALID_VALUES`
+    dibuang, harga dikonversi dengan `EXCHANGE_RATE`, baris tanpa harga atau
+    rating valid dibuang, dan duplikat berdasarkan key unik yang sama dihapus
+    dengan mempertahankan kemunculan pertama. Fungsi pembersih skalar hanya
+    dijalankan sekali per nilai unik, sisanya berupa operasi array.
+    """
+    title, keep, _ = _clean_field(columns["Title"])
+    _, price_valid, price = _clean_field(columns["Price"], clean_price)
+    _, rating_valid, rating = _clean_field(columns["Rating"], clean_rating)
+    _, colors_valid, colors = _clean_field(columns["Colors"], clean_colors, default=0)
+    size, size_valid, _ = _clean_field(columns["Size"])
+    gender, gender_valid, _ = _clean_field(columns["Gender"])
+
+    keep = keep & price_valid & rating_valid & colors_valid & size_valid & gender_valid
+    keep &= (price != None) & (rating != None)  # noqa: E711
+    index = np.flatnonzero(keep)
+
+    result = pd.DataFrame({
+        "Title": title[index],
+        "Price": price[index].astype(np.float64),
+        "Rating": rating[index].astype(np.float64),
+        "Colors": colors[index],
+        "Size": size[index],
+        "Gender": gender[index],
+        "Timestamp": _as_objects(columns["Timestamp"])[index],
+    })
+
+    has_nan = result["Price"].isna() | result["Rating"].isna()
+    duplicated = result.duplicated(subset=KEY_FIELDS, keep="first") & ~has_nan
+    return result[~duplicated].reset_index(drop=True)
+
+
+def transform_dataframe(df: pd.DataFrame) -> pd.DataFrame:
+    """Membersihkan DataFrame mentah; kolom yang tidak ada dianggap string kosong."""
+    columns = {
+        field: df[field].tolist() if field in df else [""] * len(df)
+        for field in OUTPUT_FIELDS
+    }
+    return transform_columns(columns)
+
+
+def transform_data_vectorized(raw_data: List[Dict[str, str]]) -> List[Dict[str, any]]:
+    """
+    Pengganti `transform_data` berbasis operasi kolumnar pandas/NumPy dengan
+    hasil yang sama persis (nilai, tipe, urutan, dan deduplikasi).
+    """
+    columns = {field: [item.get(field, "") for item in raw_data] for field in OUTPUT_FIELDS}
+    result = transform_columns(columns)
+
+    cleaned_data = [
+        {
+            "Title": title,
+            "Price": price,
+            "Rating": rating,
+            "Colors": colors,
+            "Size": size,
+            "Gender": gender,
+            "Timestamp": timestamp,
+        }
+        for title, price, rating, colors, size, gender, timestamp in zip(
+            *(result[field].tolist() for field in OUTPUT_FIELDS)
+        )
+    ]
+    metrics = active_metrics()
+    if metrics is not None:
+        metrics.increment("transform_rows_in", len(raw_data))
+        metrics.increment("transform_rows_out", len(cleaned_data))
+    print(f"[INFO] Total data setelah transformasi: {len(cleaned_data)}")
+    return cleaned_data